@@ -106,6 +106,19 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Write a trace of the integration setups to CONFIG/startup_trace.json",
+    )
+    parser.add_argument(
+        "--warm-imports",
+        action="store_true",
+        help=(
+            "Compile the bytecode of the integrations in parallel before they are"
+            " imported, and import them in parallel on free-threaded Python"
+        ),
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -204,6 +217,8 @@ def main() -> int:
         recovery_mode=args.recovery_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
+        warm_imports=args.warm_imports,
         safe_mode=safe_mode,
     )
 
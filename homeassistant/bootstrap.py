@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Iterable
 import contextlib
 from functools import partial
 from itertools import chain
@@ -88,6 +89,15 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.json import json_bytes
+from .helpers.startup_trace import (
+    STARTUP_TRACE_FILE,
+    StartupTrace,
+    async_finish_startup_trace,
+    async_get_startup_trace,
+    async_start_startup_trace,
+    async_trace_stage,
+)
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
@@ -103,9 +113,12 @@ from .setup import (
     async_setup_component,
 )
 from .util.async_ import create_eager_task
+from .util.executor import InterruptibleThreadPoolExecutor
+from .util.file import write_utf8_file
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_docker_env, is_virtual_env
+from .util.pycache import is_gil_enabled, requirement_paths, warm_pycache
 from .util.system_info import is_official_image
 
 with contextlib.suppress(ImportError):
@@ -126,6 +139,12 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
 
+# hass.data key set when the imports are warmed before the setup.
+DATA_WARM_IMPORTS: HassKey[None] = HassKey("bootstrap_warm_imports")
+
+# Number of import threads when warming imports without the GIL
+FREE_THREADED_IMPORT_WORKERS = 4
+
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
@@ -282,6 +301,9 @@ async def async_setup_hass(
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
+        if runtime_config.warm_imports:
+            _enable_warm_imports(hass)
+
         return hass
 
     async def stop_hass(hass: core.HomeAssistant) -> None:
@@ -375,12 +397,66 @@ async def async_setup_hass(
     elif hass.config.safe_mode:
         _LOGGER.info("Starting in safe mode")
 
+    if (
+        runtime_config.startup_trace
+        and (trace := async_get_startup_trace(hass)) is not None
+    ):
+        await hass.async_add_executor_job(
+            _write_startup_trace, hass.config.path(STARTUP_TRACE_FILE), trace
+        )
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
     return hass
 
 
+def _write_startup_trace(path: str, trace: StartupTrace) -> None:
+    """Write the startup trace in the Chrome trace event format."""
+    _LOGGER.info("Writing startup trace to %s", path)
+    write_utf8_file(
+        path,
+        json_bytes({**trace.as_chrome_trace(), "otherData": trace.as_dict()}),
+        mode="wb",
+    )
+
+
+def _enable_warm_imports(hass: core.HomeAssistant) -> None:
+    """Warm the imports of the integrations before they are set up."""
+    hass.data[DATA_WARM_IMPORTS] = None
+    if is_gil_enabled():
+        return
+    # Without the GIL the imports of independent integrations run in
+    # parallel, an import which deadlocks falls back to the event loop.
+    hass.import_executor.shutdown(wait=False)
+    hass.import_executor = InterruptibleThreadPoolExecutor(
+        max_workers=FREE_THREADED_IMPORT_WORKERS, thread_name_prefix="ImportExecutor"
+    )
+
+
+def _warm_pycache(paths: set[str], requirements: set[str]) -> int:
+    """Compile the bytecode of the integrations and their requirements."""
+    return warm_pycache([*paths, *requirement_paths(requirements)])
+
+
+async def _async_warm_imports(
+    hass: core.HomeAssistant, integrations: Iterable[loader.Integration]
+) -> None:
+    """Compile the bytecode of the integrations and their requirements.
+
+    The bytecode is compiled in parallel in worker processes, so the
+    imports during the setup only have to load it.
+    """
+    start = monotonic()
+    paths: set[str] = set()
+    requirements: set[str] = set()
+    for integration in integrations:
+        paths.add(str(integration.file_path))
+        requirements.update(integration.requirements)
+    files = await hass.async_add_executor_job(_warm_pycache, paths, requirements)
+    _LOGGER.info("Warmed bytecode of %s files in %.2fs", files, monotonic() - start)
+
+
 def open_hass_ui(hass: core.HomeAssistant) -> None:
     """Open the UI."""
     import webbrowser  # pylint: disable=import-outside-toplevel
@@ -437,6 +513,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -452,6 +529,7 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    async_start_startup_trace(hass)
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     # Prime custom component cache early so we know if registry entries are tied
@@ -462,8 +540,8 @@ async def async_from_config_dict(
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
+    with async_trace_stage(hass, "core", CORE_INTEGRATIONS):
+        core_results = await asyncio.gather(
             *(
                 create_eager_task(
                     async_setup_component(hass, domain, config),
@@ -473,7 +551,7 @@ async def async_from_config_dict(
                 for domain in CORE_INTEGRATIONS
             )
         )
-    ):
+    if not all(core_results):
         _LOGGER.error("Home Assistant core failed to initialize. ")
         return None
 
@@ -979,6 +1057,10 @@ async def _async_set_up_integrations(
         hass, config
     )
 
+    if DATA_WARM_IMPORTS in hass.data:
+        with async_trace_stage(hass, "warm imports", ()):
+            await _async_warm_imports(hass, integration_cache.values())
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1023,7 +1105,8 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with async_trace_stage(hass, name, domain_group):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1035,7 +1118,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with async_trace_stage(hass, "stage 1", stage_1_domains):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1051,7 +1135,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with async_trace_stage(hass, "stage 2", stage_2_domains):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1062,7 +1147,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with async_trace_stage(hass, "wrap up", ()):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -1070,6 +1156,7 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    async_finish_startup_trace(hass)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine, Mapping
 from dataclasses import dataclass, field
 from http import HTTPStatus
@@ -28,6 +29,7 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import (
+    LazyPlatform,
     Manifest,
     async_get_custom_components,
     async_get_integration,
@@ -68,6 +70,7 @@ class DiagnosticsData:
     """Diagnostic data."""
 
     platforms: dict[str, DiagnosticsPlatformData] = field(default_factory=dict)
+    lazy_platforms: dict[str, LazyPlatform] = field(default_factory=dict)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -75,7 +78,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = DiagnosticsData()
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_diagnostics_platform
+        hass, DOMAIN, _register_diagnostics_platform, lazy=True
     )
 
     websocket_api.async_register_command(hass, handle_info)
@@ -101,24 +104,50 @@ class DiagnosticsProtocol(Protocol):
 
 @callback
 def _register_diagnostics_platform(
-    hass: HomeAssistant, integration_domain: str, platform: DiagnosticsProtocol
+    hass: HomeAssistant, integration_domain: str, platform: LazyPlatform
 ) -> None:
-    """Register a diagnostics platform."""
+    """Register a diagnostics platform, which is imported when first used."""
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
-    diagnostics_data.platforms[integration_domain] = DiagnosticsPlatformData(
+    diagnostics_data.lazy_platforms[integration_domain] = platform
+
+
+async def _async_get_platform_data(
+    hass: HomeAssistant, domain: str
+) -> DiagnosticsPlatformData | None:
+    """Return the diagnostics platform data of a domain, importing it if needed."""
+    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    if (lazy_platform := diagnostics_data.lazy_platforms.get(domain)) is None:
+        return diagnostics_data.platforms.get(domain)
+
+    try:
+        platform = await lazy_platform.async_load()
+    except ImportError:
+        _LOGGER.exception("Unexpected error importing diagnostics for %s", domain)
+        diagnostics_data.lazy_platforms.pop(domain, None)
+        return None
+    diagnostics_data.platforms[domain] = DiagnosticsPlatformData(
         getattr(platform, "async_get_config_entry_diagnostics", None),
         getattr(platform, "async_get_device_diagnostics", None),
     )
+    diagnostics_data.lazy_platforms.pop(domain, None)
+    return diagnostics_data.platforms[domain]
 
 
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    if diagnostics_data.lazy_platforms:
+        await asyncio.gather(
+            *(
+                _async_get_platform_data(hass, domain)
+                for domain in list(diagnostics_data.lazy_platforms)
+            )
+        )
     result = [
         {
             "domain": domain,
@@ -139,15 +168,14 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
     domain = msg["domain"]
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
 
-    if (info := diagnostics_data.platforms.get(domain)) is None:
+    if (info := await _async_get_platform_data(hass, domain)) is None:
         connection.send_error(
             msg["id"], websocket_api.ERR_NOT_FOUND, "Domain not supported"
         )
@@ -267,8 +295,7 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
-        if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
+        if (info := await _async_get_platform_data(hass, config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
         filename = f"{config_entry.domain}-{config_entry.entry_id}"
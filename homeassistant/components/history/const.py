@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Seconds to wait for a congested client to catch up with a chunked response
+CHUNK_DRAIN_TIMEOUT = 30
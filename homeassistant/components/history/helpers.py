@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -32,3 +34,94 @@ def has_states_before(hass: HomeAssistant, run_time: dt) -> bool:
     """
     oldest_ts = get_instance(hass).states_manager.oldest_ts
     return oldest_ts is not None and run_time.timestamp() >= oldest_ts
+
+
+def _lttb(
+    points: list[dict[str, Any]], values: list[float], threshold: int
+) -> list[dict[str, Any]]:
+    """Downsample a run of numeric states with Largest-Triangle-Three-Buckets.
+
+    The first and last states are always kept. From each bucket in
+    between the state that forms the largest triangle with the state
+    kept from the previous bucket and the average of the next bucket
+    is kept.
+    """
+    length = len(points)
+    if threshold >= length:
+        return points
+    if threshold < 3:
+        return [points[0], points[-1]]
+    times = [point[COMPRESSED_STATE_LAST_UPDATED] for point in points]
+    sampled = [points[0]]
+    every = (length - 2) / (threshold - 2)
+    prev = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_start = end
+        next_end = min(int((bucket + 2) * every) + 1, length)
+        next_count = next_end - next_start
+        avg_time = sum(times[next_start:next_end]) / next_count
+        avg_value = sum(values[next_start:next_end]) / next_count
+        prev_time = times[prev]
+        prev_value = values[prev]
+        max_area = -1.0
+        selected = start
+        for idx in range(start, end):
+            area = abs(
+                (prev_time - avg_time) * (values[idx] - prev_value)
+                - (prev_time - times[idx]) * (avg_value - prev_value)
+            )
+            if area > max_area:
+                max_area = area
+                selected = idx
+        sampled.append(points[selected])
+        prev = selected
+    sampled.append(points[-1])
+    return sampled
+
+
+def downsample_entity_states(
+    entity_states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Downsample the compressed states of a numeric entity to about max_points.
+
+    States that are not numeric, like unavailable, are always kept so
+    gaps still show in graphs. The runs of numeric states between them
+    are downsampled with LTTB, each with a share of max_points that
+    matches its share of the states. If there are max_points or fewer
+    states they are returned unchanged.
+    """
+    total = len(entity_states)
+    if total <= max_points:
+        return entity_states
+    downsampled: list[dict[str, Any]] = []
+    run: list[dict[str, Any]] = []
+    run_values: list[float] = []
+    for state in entity_states:
+        try:
+            value = float(state[COMPRESSED_STATE_STATE])
+        except ValueError:
+            if run:
+                downsampled.extend(
+                    _lttb(run, run_values, len(run) * max_points // total)
+                )
+                run = []
+                run_values = []
+            downsampled.append(state)
+            continue
+        run.append(state)
+        run_values.append(value)
+    if run:
+        downsampled.extend(_lttb(run, run_values, len(run) * max_points // total))
+    return downsampled
+
+
+def downsample_states(
+    states: dict[str, list[dict[str, Any]]], max_points: int
+) -> dict[str, list[dict[str, Any]]]:
+    """Downsample the compressed states of each numeric entity to about max_points."""
+    return {
+        entity_id: downsample_entity_states(entity_states, max_points)
+        for entity_id, entity_states in states.items()
+    }
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -38,8 +39,13 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_states_before
+from .const import CHUNK_DRAIN_TIMEOUT, EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .helpers import (
+    downsample_entity_states,
+    downsample_states,
+    entities_may_have_state_changes_after,
+    has_states_before,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,13 +78,139 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    if max_points:
+        return json_bytes(
+            messages.result_message(
+                msg_id,
+                downsample_states(
+                    cast(dict[str, list[dict[str, Any]]], states), max_points
+                ),
+            )
+        )
+    return json_bytes(messages.result_message(msg_id, states))
+
+
+class _HistoryChunkSender:
+    """Send the chunks of a chunked history response from the executor.
+
+    Sending waits until the client caught up when the connection is
+    congested, so a long history does not overflow the pending messages
+    of the connection.
+    """
+
+    __slots__ = ("_connection", "_drained", "_hass", "cancelled")
+
+    def __init__(self, hass: HomeAssistant, connection: ActiveConnection) -> None:
+        """Initialize the sender."""
+        self._hass = hass
+        self._connection = connection
+        self._drained: asyncio.Future[None] | None = None
+        self.cancelled = False
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop sending, called when the connection is closed."""
+        self.cancelled = True
+        self._async_set_drained()
+
+    @callback
+    def _async_set_drained(self) -> None:
+        """Release the sender waiting for the client to catch up."""
+        if self._drained and not self._drained.done():
+            self._drained.set_result(None)
+
+    async def _async_send(self, message: bytes) -> None:
+        """Send a message and wait until the connection is not congested."""
+        if self.cancelled:
+            return
+        connection = self._connection
+        connection.send_message(message)
+        if not connection.congested:
+            return
+        self._drained = self._hass.loop.create_future()
+        connection.async_call_when_drained(self._async_set_drained)
+        try:
+            async with asyncio.timeout(CHUNK_DRAIN_TIMEOUT):
+                await self._drained
+        except TimeoutError:
+            self.cancelled = True
+        finally:
+            self._drained = None
+
+    def send(self, message: bytes) -> bool:
+        """Send a message from the executor.
+
+        Returns False if the stream was cancelled.
+        """
+        asyncio.run_coroutine_threadsafe(
+            self._async_send(message), self._hass.loop
+        ).result()
+        return not self.cancelled
+
+
+def _downsample_stream_chunk(
+    chunk: dict[str, list[dict[str, Any]]],
+    max_points: int,
+    sent_points: dict[str, int],
+) -> dict[str, list[dict[str, Any]]]:
+    """Downsample a chunk of a history stream.
+
+    sent_points holds the number of states sent for each entity, so an
+    entity gets about max_points over the whole stream.
+    """
+    downsampled: dict[str, list[dict[str, Any]]] = {}
+    for entity_id, entity_states in chunk.items():
+        sent = sent_points.get(entity_id, 0)
+        if (remaining := max_points - sent) < 2:
+            continue
+        downsampled[entity_id] = entity_points = downsample_entity_states(
+            entity_states, remaining
+        )
+        sent_points[entity_id] = sent + len(entity_points)
+    return downsampled
+
+
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    sender: _HistoryChunkSender,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> None:
+    """Fetch history significant_states in chunks and send them from the executor.
+
+    Each chunk is converted to json and sent as soon as it has been
+    fetched, so the whole history is never held in memory. The last
+    event is marked done, if fetching the states fails it also holds
+    the error.
+    """
+    sent_points: dict[str, int] = {}
+    try:
+        with session_scope(hass=hass, read_only=True) as session:
+            for chunk in history.iter_significant_states_with_session(
                 hass,
+                session,
                 start_time,
                 end_time,
                 entity_ids,
@@ -88,11 +220,57 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
-            ),
+            ):
+                if max_points:
+                    message = messages.event_message(
+                        msg_id,
+                        {
+                            "states": _downsample_stream_chunk(
+                                cast(dict[str, list[dict[str, Any]]], chunk),
+                                max_points,
+                                sent_points,
+                            )
+                        },
+                    )
+                else:
+                    message = messages.event_message(msg_id, {"states": chunk})
+                if not sender.send(json_bytes(message)):
+                    return
+    except Exception:
+        _LOGGER.exception("Error streaming the history of %s", entity_ids)
+        sender.send(
+            json_bytes(
+                messages.event_message(
+                    msg_id,
+                    {
+                        "states": {},
+                        "done": True,
+                        "error": {
+                            "code": websocket_api.ERR_UNKNOWN_ERROR,
+                            "message": "Unknown error",
+                        },
+                    },
+                )
+            )
         )
+        return
+    sender.send(
+        json_bytes(messages.event_message(msg_id, {"states": {}, "done": True}))
     )
 
 
+@callback
+def _async_send_empty_history_during_period(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history during period response."""
+    if not msg["chunked"]:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_event(msg["id"], {"states": {}, "done": True})
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +281,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -129,7 +309,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_during_period(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -154,12 +334,35 @@ async def ws_get_history_during_period(
             )
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_during_period(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["chunked"]:
+        # The result only acknowledges the command, the states
+        # follow as events and the last event is marked as done
+        sender = _HistoryChunkSender(hass, connection)
+        connection.subscriptions[msg["id"]] = sender.async_cancel
+        connection.send_result(msg["id"])
+        await get_instance(hass).async_add_executor_job(
+            _ws_stream_significant_states,
+            hass,
+            sender,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            msg.get("max_points"),
+        )
+        connection.subscriptions.pop(msg["id"], None)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -172,6 +375,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import ItemsView, Mapping
+from collections.abc import Hashable, ItemsView, Mapping
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, EVENT_STATE_REPORTED
+from homeassistant.const import (
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    EVENT_STATE_REPORTED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, template
@@ -166,10 +171,30 @@ async def async_attach_trigger(
         )
 
     event_filter = filter_event if event_data_items or event_data_schema else None
-    removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
-        for event_type in event_types
-    ]
+    if (
+        event_data_items
+        and MATCH_ALL not in event_types
+        and (
+            keyed_item := next(
+                (item for item in event_data_items if isinstance(item[1], Hashable)),
+                None,
+            )
+        )
+    ):
+        # Route by one of the simple event data values so the bus only
+        # runs the filter for events that can possibly match
+        data_key, value = keyed_item
+        removes = [
+            hass.bus.async_listen_keyed(
+                event_type, data_key, value, handle_event, event_filter=event_filter
+            )
+            for event_type in event_types
+        ]
+    else:
+        removes = [
+            hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
+            for event_type in event_types
+        ]
 
     @callback
     def remove_listen_events() -> None:
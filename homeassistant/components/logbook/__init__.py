@@ -18,9 +18,10 @@ from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     ATTR_NAME,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -29,6 +30,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.recorder import DATA_INSTANCE
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.event_type import EventType
@@ -36,6 +38,7 @@ from homeassistant.util.event_type import EventType
 from . import rest_api, websocket_api
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
+    BUILT_IN_EVENTS,
     DOMAIN,
     LOGBOOK_ENTRY_CONTEXT_ID,
     LOGBOOK_ENTRY_DOMAIN,
@@ -46,6 +49,7 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_SOURCE,
 )
 from .models import LazyEventPartialState, LogbookConfig
+from .projection import LogbookProjection
 
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
@@ -136,7 +140,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    projection: LogbookProjection | None = None
+    # The recorder instance is missing when the recorder is only marked loaded
+    if (instance := hass.data.get(DATA_INSTANCE)) is not None:
+        projection = _async_start_projection(
+            hass, entities_filter, instance.exclude_event_types
+        )
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, projection
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -146,6 +158,25 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+@callback
+def _async_start_projection(
+    hass: HomeAssistant,
+    entities_filter: Callable[[str], bool] | None,
+    exclude_event_types: set[EventType[Any] | str],
+) -> LogbookProjection:
+    """Project the logbook events until Home Assistant stops."""
+    projection = LogbookProjection(hass, entities_filter, exclude_event_types)
+    projection.async_start(tuple(BUILT_IN_EVENTS))
+
+    @callback
+    def _async_stop_projection(_: Event) -> None:
+        """Stop the logbook projection."""
+        projection.async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_projection)
+    return projection
+
+
 @callback
 def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
     """Process a logbook platform."""
@@ -159,6 +190,8 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
         describe_callback: Callable[[LazyEventPartialState], dict[str, Any]],
     ) -> None:
         """Teach logbook how to describe a new event."""
+        if event_name not in external_events and logbook_config.projection:
+            logbook_config.projection.async_add_event_type(event_name)
         external_events[event_name] = (domain, describe_callback)
 
     platform.async_describe_events(hass, _async_describe_event)
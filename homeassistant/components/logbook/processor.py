@@ -34,7 +34,7 @@ from homeassistant.const import (
     EVENT_CALL_SERVICE,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.core import HomeAssistant, callback, split_entity_id
 from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
@@ -126,11 +126,16 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.projection = logbook_config.projection
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
             event_cache=EventCache({}),
-            entity_name_cache=EntityNameCache(self.hass),
+            entity_name_cache=(
+                self.projection.entity_name_cache
+                if self.projection
+                else EntityNameCache(self.hass)
+            ),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
         )
@@ -150,12 +155,33 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    @callback
+    def async_get_recent_rows(
+        self, start_day: dt, end_day: dt
+    ) -> list[EventAsRow] | None:
+        """Get the rows of a recent period from the logbook projection.
+
+        Returns None if the period has to be queried from the database.
+        """
+        if self.limited_select or self.projection is None:
+            return None
+        return self.projection.async_get_rows(
+            start_day.timestamp(), end_day.timestamp()
+        )
+
     def get_events(
         self,
         start_day: dt,
         end_day: dt,
+        recent_rows: list[EventAsRow] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get events for a period of time."""
+        """Get events for a period of time.
+
+        The recent rows from async_get_recent_rows are used instead of
+        querying the database if they are passed.
+        """
+        if recent_rows is not None:
+            return self.humanify(recent_rows)
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -185,7 +211,8 @@ class EventProcessor:
             )
 
     def humanify(
-        self, rows: Generator[EventAsRow] | Sequence[Row] | Result
+        self,
+        rows: Generator[EventAsRow] | Sequence[EventAsRow] | Sequence[Row] | Result,
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -201,7 +228,7 @@ class EventProcessor:
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow] | Sequence[EventAsRow] | Sequence[Row] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -404,16 +431,19 @@ class EntityNameCache:
 
     def get(self, entity_id: str) -> str:
         """Lookup an the friendly name."""
-        if entity_id in self._names:
-            return self._names[entity_id]
+        if (name := self._names.get(entity_id)) is not None:
+            return name
         if (current_state := self._hass.states.get(entity_id)) and (
             friendly_name := current_state.attributes.get(ATTR_FRIENDLY_NAME)
         ):
-            self._names[entity_id] = friendly_name
-        else:
-            return split_entity_id(entity_id)[1].replace("_", " ")
-
-        return self._names[entity_id]
+            name = str(friendly_name)
+            self._names[entity_id] = name
+            return name
+        return split_entity_id(entity_id)[1].replace("_", " ")
+
+    def discard(self, entity_id: str) -> None:
+        """Discard the cached name of an entity."""
+        self._names.pop(entity_id, None)
 
 
 class EventCache:
@@ -0,0 +1,139 @@
+"""Long-lived in memory projection of the recent logbook events."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import math
+from operator import attrgetter
+import time
+from typing import Any
+
+from homeassistant.const import ATTR_FRIENDLY_NAME, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.util.event_type import EventType
+
+from .helpers import async_subscribe_events, event_forwarder_filtered
+from .models import EventAsRow, async_event_to_row
+from .processor import EntityNameCache
+
+# Number of recent rows kept in memory
+MAX_PROJECTION_ROWS = 8192
+
+
+class LogbookProjection:
+    """Keep the rows of the recent logbook events in memory.
+
+    The projection is fed from the event bus with the same filtering as
+    the live logbook stream, so requests for a recent period that are
+    not limited to entities, devices or a context can be served without
+    querying the database.
+
+    The projection is complete from complete_ts on: every event fired
+    since then that the logbook would show is kept, unless it has been
+    pushed out by newer events in which case complete_ts moves forward.
+
+    The friendly names of the entities are cached for the lifetime of
+    the projection and invalidated when they change.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entities_filter: Callable[[str], bool] | None,
+        exclude_event_types: set[EventType[Any] | str],
+    ) -> None:
+        """Initialize the projection."""
+        self._hass = hass
+        self._entities_filter = entities_filter
+        self._exclude_event_types = exclude_event_types
+        self._rows: deque[EventAsRow] = deque()
+        self._subscriptions: list[CALLBACK_TYPE] = []
+        self.entity_name_cache = EntityNameCache(hass)
+        self.complete_ts = time.time()
+
+    @callback
+    def async_start(self, event_types: tuple[EventType[Any] | str, ...]) -> None:
+        """Start projecting the events."""
+        async_subscribe_events(
+            self._hass,
+            self._subscriptions,
+            self._async_add_event,
+            event_types,
+            self._entities_filter,
+            None,
+            None,
+        )
+        self._subscriptions.append(
+            self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_invalidate_entity_name
+            )
+        )
+        self.complete_ts = time.time()
+
+    @callback
+    def async_add_event_type(self, event_type: EventType[Any] | str) -> None:
+        """Start projecting an event type described after the start."""
+        self._subscriptions.append(
+            self._hass.bus.async_listen(
+                event_type,
+                event_forwarder_filtered(
+                    self._async_add_event, self._entities_filter, None, None
+                ),
+            )
+        )
+        # Events of this type fired before are not in the projection
+        self.complete_ts = time.time()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop projecting the events."""
+        for unsub in self._subscriptions:
+            unsub()
+        self._subscriptions.clear()
+        self._rows.clear()
+        # Events fired from now on are not in the projection
+        self.complete_ts = math.inf
+
+    @callback
+    def _async_add_event(self, event: Event) -> None:
+        """Add an event to the projection."""
+        if event.event_type in self._exclude_event_types:
+            # Not recorded, so it would never be returned from the database
+            return
+        rows = self._rows
+        rows.append(async_event_to_row(event))
+        if len(rows) > MAX_PROJECTION_ROWS:
+            self.complete_ts = max(self.complete_ts, rows.popleft().time_fired_ts)
+
+    @callback
+    def _async_invalidate_entity_name(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Invalidate the cached name of an entity when it changes."""
+        if (
+            (new_state := event.data["new_state"]) is None
+            or (old_state := event.data["old_state"]) is None
+            or new_state.attributes.get(ATTR_FRIENDLY_NAME)
+            != old_state.attributes.get(ATTR_FRIENDLY_NAME)
+        ):
+            self.entity_name_cache.discard(event.data["entity_id"])
+
+    @callback
+    def async_get_rows(self, start_ts: float, end_ts: float) -> list[EventAsRow] | None:
+        """Return the rows between start_ts and end_ts ordered by time.
+
+        Returns None if the projection does not cover the period.
+        """
+        if start_ts < self.complete_ts:
+            return None
+        return sorted(
+            (row for row in self._rows if start_ts < row.time_fired_ts < end_ts),
+            key=attrgetter("time_fired_ts"),
+        )
@@ -107,8 +107,12 @@ class LogbookView(HomeAssistantView):
             include_entity_name=True,
         )
 
+        recent_rows = event_processor.async_get_recent_rows(start_day, end_day)
+
         def json_events() -> web.Response:
             """Fetch events and generate JSON."""
-            return self.json(event_processor.get_events(start_day, end_day))
+            return self.json(
+                event_processor.get_events(start_day, end_day, recent_rows)
+            )
 
         return await get_instance(hass).async_add_executor_job(json_events)
@@ -26,7 +26,7 @@ from .helpers import (
     async_filter_entities,
     async_subscribe_events,
 )
-from .models import LogbookConfig, async_event_to_row
+from .models import EventAsRow, LogbookConfig, async_event_to_row
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
@@ -170,6 +170,7 @@ async def _async_get_ws_stream_events(
         end_time,
         event_processor,
         partial,
+        event_processor.async_get_recent_rows(start_time, end_time),
     )
 
 
@@ -190,9 +191,10 @@ def _ws_stream_get_events(
     end_day: dt,
     event_processor: EventProcessor,
     partial: bool,
+    recent_rows: list[EventAsRow] | None,
 ) -> tuple[bytes, dt | None]:
     """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    events = event_processor.get_events(start_day, end_day, recent_rows)
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
@@ -432,11 +434,12 @@ def _ws_formatted_get_events(
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
+    recent_rows: list[EventAsRow] | None,
 ) -> bytes:
     """Fetch events and convert them to json in the executor."""
     return json_bytes(
         messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
+            msg_id, event_processor.get_events(start_time, end_time, recent_rows)
         )
     )
 
@@ -507,5 +510,6 @@ async def ws_get_events(
             start_time,
             end_time,
             event_processor,
+            event_processor.async_get_recent_rows(start_time, end_time),
         )
     )
@@ -30,6 +30,13 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# While the recorder is catching up on a backlog the commit interval grows
+# by one step for each COMMIT_INTERVAL_BACKLOG_STEP queued items, up to
+# MAX_COMMIT_INTERVAL_MULTIPLIER times the configured commit interval,
+# so more rows are written per commit. It shrinks back once the queue drains.
+COMMIT_INTERVAL_BACKLOG_STEP = 1000
+MAX_COMMIT_INTERVAL_MULTIPLIER = 8
+
 # The maximum number of rows (events) we purge in one delete statement
 
 DEFAULT_MAX_BIND_VARS = 4000
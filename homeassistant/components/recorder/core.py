@@ -39,6 +39,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -51,6 +52,7 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    COMMIT_INTERVAL_BACKLOG_STEP,
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
@@ -58,6 +60,7 @@ from .const import (
     LAST_REPORTED_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
+    MAX_COMMIT_INTERVAL_MULTIPLIER,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
@@ -80,6 +83,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .statistics_states import StatisticsStatesBuffer
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -203,6 +207,9 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._commit_task_queued = False
+        self.last_commit_duration: float | None = None
+        self.last_commit_rows = 0
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -211,6 +218,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.statistics_states_buffer = StatisticsStatesBuffer()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -323,6 +331,12 @@ class Recorder(threading.Thread):
             MATCH_ALL,
             _event_listener,
         )
+        # Every state change from now on is queued for the recorder
+        # thread, seed the statistics states buffer with the states
+        # the entities have now.
+        self.statistics_states_buffer.start(
+            time.time(), self.hass.states.async_all(), entity_filter
+        )
         self._queue_watcher = async_track_time_interval(
             self.hass,
             self._async_check_queue,
@@ -343,9 +357,39 @@ class Recorder(threading.Thread):
             self._event_listener
             and not self._database_lock_task
             and self._event_session_has_pending_writes
+            # Do not pile up commits behind a backlog, the queued
+            # commit will write everything that is pending
+            and not self._commit_task_queued
         ):
+            self._commit_task_queued = True
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_commit_interval_elapsed(self, now: datetime) -> None:
+        """Queue a commit and schedule the next one."""
+        self._commit_listener = None
+        self._async_commit(now)
+        self._async_schedule_commit()
+
+    @callback
+    def _async_schedule_commit(self) -> None:
+        """Schedule the next commit after the effective commit interval."""
+        if self._commit_listener:
+            self._commit_listener()
+        self._commit_listener = async_call_later(
+            self.hass,
+            self.effective_commit_interval,
+            self._async_commit_interval_elapsed,
+        )
+
+    @property
+    def effective_commit_interval(self) -> float:
+        """Return the commit interval adapted to the size of the backlog."""
+        return self.commit_interval * min(
+            MAX_COMMIT_INTERVAL_MULTIPLIER,
+            1 + self.backlog // COMMIT_INTERVAL_BACKLOG_STEP,
+        )
+
     @callback
     def async_add_executor_job[_T](
         self, target: Callable[..., _T], *args: Any
@@ -512,7 +556,11 @@ class Recorder(threading.Thread):
             # until after the database is vacuumed
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
-            self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
+            self.queue_task(
+                PurgeTask(
+                    purge_before, repack=repack, apply_filter=False, range_delete=True
+                )
+            )
         else:
             self.queue_task(PerodicCleanupTask())
 
@@ -633,12 +681,7 @@ class Recorder(threading.Thread):
 
         # If the commit interval is not 0, we need to commit periodically
         if self.commit_interval:
-            self._commit_listener = async_track_time_interval(
-                self.hass,
-                self._async_commit,
-                timedelta(seconds=self.commit_interval),
-                name="Recorder commit",
-            )
+            self._async_schedule_commit()
 
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
@@ -860,6 +903,7 @@ class Recorder(threading.Thread):
         self.event_data_manager.load(non_state_change_events, session)
         self.event_type_manager.load(non_state_change_events, session)
         self.states_meta_manager.load(state_change_events, session)
+        self.state_attributes_manager.warm_load(session)
         self.state_attributes_manager.load(state_change_events, session)
 
     def _guarded_process_one_task_or_event_or_recover(
@@ -1091,6 +1135,7 @@ class Recorder(threading.Thread):
 
         dbstate = States.from_event(event)
         old_state = event.data["old_state"]
+        self.statistics_states_buffer.add(old_state, event.data["new_state"])
 
         assert self.event_session is not None
         session = self.event_session
@@ -1160,7 +1205,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if states_manager.bulk_insert:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_row(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1207,7 +1256,10 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start = time.monotonic()
+        rows = len(session.new) + self.states_manager.pending_rows_count
 
+        self.states_manager.insert_pending_rows(session)
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1226,6 +1278,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self.last_commit_duration = time.monotonic() - start
+        self.last_commit_rows = rows
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1282,6 +1336,13 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        assert self.engine is not None
+        # The ids of new states are needed to link the old_state_id of the
+        # next state of the entity so States rows can only be written with
+        # executemany if the database returns the ids in parameter order.
+        self.states_manager.bulk_insert = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
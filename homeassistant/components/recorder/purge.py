@@ -6,11 +6,13 @@ from collections.abc import Callable
 from datetime import datetime
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
+import homeassistant.util.dt as dt_util
 
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
@@ -21,14 +23,17 @@ from .queries import (
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_before,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_before,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -36,11 +41,17 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event,
+    find_oldest_state,
     find_short_term_statistics_to_purge,
+    find_state_ids_before,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unused_attributes_ids_before,
+    find_unused_data_ids_before,
 )
 from .repack import repack_database
+from .statistics import get_statistics_during_period_cache
 from .util import retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -51,6 +62,9 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Range deletes purge the rows up to the next boundary of this many
+# seconds per batch, so the batches line up with hourly partitions
+PURGE_RANGE_WINDOW = 3600
 
 
 @retryable_database_job("purge")
@@ -61,10 +75,14 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    range_delete: bool = False,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If range_delete is set, states and events are deleted by ranges of
+    their indexed timestamp column instead of by lists of ids.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
@@ -85,12 +103,20 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
+            if range_delete:
+                has_more_to_purge |= _purge_states_and_attributes_by_range(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_by_range(
+                    instance, session, events_batch_size, purge_before
+                )
+            else:
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_ids(
+                    instance, session, events_batch_size, purge_before
+                )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
@@ -103,6 +129,10 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            # Commit before invalidating the cached statistics, so no
+            # result built from the purged rows can be cached again
+            session.commit()
+            get_statistics_during_period_cache(instance.hass).clear()
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -246,6 +276,147 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _next_range_boundary(timestamp: float) -> float:
+    """Return the first range window boundary after timestamp."""
+    return (timestamp // PURGE_RANGE_WINDOW + 1) * PURGE_RANGE_WINDOW
+
+
+def _log_range_purge(
+    table: str,
+    deleted_rows: int,
+    linked_table: str,
+    deleted_linked_rows: int,
+    purge_before_ts: float,
+    start: float,
+) -> None:
+    """Log the throughput of a range purge batch."""
+    elapsed = time.monotonic() - start
+    _LOGGER.debug(
+        "Purged %s %s and %s %s before %s in %.3fs (%.0f rows/s)",
+        deleted_rows,
+        table,
+        deleted_linked_rows,
+        linked_table,
+        dt_util.utc_from_timestamp(purge_before_ts).isoformat(sep=" "),
+        elapsed,
+        (deleted_rows + deleted_linked_rows) / elapsed if elapsed else 0,
+    )
+
+
+def _purge_states_and_attributes_by_range(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge states and unused attributes by ranges of last_updated_ts.
+
+    Returns true if there are more states to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    for _ in range(states_batch_size):
+        oldest_ts: float | None = session.execute(find_oldest_state()).scalar()
+        if oldest_ts is None or oldest_ts >= purge_before_ts:
+            _LOGGER.debug("No more states to purge by range")
+            return False
+        _purge_states_range(
+            instance,
+            session,
+            min(_next_range_boundary(oldest_ts), purge_before_ts),
+        )
+    return True
+
+
+def _purge_states_range(
+    instance: Recorder, session: Session, purge_before_ts: float
+) -> None:
+    """Purge the states older than purge_before_ts and their unused attributes."""
+    start = time.monotonic()
+    # The anti-join must run before the states are deleted
+    unused_attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_unused_attributes_ids_before(purge_before_ts)
+        )
+    }
+    purged_committed_state_ids: set[int] = set()
+    for state_ids_chunk in chunked_or_all(
+        instance.states_manager.committed_state_ids, instance.max_bind_vars
+    ):
+        purged_committed_state_ids.update(
+            state_id
+            for (state_id,) in session.execute(
+                find_state_ids_before(state_ids_chunk, purge_before_ts)
+            )
+        )
+    # Update old_state_id to NULL before deleting to ensure
+    # the delete does not fail due to a foreign key constraint
+    session.execute(disconnect_states_rows_before(purge_before_ts))
+    deleted_rows = cast(
+        CursorResult, session.execute(delete_states_rows_before(purge_before_ts))
+    ).rowcount
+    instance.states_manager.evict_purged_state_ids(purged_committed_state_ids)
+    if unused_attributes_ids:
+        _purge_batch_attributes_ids(instance, session, unused_attributes_ids)
+    _log_range_purge(
+        "states",
+        deleted_rows,
+        "attributes",
+        len(unused_attributes_ids),
+        purge_before_ts,
+        start,
+    )
+
+
+def _purge_events_and_data_by_range(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge events and unused event data by ranges of time_fired_ts.
+
+    Returns true if there are more events to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    for _ in range(events_batch_size):
+        oldest_ts: float | None = session.execute(find_oldest_event()).scalar()
+        if oldest_ts is None or oldest_ts >= purge_before_ts:
+            _LOGGER.debug("No more events to purge by range")
+            return False
+        _purge_events_range(
+            instance,
+            session,
+            min(_next_range_boundary(oldest_ts), purge_before_ts),
+        )
+    return True
+
+
+def _purge_events_range(
+    instance: Recorder, session: Session, purge_before_ts: float
+) -> None:
+    """Purge the events older than purge_before_ts and their unused data."""
+    start = time.monotonic()
+    # The anti-join must run before the events are deleted
+    unused_data_ids = {
+        data_id
+        for (data_id,) in session.execute(find_unused_data_ids_before(purge_before_ts))
+    }
+    deleted_rows = cast(
+        CursorResult, session.execute(delete_event_rows_before(purge_before_ts))
+    ).rowcount
+    if unused_data_ids:
+        _purge_batch_data_ids(instance, session, unused_data_ids)
+    _log_range_purge(
+        "events",
+        deleted_rows,
+        "event data",
+        len(unused_data_ids),
+        purge_before_ts,
+        start,
+    )
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
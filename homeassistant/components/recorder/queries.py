@@ -5,7 +5,8 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import and_, delete, distinct, func, lambda_stmt, select, update
+from sqlalchemy import and_, delete, distinct, exists, func, lambda_stmt, select, update
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -23,6 +24,10 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 
+# Used by the purge anti-joins against the newer rows of the same table
+_NEWER_STATES = aliased(States, name="newer_states")
+_NEWER_EVENTS = aliased(Events, name="newer_events")
+
 
 def select_event_type_ids(event_types: tuple[str, ...]) -> Select:
     """Generate a select for event type ids.
@@ -44,6 +49,24 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def find_recent_shared_attributes(
+    start_time_ts: float, limit: int
+) -> StatementLambdaElement:
+    """Find the shared attributes used by the states since start_time_ts."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id, StateAttributes.shared_attrs)
+        .where(
+            StateAttributes.attributes_id.in_(
+                select(distinct(States.attributes_id)).where(
+                    States.last_updated_ts >= start_time_ts
+                )
+            )
+        )
+        .order_by(StateAttributes.attributes_id.desc())
+        .limit(limit)
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -278,6 +301,104 @@ def find_oldest_state() -> StatementLambdaElement:
     )
 
 
+def find_oldest_event() -> StatementLambdaElement:
+    """Find the time_fired_ts of the oldest event."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .order_by(Events.time_fired_ts.asc())
+        .limit(1)
+    )
+
+
+def find_state_ids_before(
+    state_ids: Iterable[int], purge_before: float
+) -> StatementLambdaElement:
+    """Find which of the state ids are older than purge_before."""
+    return lambda_stmt(
+        lambda: select(States.state_id).filter(
+            States.state_id.in_(state_ids), States.last_updated_ts < purge_before
+        )
+    )
+
+
+def find_unused_attributes_ids_before(purge_before: float) -> StatementLambdaElement:
+    """Find attributes ids only used by states older than purge_before.
+
+    This is an anti-join against the newer states, so the attributes ids
+    it returns are unused once the older states have been deleted.
+    """
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id)).filter(
+            States.last_updated_ts < purge_before,
+            States.attributes_id.is_not(None),
+            ~exists().where(
+                _NEWER_STATES.attributes_id == States.attributes_id,
+                _NEWER_STATES.last_updated_ts >= purge_before,
+            ),
+        )
+    )
+
+
+def disconnect_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Disconnect states rows linked to states older than purge_before.
+
+    The older state ids are selected through a distinct derived table
+    since MySQL does not allow selecting from the table being updated.
+    """
+    return lambda_stmt(
+        lambda: update(States)
+        .where(
+            States.old_state_id.in_(
+                select(
+                    select(States.state_id)
+                    .filter(States.last_updated_ts < purge_before)
+                    .distinct()
+                    .subquery()
+                    .c.state_id
+                )
+            )
+        )
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete the states older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_unused_data_ids_before(purge_before: float) -> StatementLambdaElement:
+    """Find data ids only used by events older than purge_before.
+
+    This is an anti-join against the newer events, so the data ids
+    it returns are unused once the older events have been deleted.
+    """
+    return lambda_stmt(
+        lambda: select(distinct(Events.data_id)).filter(
+            Events.time_fired_ts < purge_before,
+            Events.data_id.is_not(None),
+            ~exists().where(
+                _NEWER_EVENTS.data_id == Events.data_id,
+                _NEWER_EVENTS.time_fired_ts >= purge_before,
+            ),
+        )
+    )
+
+
+def delete_event_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete the events older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
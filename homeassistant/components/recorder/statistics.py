@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -11,6 +11,7 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
@@ -165,6 +166,10 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# Number of statistics_during_period results kept in memory
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 64
 
 
 def mean(values: list[float]) -> float | None:
@@ -208,6 +213,115 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _CachedStatisticsDuringPeriod:
+    """A cached result of statistics_during_period."""
+
+    statistic_ids: frozenset[str]
+    table: type[StatisticsBase]
+    # The period of the rows the result was built from
+    start_ts: float
+    end_ts: float
+    result: dict[str, list[StatisticsRow]]
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return a copy of a result which can be modified by the caller."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for the results of statistics_during_period.
+
+    Results are looked up and stored by the executor threads running the
+    queries and invalidated by the recorder thread once the statistics
+    they were built from have been committed.
+
+    Every invalidation bumps the generation, and a result is only stored
+    if the generation is still the one read before the query started.
+    This makes sure a result read before a commit is never stored after
+    the invalidation for that commit.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CachedStatisticsDuringPeriod] = (
+            OrderedDict()
+        )
+        self.generation = 0
+
+    def get(self, key: Hashable) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of the cached result for key."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            self._entries.move_to_end(key)
+        return _copy_statistics_result(entry.result)
+
+    def set(
+        self,
+        key: Hashable,
+        generation: int,
+        statistic_ids: Iterable[str],
+        table: type[StatisticsBase],
+        start_ts: float,
+        end_ts: float,
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Cache a result unless the cache was invalidated since generation."""
+        entry = _CachedStatisticsDuringPeriod(
+            frozenset(statistic_ids),
+            table,
+            start_ts,
+            end_ts,
+            _copy_statistics_result(result),
+        )
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > STATISTICS_DURING_PERIOD_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        statistic_ids: Iterable[str] | None,
+        table: type[StatisticsBase] | None,
+        start_ts: float = float("-inf"),
+        end_ts: float = float("inf"),
+    ) -> None:
+        """Invalidate the results which include rows that may have changed.
+
+        If statistic_ids or table is None, results for all statistic_ids
+        or both tables are invalidated.
+        """
+        ids = None if statistic_ids is None else frozenset(statistic_ids)
+        with self._lock:
+            self.generation += 1
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if (table is None or entry.table is table)
+                and (ids is None or not ids.isdisjoint(entry.statistic_ids))
+                and entry.start_ts < end_ts
+                and start_ts < entry.end_ts
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Invalidate all results."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -248,13 +362,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_to_display_unit_conversion(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-    allow_none: bool = True,
-) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit if the statistics need conversion."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -272,6 +385,23 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+    allow_none: bool = True,
+) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if (
+        conversion := _get_statistic_to_display_unit_conversion(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = conversion
     if allow_none:
         return converter.converter_factory_allow_none(
             from_unit=statistic_unit, to_unit=display_unit
@@ -493,6 +623,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    get_statistics_during_period_cache(instance.hass).clear()
     return True
 
 
@@ -507,6 +638,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # filter_unique_constraint_integrity_error which would make
     # modified_statistic_ids unbound.
     modified_statistic_ids: set[str] | None = None
+    compiled_statistic_ids: set[str] = set()
 
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
@@ -516,8 +648,31 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         ),
     ) as session:
         modified_statistic_ids = _compile_statistics(
-            instance, session, start, fire_events
+            instance, session, start, fire_events, compiled_statistic_ids
+        )
+
+    # The compiled statistics are committed, invalidate the cached results
+    # which include the compiled period
+    cache = get_statistics_during_period_cache(instance.hass)
+    start_ts = start.timestamp()
+    cache.invalidate(
+        compiled_statistic_ids,
+        StatisticsShortTerm,
+        start_ts,
+        start_ts + StatisticsShortTerm.duration.total_seconds(),
+    )
+    if start.minute == 55:
+        # The hour is summarized from the short term statistics of all
+        # 5-minute periods of the hour, not only this one
+        hour_start_ts = start.replace(minute=0).timestamp()
+        cache.invalidate(
+            None,
+            Statistics,
+            hour_start_ts,
+            hour_start_ts + Statistics.duration.total_seconds(),
         )
+    if modified_statistic_ids:
+        cache.invalidate(modified_statistic_ids, None)
 
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
@@ -536,13 +691,19 @@ def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
 
 
 def _compile_statistics(
-    instance: Recorder, session: Session, start: datetime, fire_events: bool
+    instance: Recorder,
+    session: Session,
+    start: datetime,
+    fire_events: bool,
+    compiled_statistic_ids: set[str] | None = None,
 ) -> set[str]:
     """Compile 5-minute statistics for all integrations with a recorder platform.
 
     This is a helper function for compile_statistics and compile_missing_statistics
     that does not retry on database errors since both callers already retry.
 
+    If compiled_statistic_ids is passed, the compiled statistic_ids are added to it.
+
     returns a set of modified statistic_ids if any were modified.
     """
     assert start.tzinfo == dt_util.UTC, "start must be in UTC"
@@ -579,6 +740,9 @@ def _compile_statistics(
         platform_stats.extend(compiled.platform_stats)
         current_metadata.update(compiled.current_metadata)
 
+    # The buffered states before the next period are no longer needed
+    instance.statistics_states_buffer.trim((end - timedelta.resolution).timestamp())
+
     new_short_term_stats: list[StatisticsBase] = []
     updated_metadata_ids: set[int] = set()
     now_timestamp = time_time()
@@ -590,6 +754,8 @@ def _compile_statistics(
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
         updated_metadata_ids.add(metadata_id)
+        if compiled_statistic_ids is not None:
+            compiled_statistic_ids.add(stats["meta"]["statistic_id"])
         if new_stat := _insert_statistics(
             session, StatisticsShortTerm, metadata_id, stats["stat"], now_timestamp
         ):
@@ -756,6 +922,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).invalidate(statistic_ids, None)
 
 
 def update_statistics_metadata(
@@ -781,6 +948,10 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    statistic_ids = {statistic_id}
+    if isinstance(new_statistic_id, str):
+        statistic_ids.add(new_statistic_id)
+    get_statistics_during_period_cache(instance.hass).invalidate(statistic_ids, None)
 
 
 async def async_list_statistic_ids(
@@ -1701,6 +1872,42 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _align_statistics_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    return start_time, end_time
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1738,36 +1945,7 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
-
+    start_time, end_time = _align_statistics_period(start_time, end_time, period)
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
@@ -1823,9 +2001,44 @@ def statistics_during_period(
 
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
+
+    Results for given statistic_ids are cached until the statistics they were
+    built from are compiled, imported, adjusted or otherwise modified.
     """
+    if statistic_ids is None:
+        with session_scope(hass=hass, read_only=True) as session:
+            return _statistics_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                units,
+                types,
+            )
+
+    cache = get_statistics_during_period_cache(hass)
+    # The display unit of a statistic depends on the unit of its state
+    state_units = tuple(
+        state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) if state else None
+        for state in map(hass.states.get, sorted(statistic_ids))
+    )
+    key = (
+        frozenset(statistic_ids),
+        period,
+        start_time,
+        end_time,
+        frozenset(units.items()) if units else None,
+        frozenset(types),
+        state_units,
+    )
+    if (cached := cache.get(key)) is not None:
+        return cached
+
+    generation = cache.generation
     with session_scope(hass=hass, read_only=True) as session:
-        return _statistics_during_period_with_session(
+        result = _statistics_during_period_with_session(
             hass,
             session,
             start_time,
@@ -1836,6 +2049,21 @@ def statistics_during_period(
             types,
         )
 
+    aligned_start_time, aligned_end_time = _align_statistics_period(
+        start_time, end_time, period
+    )
+    cache.set(
+        key,
+        generation,
+        statistic_ids,
+        Statistics if period != "5minute" else StatisticsShortTerm,
+        # The change is calculated from the sum before the period
+        float("-inf") if "change" in types else aligned_start_time.timestamp(),
+        aligned_end_time.timestamp() if aligned_end_time else float("inf"),
+        result,
+    )
+    return result
+
 
 def _get_last_statistics_stmt(
     metadata_id: int,
@@ -2080,16 +2308,17 @@ def _build_sum_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     sum_idx: int,
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert_many: Callable[[list[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
-    """Build a list of sum statistics."""
+    """Build a list of sum statistics, converting the sums at once."""
+    sums = convert_many([db_row[sum_idx] for db_row in db_rows])
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            "sum": None if (v := db_row[sum_idx]) is None else convert(v),
+            "sum": sum_,
         }
-        for db_row in db_rows
+        for db_row, sum_ in zip(db_rows, sums, strict=True)
     ]
 
 
@@ -2132,19 +2361,24 @@ def _build_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     row_mapping: tuple[tuple[str, int], ...],
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert_many: Callable[[list[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
-    """Build a list of statistics with unit conversion."""
+    """Build a list of statistics with unit conversion.
+
+    The values are converted a column at a time.
+    """
+    keys = [key for key, _ in row_mapping]
+    converted_rows = zip(
+        *(convert_many([db_row[idx] for db_row in db_rows]) for _, idx in row_mapping),
+        strict=True,
+    )
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            **{
-                key: None if (v := db_row[idx]) is None else convert(v)  # type: ignore[typeddict-item]
-                for key, idx in row_mapping
-            },
+            **dict(zip(keys, values, strict=True)),  # type: ignore[typeddict-item]
         }
-        for db_row in db_rows
+        for db_row, values in zip(db_rows, converted_rows, strict=True)
     ]
 
 
@@ -2195,15 +2429,18 @@ def _sorted_statistics_to_dict(
     for meta_id, db_rows in stats_by_meta_id.items():
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
+        convert_many: Callable[[list[float | None]], list[float | None]] | None = None
         if convert_units:
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
-            )
-        else:
-            convert = None
+            if conversion := _get_statistic_to_display_unit_conversion(
+                unit, state_unit, units
+            ):
+                converter, display_unit = conversion
+                convert_many = partial(
+                    converter.convert_many, from_unit=unit, to_unit=display_unit
+                )
 
         build_args = (db_rows, table_duration_seconds, start_ts_idx)
         if sum_only:
@@ -2213,12 +2450,12 @@ def _sorted_statistics_to_dict(
             # For energy, we only need sum statistics, so we can optimize
             # this path to avoid the overhead of the more generic function.
             assert sum_idx is not None
-            if convert:
-                _stats = _build_sum_converted_stats(*build_args, sum_idx, convert)
+            if convert_many:
+                _stats = _build_sum_converted_stats(*build_args, sum_idx, convert_many)
             else:
                 _stats = _build_sum_stats(*build_args, sum_idx)
-        elif convert:
-            _stats = _build_converted_stats(*build_args, row_mapping, convert)
+        elif convert_many:
+            _stats = _build_converted_stats(*build_args, row_mapping, convert_many)
         else:
             _stats = _build_stats(*build_args, row_mapping)
 
@@ -2345,24 +2582,31 @@ def _import_statistics_with_session(
     metadata: StatisticMetaData,
     statistics: Iterable[StatisticData],
     table: type[StatisticsBase],
-) -> bool:
-    """Import statistics to the database."""
+) -> tuple[bool, list[float]]:
+    """Import statistics to the database.
+
+    Returns if the metadata was added or updated, and the start
+    timestamps of the imported statistics.
+    """
     statistics_meta_manager = instance.statistics_meta_manager
     old_metadata_dict = statistics_meta_manager.get_many(
         session, statistic_ids={metadata["statistic_id"]}
     )
-    _, metadata_id = statistics_meta_manager.update_or_add(
+    modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
     now_timestamp = time_time()
+    start_timestamps: list[float] = []
     for stat in statistics:
+        start_timestamps.append(stat["start"].timestamp())
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat, now_timestamp)
 
+    metadata_modified = modified_statistic_id is not None
     if table != StatisticsShortTerm:
-        return True
+        return metadata_modified, start_timestamps
 
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
@@ -2371,7 +2615,7 @@ def _import_statistics_with_session(
         run_cache, session, metadata_id
     )
 
-    return True
+    return metadata_modified, start_timestamps
 
 
 @singleton(DATA_SHORT_TERM_STATISTICS_RUN_CACHE)
@@ -2382,6 +2626,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics_during_period cache."""
+    return StatisticsDuringPeriodCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2441,16 +2693,34 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
+    # Define the result outside of the "with" statement as the import may
+    # raise and be trapped by filter_unique_constraint_integrity_error
+    metadata_modified = True
+    start_timestamps: list[float] = []
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        metadata_modified, start_timestamps = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    cache = get_statistics_during_period_cache(instance.hass)
+    statistic_ids = {metadata["statistic_id"]}
+    if metadata_modified:
+        # A new or changed unit changes the results of every period
+        cache.invalidate(statistic_ids, None)
+    elif start_timestamps:
+        cache.invalidate(
+            statistic_ids,
+            table,
+            min(start_timestamps),
+            max(start_timestamps) + table.duration.total_seconds(),
+        )
+    return True
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2491,6 +2761,9 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        {statistic_id}, None, start_time.replace(minute=0).timestamp()
+    )
     return True
 
 
@@ -2559,6 +2832,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate({statistic_id}, None)
+
 
 @callback
 def async_change_statistics_unit(
@@ -0,0 +1,125 @@
+"""Buffer the recent states of entities that have statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from itertools import chain, repeat
+import math
+
+from homeassistant.core import State
+
+# Statistics are only compiled for states with a state class
+ATTR_STATE_CLASS = "state_class"
+
+
+class StatisticsStatesBuffer:
+    """Buffer the recent states of entities with a state class.
+
+    The states are added as the state_changed events are processed by
+    the recorder thread, so the statistics of the last 5-minute period
+    can be compiled without querying the states back from the database.
+
+    The buffer is complete from complete_ts on: every state recorded
+    since then is buffered, together with the last state before it
+    of each entity.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread, except for start which is called before the
+    recorder thread is started.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._states: dict[str, list[State]] = {}
+        self.complete_ts = math.inf
+
+    def start(
+        self,
+        timestamp: float,
+        states: Iterable[State],
+        entity_filter: Callable[[str], bool] | None,
+    ) -> None:
+        """Seed the buffer with the current states and mark it complete."""
+        self._states = {
+            state.entity_id: [state]
+            for state in states
+            if ATTR_STATE_CLASS in state.attributes
+            and (entity_filter is None or entity_filter(state.entity_id))
+        }
+        self.complete_ts = timestamp
+
+    def add(self, old_state: State | None, new_state: State | None) -> None:
+        """Add a recorded state change to the buffer."""
+        if new_state is None:
+            # The entity was removed
+            if old_state is not None:
+                self._states.pop(old_state.entity_id, None)
+            return
+        if ATTR_STATE_CLASS not in new_state.attributes:
+            return
+        if (entity_states := self._states.get(new_state.entity_id)) is None:
+            entity_states = self._states[new_state.entity_id] = []
+            if old_state is not None:
+                entity_states.append(old_state)
+        entity_states.append(new_state)
+
+    def trim(self, timestamp: float) -> None:
+        """Drop the states which are not needed for periods after timestamp.
+
+        The last state at or before timestamp is kept for each entity
+        since it is the start state of the next period.
+        """
+        for entity_states in self._states.values():
+            idx = len(entity_states) - 1
+            while idx > 0 and entity_states[idx].last_updated_timestamp > timestamp:
+                idx -= 1
+            if idx > 0:
+                del entity_states[:idx]
+        self.complete_ts = max(self.complete_ts, timestamp)
+
+    def get_states(
+        self,
+        start: datetime,
+        end: datetime,
+        entity_ids: Iterable[str],
+        significant_entity_ids: Iterable[str],
+    ) -> dict[str, list[State]] | None:
+        """Return the states of the entities between start and end.
+
+        All state changes are returned for entity_ids, only the changes
+        of the state itself for significant_entity_ids. The result matches
+        get_full_significant_states_with_session called for the same
+        period with include_start_time_state.
+
+        Returns None if the buffer does not cover the period.
+        """
+        start_ts = start.timestamp()
+        if start_ts < self.complete_ts:
+            return None
+        end_ts = end.timestamp()
+        result: dict[str, list[State]] = {}
+        for entity_id, significant_changes_only in chain(
+            zip(entity_ids, repeat(False)),
+            zip(significant_entity_ids, repeat(True)),
+        ):
+            if not (entity_states := self._states.get(entity_id)):
+                continue
+            start_state: State | None = None
+            period_states: list[State] = []
+            for state in entity_states:
+                last_updated_ts = state.last_updated_timestamp
+                if last_updated_ts <= start_ts:
+                    start_state = state
+                elif last_updated_ts >= end_ts:
+                    break
+                elif (
+                    not significant_changes_only
+                    or state.last_changed == state.last_updated
+                ):
+                    period_states.append(state)
+            if start_state is not None:
+                period_states.insert(0, start_state)
+            if period_states:
+                result[entity_id] = period_states
+        return result
@@ -55,6 +55,20 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_queue_info(instance: Recorder) -> dict[str, Any]:
+    """Get info about the recorder queue and commits."""
+    last_commit_duration: str | None = None
+    if (duration := instance.last_commit_duration) is not None:
+        last_commit_duration = f"{duration * 1000:.1f} ms"
+    return {
+        "queue_backlog": instance.backlog,
+        "commit_interval": instance.effective_commit_interval,
+        "last_commit_duration": last_commit_duration,
+        "last_commit_rows": instance.last_commit_rows,
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -62,6 +76,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     recorder_runs_manager = instance.recorder_runs_manager
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    queue_info = _async_get_queue_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -72,4 +87,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | queue_info
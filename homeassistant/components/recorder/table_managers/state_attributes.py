@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
 from collections.abc import Collection, Iterable
 import logging
+import time
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
@@ -13,7 +16,7 @@ from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import find_recent_shared_attributes, get_shared_attributes
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -28,15 +31,115 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The attributes of the states recorded in this window before startup
+# are warm loaded into the hash index
+WARM_LOAD_WINDOW = 86400
+# The maximum number of attributes to warm load, each one uses 16 bytes
+WARM_LOAD_MAX_ROWS = 100000
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class AttributesHashIndex:
+    """Compact index of shared_attrs hashes to attributes_ids.
+
+    The index stores the 64-bit hash of each shared_attrs string in a sorted
+    int array with the attributes_id at the same position in a second array,
+    so it uses 16 bytes per entry instead of keeping the strings in memory.
+
+    The hash is the python string hash, not the fnv hash stored in the
+    database which is too short to identify the attributes without comparing
+    the strings. The index is built in bulk and only shrinks when attributes
+    are purged, new attributes are cached in the LRU.
+    """
+
+    __slots__ = ("_hashes", "_ids")
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._hashes = array("q")
+        self._ids = array("q")
+
+    def __len__(self) -> int:
+        """Return the number of attributes in the index."""
+        return len(self._hashes)
+
+    def load(self, shared_attrs_ids: Iterable[tuple[str, int]]) -> None:
+        """Replace the index with the passed shared_attrs and attributes_ids."""
+        pairs = sorted(
+            (hash(shared_attrs), attributes_id)
+            for shared_attrs, attributes_id in shared_attrs_ids
+        )
+        self._hashes = array("q", [hash_ for hash_, _ in pairs])
+        self._ids = array("q", [attributes_id for _, attributes_id in pairs])
+
+    def get(self, shared_attrs: str) -> int | None:
+        """Return the attributes_id of shared_attrs if it is in the index."""
+        hashes = self._hashes
+        hash_ = hash(shared_attrs)
+        idx = bisect_left(hashes, hash_)
+        if idx != len(hashes) and hashes[idx] == hash_:
+            return self._ids[idx]
+        return None
+
+    def evict(self, attributes_ids: set[int]) -> None:
+        """Remove the attributes_ids from the index."""
+        if not attributes_ids.intersection(self._ids):
+            return
+        keep = [
+            idx
+            for idx, attributes_id in enumerate(self._ids)
+            if attributes_id not in attributes_ids
+        ]
+        self._hashes = array("q", [self._hashes[idx] for idx in keep])
+        self._ids = array("q", [self._ids[idx] for idx in keep])
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._hashes = array("q")
+        self._ids = array("q")
+
+
 class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._hash_index = AttributesHashIndex()
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve shared_attrs to the attributes_id without accessing the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is None and (
+            attributes_id := self._hash_index.get(data)
+        ) is not None:
+            self._id_map[data] = attributes_id
+        return attributes_id
+
+    def warm_load(self, session: Session) -> None:
+        """Load the attributes of the recently recorded states into the hash index.
+
+        This avoids a query for each attributes that is seen for
+        the first time after startup.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        start_time_ts = time.time() - WARM_LOAD_WINDOW
+        with session.no_autoflush:
+            self._hash_index.load(
+                (shared_attrs, attributes_id)
+                for attributes_id, shared_attrs in execute_stmt_lambda_element(
+                    session,
+                    find_recent_shared_attributes(start_time_ts, WARM_LOAD_MAX_ROWS),
+                    orm_rows=False,
+                )
+            )
+        _LOGGER.debug("Warm loaded %s state attributes", len(self._hash_index))
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -64,6 +167,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
             for event in events
             if (shared_attrs_bytes := self.serialize_from_event(event))
+            and self.get_from_cache(shared_attrs_bytes.decode("utf-8")) is None
         }:
             self._load_from_hashes(hashes, session)
 
@@ -86,7 +190,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         results: dict[str, int | None] = {}
         missing_hashes: set[int] = set()
         for shared_attrs, data_hash in shared_attrs_data_hashes:
-            if (attributes_id := self._id_map.get(shared_attrs)) is None:
+            if (attributes_id := self.get_from_cache(shared_attrs)) is None:
                 missing_hashes.add(data_hash)
 
             results[shared_attrs] = attributes_id
@@ -142,6 +246,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        self._hash_index.evict(attributes_ids)
         id_map = self._id_map
         state_attributes_ids_reversed = {
             attributes_id: shared_attrs
@@ -152,3 +257,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._hash_index.clear()
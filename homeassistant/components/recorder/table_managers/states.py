@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, cast
 
+from sqlalchemy import Table, insert
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
@@ -12,6 +13,11 @@ from ..db_schema import States
 from ..queries import find_oldest_state
 from ..util import execute_stmt_lambda_element
 
+_STATES_TABLE = cast(Table, States.__table__)
+_INSERT_STATES_RETURNING_IDS = insert(_STATES_TABLE).returning(
+    _STATES_TABLE.c.state_id, sort_by_parameter_order=True
+)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -19,9 +25,14 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_rows: list[States] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
         self._oldest_ts: float | None = None
+        # If the database can return the generated ids of an executemany
+        # INSERT in parameter order, new States rows are collected and
+        # written in bulk instead of through the session unit-of-work.
+        self.bulk_insert = False
 
     @property
     def oldest_ts(self) -> float | None:
@@ -61,6 +72,88 @@ class StatesManager:
         if self._oldest_ts is None:
             self._oldest_ts = state.last_updated_ts
 
+    @property
+    def pending_rows_count(self) -> int:
+        """Return the number of States rows waiting for insert_pending_rows."""
+        return len(self._pending_rows)
+
+    def add_pending_row(self, state: States) -> None:
+        """Add a States row that is written by insert_pending_rows.
+
+        The row is not added to the session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows.append(state)
+
+    def insert_pending_rows(self, session: Session) -> None:
+        """Write the pending States rows with executemany.
+
+        The session is flushed first so the pending StatesMeta and
+        StateAttributes rows the states refer to have their ids. Rows that
+        refer to an old state that is also pending are written in a later
+        round once the id of the old state is known. Usually there are only
+        one or two states per entity between commits so this only takes
+        a few rounds.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (rows := self._pending_rows):
+            return
+        session.flush()
+        try:
+            while rows:
+                batch: list[States] = []
+                deferred: list[States] = []
+                params: list[dict[str, Any]] = []
+                for row in rows:
+                    old_state_id = row.old_state_id
+                    if (old_state := row.old_state) is not None:
+                        # The state_id is only set once the old state is written
+                        if (
+                            old_state_id := cast(int | None, old_state.state_id)
+                        ) is None:
+                            deferred.append(row)
+                            continue
+                    attributes_id = row.attributes_id
+                    if (state_attributes := row.state_attributes) is not None:
+                        attributes_id = state_attributes.attributes_id
+                    metadata_id = row.metadata_id
+                    if (states_meta := row.states_meta_rel) is not None:
+                        metadata_id = states_meta.metadata_id
+                    batch.append(row)
+                    params.append(
+                        {
+                            "entity_id": row.entity_id,
+                            "state": row.state,
+                            "last_updated_ts": row.last_updated_ts,
+                            "last_changed_ts": row.last_changed_ts,
+                            "last_reported_ts": row.last_reported_ts,
+                            "old_state_id": old_state_id,
+                            "attributes_id": attributes_id,
+                            "metadata_id": metadata_id,
+                            "origin_idx": row.origin_idx,
+                            "context_id_bin": row.context_id_bin,
+                            "context_user_id_bin": row.context_user_id_bin,
+                            "context_parent_id_bin": row.context_parent_id_bin,
+                        }
+                    )
+                state_ids = session.execute(
+                    _INSERT_STATES_RETURNING_IDS, params
+                ).scalars()
+                for row, state_id in zip(batch, state_ids, strict=True):
+                    row.state_id = state_id
+                rows = deferred
+        except BaseException:
+            # Forget the ids of the rows that were written so they are all
+            # written again if the commit is retried
+            for row in self._pending_rows:
+                row.state_id = None  # type: ignore[assignment]
+            raise
+        self._pending_rows = []
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -90,6 +183,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
         self._oldest_ts = None
 
     def load_from_db(self, session: Session) -> None:
@@ -107,6 +201,11 @@ class StatesManager:
             ts = result[0].last_updated_ts
         self._oldest_ts = ts
 
+    @property
+    def committed_state_ids(self) -> set[int]:
+        """Return the state_ids of the last committed state of each entity."""
+        return set(self._last_committed_id.values())
+
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
 
@@ -114,11 +114,16 @@ class PurgeTask(RecorderTask):
     purge_before: datetime
     repack: bool
     apply_filter: bool
+    range_delete: bool = False
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
         if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            range_delete=self.range_delete,
         ):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -127,7 +132,9 @@ class PurgeTask(RecorderTask):
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
+            PurgeTask(
+                self.purge_before, self.repack, self.apply_filter, self.range_delete
+            )
         )
 
 
@@ -292,6 +299,7 @@ class CommitTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
+        instance._commit_task_queued = False  # noqa: SLF001
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
@@ -402,6 +402,37 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_history_from_database(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entities_full_history: list[str],
+    entities_significant_history: list[str],
+) -> dict[str, list[State]]:
+    """Get the states of the sensors during start-end from the database."""
+    history_list: dict[str, list[State]] = {}
+    if entities_full_history:
+        history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_full_history,
+            significant_changes_only=False,
+        )
+    if entities_significant_history:
+        _history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_significant_history,
+        )
+        history_list = {**history_list, **_history_list}
+    return history_list
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -417,30 +448,27 @@ def compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: dict[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
-        )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
-    if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
+    # Use the states buffered by the recorder if they cover the period
+    history_list = get_instance(hass).statistics_states_buffer.get_states(
+        start - datetime.timedelta.resolution,
+        end,
+        entities_full_history,
+        entities_significant_history,
+    )
+    if history_list is None:
+        history_list = _get_history_from_database(
             hass,
             session,
-            start - datetime.timedelta.resolution,
+            start,
             end,
-            entity_ids=entities_significant_history,
+            entities_full_history,
+            entities_significant_history,
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -20,12 +20,17 @@ from homeassistant.helpers import (
     integration_platform,
 )
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import bind_hass
+from homeassistant.loader import LazyPlatform, bind_hass
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "system_health"
 
+DATA_LAZY_PLATFORMS: HassKey[dict[str, LazyPlatform]] = HassKey(
+    "system_health_lazy_platforms"
+)
+
 INFO_CALLBACK_TIMEOUT = 5
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -63,9 +68,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the System Health component."""
     websocket_api.async_register_command(hass, handle_info)
     hass.data.setdefault(DOMAIN, {})
+    hass.data[DATA_LAZY_PLATFORMS] = {}
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_system_health_platform
+        hass, DOMAIN, _register_system_health_platform, lazy=True
     )
 
     return True
@@ -73,10 +79,40 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 @callback
 def _register_system_health_platform(
-    hass: HomeAssistant, integration_domain: str, platform: SystemHealthProtocol
+    hass: HomeAssistant, integration_domain: str, platform: LazyPlatform
+) -> None:
+    """Register a system health platform, which is imported when first used."""
+    hass.data[DATA_LAZY_PLATFORMS][integration_domain] = platform
+
+
+async def _async_register_lazy_platform(
+    hass: HomeAssistant, integration_domain: str, lazy_platform: LazyPlatform
 ) -> None:
-    """Register a system health platform."""
-    platform.async_register(hass, SystemHealthRegistration(hass, integration_domain))
+    """Import a system health platform and register it."""
+    try:
+        platform = await lazy_platform.async_load()
+    except ImportError:
+        _LOGGER.exception(
+            "Unexpected error importing system health for %s", integration_domain
+        )
+        hass.data[DATA_LAZY_PLATFORMS].pop(integration_domain, None)
+        return
+    # Another request may have registered it while it was imported
+    if hass.data[DATA_LAZY_PLATFORMS].pop(integration_domain, None) is not None:
+        platform.async_register(
+            hass, SystemHealthRegistration(hass, integration_domain)
+        )
+
+
+async def _async_register_lazy_platforms(hass: HomeAssistant) -> None:
+    """Import and register the system health platforms which are not yet used."""
+    if lazy_platforms := hass.data.get(DATA_LAZY_PLATFORMS):
+        await asyncio.gather(
+            *(
+                _async_register_lazy_platform(hass, integration_domain, platform)
+                for integration_domain, platform in list(lazy_platforms.items())
+            )
+        )
 
 
 async def get_integration_info(
@@ -115,6 +151,7 @@ async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle an info request via a subscription."""
+    await _async_register_lazy_platforms(hass)
     registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
     data = {}
     pending_info: dict[tuple[str, str], asyncio.Task] = {}
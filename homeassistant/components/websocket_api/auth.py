@@ -32,10 +32,14 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("binary_framing", default=False): bool,
     }
 )
 
 AUTH_OK_MESSAGE = json_bytes({"type": TYPE_AUTH_OK, "ha_version": __version__})
+AUTH_OK_BINARY_FRAMING_MESSAGE = json_bytes(
+    {"type": TYPE_AUTH_OK, "ha_version": __version__, "binary_framing": True}
+)
 AUTH_REQUIRED_MESSAGE = json_bytes(
     {"type": TYPE_AUTH_REQUIRED, "ha_version": __version__}
 )
@@ -95,7 +99,12 @@ class AuthPhase:
                     refresh_token.id, self._cancel_ws
                 )
             )
-            await self._send_bytes_text(AUTH_OK_MESSAGE)
+            if valid_msg["binary_framing"]:
+                # All messages after auth_ok are sent as binary frames
+                conn.binary_framing = True
+                await self._send_bytes_text(AUTH_OK_BINARY_FRAMING_MESSAGE)
+            else:
+                await self._send_bytes_text(AUTH_OK_MESSAGE)
             self._logger.debug("Auth OK")
             process_success_login(self._request)
             return conn
@@ -53,6 +53,7 @@ from homeassistant.helpers.json import (
     json_fragment,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.startup_trace import async_get_startup_trace
 from homeassistant.loader import (
     IntegrationNotFound,
     async_get_integration,
@@ -65,6 +66,8 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
+from .state_cache import EntityStatesCache, async_get_entity_states_cache
+from .stats import async_get_command_stats
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -78,6 +81,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_command_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
@@ -86,6 +90,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -140,6 +145,9 @@ def _forward_events_unconditional(
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("backpressure", default=const.BACKPRESSURE_QUEUE): vol.In(
+            [const.BACKPRESSURE_QUEUE, const.BACKPRESSURE_DROP]
+        ),
     }
 )
 def handle_subscribe_events(
@@ -157,17 +165,23 @@ def handle_subscribe_events(
         raise Unauthorized(user_id=connection.user.id)
 
     message_id_as_bytes = str(msg["id"]).encode()
+    send_message: Callable[[bytes | str | dict[str, Any]], None]
+    if msg["backpressure"] == const.BACKPRESSURE_DROP:
+        # Events are dropped while the client is not keeping up
+        send_message = connection.send_message_unless_congested
+    else:
+        send_message = connection.send_message
 
     if event_type == EVENT_STATE_CHANGED:
         forward_events = partial(
             _forward_events_check_permissions,
-            connection.send_message,
+            send_message,
             connection.user,
             message_id_as_bytes,
         )
     else:
         forward_events = partial(
-            _forward_events_unconditional, connection.send_message, message_id_as_bytes
+            _forward_events_unconditional, send_message, message_id_as_bytes
         )
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
@@ -309,12 +323,17 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_can_read_all_states(user: User) -> bool:
+    """Return if the user can read the state of all entities."""
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_can_read_all_states(connection.user):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -374,9 +393,14 @@ def _forward_entity_changes(
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
+    states_cache: EntityStatesCache | None,
+    coalesced_changes: _CoalescedEntityChanges | None,
     event: Event[EventStateChangedData],
 ) -> None:
-    """Forward entity state changed events to websocket."""
+    """Forward entity state changed events to websocket.
+
+    The cursor of the change is included if states_cache is passed.
+    """
     entity_id = event.data["entity_id"]
     if (entity_ids and entity_id not in entity_ids) or (
         entity_filter and not entity_filter(entity_id)
@@ -391,7 +415,81 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    if coalesced_changes is not None and coalesced_changes.async_hold(entity_id):
+        return
+    if states_cache is None:
+        send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+        return
+    send_message(
+        messages.cached_versioned_state_diff_message(
+            message_id_as_bytes, event, states_cache.cursor
+        )
+    )
+
+
+class _CoalescedEntityChanges:
+    """Hold back the entity changes while the client is congested.
+
+    Instead of queueing a diff for every change, the entities changed
+    while the client is not keeping up are sent once with their current
+    state in a single message when it caught up.
+    """
+
+    __slots__ = (
+        "_connection",
+        "_entity_ids",
+        "_hass",
+        "_message_id_as_bytes",
+        "_msg_id",
+        "_states_cache",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: ActiveConnection,
+        msg_id: int,
+        message_id_as_bytes: bytes,
+        states_cache: EntityStatesCache | None,
+    ) -> None:
+        """Initialize the coalesced changes."""
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._message_id_as_bytes = message_id_as_bytes
+        self._states_cache = states_cache
+        self._entity_ids: set[str] = set()
+
+    @callback
+    def async_hold(self, entity_id: str) -> bool:
+        """Hold back the change of an entity if the client is congested.
+
+        Returns False if the change must be sent right away.
+        """
+        if not self._entity_ids:
+            if not self._connection.congested:
+                return False
+            self._connection.async_call_when_drained(self._async_send)
+        self._entity_ids.add(entity_id)
+        return True
+
+    @callback
+    def _async_send(self) -> None:
+        """Send the entities changed while the client was congested."""
+        entity_ids = self._entity_ids
+        self._entity_ids = set()
+        if self._msg_id not in self._connection.subscriptions:
+            # Unsubscribed in the meantime
+            return
+        _send_handle_entities_changes_response(
+            self._hass,
+            self._connection,
+            self._message_id_as_bytes,
+            self._states_cache.cursor if self._states_cache else None,
+            entity_ids,
+            None,
+            None,
+        )
 
 
 @callback
@@ -399,22 +497,48 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("cursor"): vol.Any(str, None),
+        vol.Optional("backpressure", default=const.BACKPRESSURE_COALESCE): vol.In(
+            [const.BACKPRESSURE_QUEUE, const.BACKPRESSURE_COALESCE]
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    If the cursor key is passed, every event includes the cursor of the
+    last state change it contains as "v". Passing the last cursor received
+    when subscribing again with the same filters only sends the entities
+    changed since then, which is reported with resumed in the result.
+
+    With the coalesce backpressure policy, the changes are held back
+    while the client is not keeping up and the current states of the
+    changed entities are sent once it caught up.
+    """
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    states_cache = async_get_entity_states_cache(hass)
+    versioned = "cursor" in msg
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
+    coalesced_changes = (
+        _CoalescedEntityChanges(
+            hass,
+            connection,
+            msg_id,
+            message_id_as_bytes,
+            states_cache if versioned else None,
+        )
+        if msg["backpressure"] == const.BACKPRESSURE_COALESCE
+        else None
+    )
     connection.subscriptions[msg_id] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
@@ -424,13 +548,33 @@ def handle_subscribe_entities(
             entity_filter,
             connection.user,
             message_id_as_bytes,
+            states_cache if versioned else None,
+            coalesced_changes,
         ),
     )
-    connection.send_result(msg_id)
+    if not versioned:
+        connection.send_result(msg_id)
+        cursor = None
+    else:
+        cursor = states_cache.cursor
+        if (changed := states_cache.async_changed_since(msg["cursor"])) is not None:
+            connection.send_result(msg_id, {"resumed": True})
+            _send_handle_entities_changes_response(
+                hass,
+                connection,
+                message_id_as_bytes,
+                cursor,
+                changed,
+                entity_ids,
+                entity_filter,
+            )
+            return
+        connection.send_result(msg_id, {"resumed": False})
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
+    states = _async_get_allowed_states(hass, connection)
     try:
         if entity_ids or entity_filter:
             serialized_states = [
@@ -439,14 +583,17 @@ def handle_subscribe_entities(
                 if (not entity_ids or state.entity_id in entity_ids)
                 and (not entity_filter or entity_filter(state.entity_id))
             ]
+        elif _async_can_read_all_states(connection.user):
+            # Fast path when not filtering, the states are
+            # only joined once per version for all connections
+            serialized_states = [states_cache.async_snapshot()]
         else:
-            # Fast path when not filtering
             serialized_states = [state.as_compressed_state_json for state in states]
     except (ValueError, TypeError):
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection, message_id_as_bytes, serialized_states, cursor
         )
         return
 
@@ -463,7 +610,7 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection, message_id_as_bytes, serialized_states, cursor
     )
 
 
@@ -471,6 +618,7 @@ def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
     serialized_states: list[bytes],
+    cursor: str | None = None,
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -480,7 +628,58 @@ def _send_handle_entities_init_response(
                 message_id_as_bytes,
                 b',"type":"event","event":{"a":{',
                 b",".join(serialized_states),
-                b"}}}",
+                b"}}}" if cursor is None else b'},"v":"' + cursor.encode() + b'"}}',
+            )
+        )
+    )
+
+
+def _send_handle_entities_changes_response(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    message_id_as_bytes: bytes,
+    cursor: str | None,
+    changed: set[str],
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+) -> None:
+    """Send the current states of changed entities."""
+    entity_perm = (
+        None
+        if _async_can_read_all_states(connection.user)
+        else connection.user.permissions.check_entity
+    )
+    serialized_states: list[bytes] = []
+    removed: list[str] = []
+    for entity_id in changed:
+        if (
+            (entity_ids and entity_id not in entity_ids)
+            or (entity_filter and not entity_filter(entity_id))
+            or (entity_perm and not entity_perm(entity_id, POLICY_READ))
+        ):
+            continue
+        if (state := hass.states.get(entity_id)) is None:
+            removed.append(entity_id)
+            continue
+        try:
+            serialized_states.append(state.as_compressed_state_json)
+        except (ValueError, TypeError):
+            connection.logger.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
+            )
+    connection.send_message(
+        b"".join(
+            (
+                b'{"id":',
+                message_id_as_bytes,
+                b',"type":"event","event":{"a":{',
+                b",".join(serialized_states),
+                b'},"r":',
+                json_bytes(removed),
+                b"}}" if cursor is None else b',"v":"' + cursor.encode() + b'"}}',
             )
         )
     )
@@ -570,6 +769,27 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "integration/startup_trace",
+        vol.Optional("format", default="report"): vol.In(["report", "chrome"]),
+    }
+)
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup trace command."""
+    if (trace := async_get_startup_trace(hass)) is None:
+        connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Startup was not traced")
+        return
+    if msg["format"] == "chrome":
+        connection.send_result(msg["id"], trace.as_chrome_trace())
+    else:
+        connection.send_result(msg["id"], trace.as_dict())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -900,6 +1120,27 @@ async def handle_validate_config(
     connection.send_result(msg["id"], result)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "command_stats"})
+@decorators.require_admin
+def handle_command_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle command stats command.
+
+    Returns how often each command type was handled, the time spent in
+    the handlers and the size and serialization time of the messages
+    sent while handling them.
+    """
+    connection.send_result(
+        msg["id"],
+        {
+            command_type: command_stats.as_dict()
+            for command_type, command_stats in async_get_command_stats(hass).items()
+        },
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
 from homeassistant.util.json import JsonValueType
@@ -22,6 +23,7 @@ from .messages import (
     message_to_json_bytes,
     result_message,
 )
+from .stats import async_record_command, current_command
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -40,8 +42,11 @@ class ActiveConnection:
     """Handle an active websocket client connection."""
 
     __slots__ = (
+        "_drain_callbacks",
+        "binary_framing",
         "binary_handlers",
         "can_coalesce",
+        "congested",
         "handlers",
         "hass",
         "last_id",
@@ -70,6 +75,9 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.binary_framing = False
+        self.congested = False
+        self._drain_callbacks: list[CALLBACK_TYPE] = []
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -86,6 +94,33 @@ class ActiveConnection:
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
 
+    @callback
+    def async_set_congested(self, congested: bool) -> None:
+        """Set if the client is not keeping up with the pending messages.
+
+        The drain callbacks are called once the client caught up again.
+        """
+        self.congested = congested
+        if congested or not self._drain_callbacks:
+            return
+        drain_callbacks = self._drain_callbacks
+        self._drain_callbacks = []
+        for drain_callback in drain_callbacks:
+            drain_callback()
+
+    @callback
+    def async_call_when_drained(self, drain_callback: CALLBACK_TYPE) -> None:
+        """Call a callback once when the client is no longer congested."""
+        self._drain_callbacks.append(drain_callback)
+
+    @callback
+    def send_message_unless_congested(
+        self, message: bytes | str | dict[str, Any]
+    ) -> None:
+        """Send a message, drop it if the client is congested."""
+        if not self.congested:
+            self.send_message(message)
+
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
         description = self.user.name or ""
@@ -228,6 +263,10 @@ class ActiveConnection:
 
         handler, schema = handler_schema
 
+        # Messages sent by the handler, or the tasks it creates,
+        # are accounted to the command
+        token = current_command.set((self, type_))
+        start = perf_counter()
         try:
             if schema is False:
                 if len(msg) > 2:
@@ -237,6 +276,9 @@ class ActiveConnection:
                 handler(self.hass, self, schema(msg))
         except Exception as err:  # noqa: BLE001
             self.async_handle_exception(msg, err)
+        finally:
+            current_command.reset(token)
+        async_record_command(self.hass, type_, perf_counter() - start)
 
         self.last_id = cur_id
 
@@ -252,6 +294,7 @@ class ActiveConnection:
                     "Error unsubscribing from subscription: %s", unsub
                 )
         self.subscriptions.clear()
+        self._drain_callbacks.clear()
         self.send_message = self._connect_closed_error
         current_request.set(None)
         current_connection.set(None)
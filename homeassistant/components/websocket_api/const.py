@@ -34,6 +34,17 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages from which the client is considered not
+# keeping up, and below which it is considered caught up again. While a
+# client is congested, subscriptions apply their backpressure policy.
+PENDING_MSG_CONGESTED: Final = 512
+PENDING_MSG_DRAINED: Final = 32
+
+# Backpressure policies of subscriptions
+BACKPRESSURE_QUEUE: Final = "queue"
+BACKPRESSURE_DROP: Final = "drop"
+BACKPRESSURE_COALESCE: Final = "coalesce"
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +69,12 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+
+# Binary framing, negotiated during the auth phase. The first byte of
+# each binary frame sent to the client tells how the JSON payload is encoded
+BINARY_FRAME_JSON: Final = 0
+BINARY_FRAME_JSON_DEFLATE: Final = 1
+# Smaller payloads are not worth compressing
+BINARY_FRAME_DEFLATE_MIN_SIZE: Final = 1024
+# Larger payloads are compressed in the executor
+BINARY_FRAME_DEFLATE_EXECUTOR_MIN_SIZE: Final = 256 * 1024
@@ -8,7 +8,9 @@ from collections.abc import Callable, Coroutine
 import datetime as dt
 from functools import partial
 import logging
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 from aiohttp.http_websocket import WebSocketWriter
@@ -23,8 +25,14 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    BINARY_FRAME_DEFLATE_EXECUTOR_MIN_SIZE,
+    BINARY_FRAME_DEFLATE_MIN_SIZE,
+    BINARY_FRAME_JSON,
+    BINARY_FRAME_JSON_DEFLATE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_CONGESTED,
+    PENDING_MSG_DRAINED,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -34,10 +42,16 @@ from .const import (
 )
 from .error import Disconnect
 from .messages import message_to_json_bytes
+from .stats import async_record_message, current_command
 from .util import describe_request
 
 CLOSE_MSG_TYPES = {WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.CLOSING}
 
+_BINARY_FRAME_JSON_PREFIX = bytes((BINARY_FRAME_JSON,))
+_BINARY_FRAME_JSON_DEFLATE_PREFIX = bytes((BINARY_FRAME_JSON_DEFLATE,))
+# Favor speed, the payloads are JSON which compresses well anyway
+_deflate = partial(zlib.compress, level=1)
+
 if TYPE_CHECKING:
     from .connection import ActiveConnection
 
@@ -160,13 +174,17 @@ class WebSocketHandler:
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
-                    continue
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")
+                    )
+                    message_queue.clear()
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, coalesced_messages)
+                    await send_bytes_text(coalesced_messages)
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
-                if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if connection.congested and len(message_queue) <= PENDING_MSG_DRAINED:
+                    connection.async_set_congested(False)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -197,12 +215,18 @@ class WebSocketHandler:
             # max pending messages.
             return
 
+        serialize_time = 0.0
         if type(message) is not bytes:
             if isinstance(message, dict):
+                start = perf_counter()
                 message = message_to_json_bytes(message)
+                serialize_time = perf_counter() - start
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
+        if (command := current_command.get()) and command[0] is self._connection:
+            async_record_message(self._hass, command[1], len(message), serialize_time)
+
         message_queue = self._message_queue
         message_queue.append(message)
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
@@ -224,6 +248,13 @@ class WebSocketHandler:
             self._release_ready_queue_size = queue_size_after_add
             self._loop.call_soon(self._release_ready_future_or_reschedule)
 
+        if (
+            queue_size_after_add >= PENDING_MSG_CONGESTED
+            and (connection := self._connection) is not None
+            and not connection.congested
+        ):
+            connection.async_set_congested(True)
+
         peak_checker_active = self._peak_checker_unsub is not None
 
         if queue_size_after_add <= PENDING_MSG_PEAK:
@@ -331,6 +362,7 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_binary = partial(writer.send_frame, opcode=WSMsgType.BINARY)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -338,7 +370,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection)
         except asyncio.CancelledError:
@@ -373,6 +407,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -403,13 +438,38 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        send_bytes = send_bytes_text
+        if connection.binary_framing:
+            # Payloads are not deflated again if the client negotiated
+            # permessage-deflate for the whole connection
+            send_bytes = partial(
+                self._async_send_binary_frame,
+                send_bytes_binary,
+                not self._wsock.compress,
+            )
+        self._writer_task = create_eager_task(self._writer(connection, send_bytes))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
         self._authenticated = True
         return connection
 
+    async def _async_send_binary_frame(
+        self,
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
+        deflate: bool,
+        message: bytes,
+    ) -> None:
+        """Send a message as a binary frame, deflating large payloads."""
+        if not deflate or (size := len(message)) < BINARY_FRAME_DEFLATE_MIN_SIZE:
+            await send_bytes_binary(_BINARY_FRAME_JSON_PREFIX + message)
+            return
+        if size < BINARY_FRAME_DEFLATE_EXECUTOR_MIN_SIZE:
+            compressed = _deflate(message)
+        else:
+            compressed = await self._hass.async_add_executor_job(_deflate, message)
+        await send_bytes_binary(_BINARY_FRAME_JSON_DEFLATE_PREFIX + compressed)
+
     @callback
     def _async_increase_writer_limit(self, writer: WebSocketWriter) -> None:
         #
@@ -162,6 +162,29 @@ def cached_state_diff_message(
     )
 
 
+def cached_versioned_state_diff_message(
+    message_id_as_bytes: bytes, event: Event[EventStateChangedData], cursor: str
+) -> bytes:
+    """Return an event message including the cursor of the state change.
+
+    The serialized state diff is shared with cached_state_diff_message.
+    """
+    if (
+        partial_message := _partial_cached_state_diff_message(event)
+    ) is INVALID_JSON_PARTIAL_MESSAGE:
+        return cached_state_diff_message(message_id_as_bytes, event)
+    return b"".join(
+        (
+            partial_message[:-2],
+            b',"v":"',
+            cursor.encode(),
+            b'"},"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
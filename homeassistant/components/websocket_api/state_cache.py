@@ -0,0 +1,107 @@
+"""Shared, versioned cache of the states sent to subscribe_entities."""
+
+from __future__ import annotations
+
+from collections import deque
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
+
+from .const import DOMAIN
+
+DATA_ENTITY_STATES_CACHE: HassKey[EntityStatesCache] = HassKey(
+    f"{DOMAIN}.entity_states_cache"
+)
+
+# Number of state changes which can be replayed to a resubscribing client
+MAX_REPLAY_CHANGES = 8192
+
+
+class EntityStatesCache:
+    """Versioned cache of the compressed states of all entities.
+
+    The version is increased with every state change. The cursor of a
+    version is sent to clients subscribing with a cursor, so when they
+    resubscribe after a reconnect only the entities changed since the
+    last event they received have to be sent again.
+
+    The compressed states of all entities are joined once per version
+    and shared between all the clients which are allowed to read all
+    entities and do not filter the entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        # Cursors of a previous run of Home Assistant are never resumed
+        self._epoch = ulid_now()
+        self.version = 0
+        self._changes: deque[tuple[int, str]] = deque(maxlen=MAX_REPLAY_CHANGES)
+        self._snapshot_version = -1
+        self._snapshot = b""
+
+    @callback
+    def async_setup(self) -> None:
+        """Start tracking state changes."""
+        self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Increase the version when a state changes."""
+        self.version += 1
+        self._changes.append((self.version, event.data["entity_id"]))
+
+    @property
+    def cursor(self) -> str:
+        """Return the cursor of the current version."""
+        return f"{self._epoch}:{self.version}"
+
+    @callback
+    def async_changed_since(self, cursor: str | None) -> set[str] | None:
+        """Return the entity ids changed since the version of a cursor.
+
+        Returns None if the changes since the cursor are not known.
+        """
+        if cursor is None:
+            return None
+        epoch, _, version_str = cursor.partition(":")
+        if epoch != self._epoch or not version_str.isdigit():
+            return None
+        if (version := int(version_str)) > self.version:
+            return None
+        # The change following the version must still be tracked
+        if version < self.version and self._changes[0][0] > version + 1:
+            return None
+        changed: set[str] = set()
+        for change_version, entity_id in reversed(self._changes):
+            if change_version <= version:
+                break
+            changed.add(entity_id)
+        return changed
+
+    @callback
+    def async_snapshot(self) -> bytes:
+        """Return the compressed states of all entities joined as JSON members.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+        """
+        if self._snapshot_version != self.version:
+            self._snapshot = b",".join(
+                [
+                    state.as_compressed_state_json
+                    for state in self._hass.states.async_all()
+                ]
+            )
+            self._snapshot_version = self.version
+        return self._snapshot
+
+
+@callback
+def async_get_entity_states_cache(hass: HomeAssistant) -> EntityStatesCache:
+    """Return the entity states cache, set it up on first use."""
+    if (cache := hass.data.get(DATA_ENTITY_STATES_CACHE)) is None:
+        cache = hass.data[DATA_ENTITY_STATES_CACHE] = EntityStatesCache(hass)
+        cache.async_setup()
+    return cache
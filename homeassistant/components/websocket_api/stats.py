@@ -0,0 +1,73 @@
+"""Payload statistics of websocket commands."""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+DATA_COMMAND_STATS: HassKey[dict[str, CommandStats]] = HassKey(
+    f"{DOMAIN}.command_stats"
+)
+
+# The connection and type of the command being handled, messages sent
+# while handling a command are accounted to the command
+current_command: ContextVar[tuple[ActiveConnection, str] | None] = ContextVar(
+    "current_command", default=None
+)
+
+
+@dataclass(slots=True)
+class CommandStats:
+    """Payload statistics of a command type."""
+
+    commands: int = 0
+    handle_time: float = 0.0
+    messages: int = 0
+    payload_bytes: int = 0
+    serialize_time: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return asdict(self)
+
+
+@callback
+def async_get_command_stats(hass: HomeAssistant) -> dict[str, CommandStats]:
+    """Return the statistics of all command types."""
+    if (stats := hass.data.get(DATA_COMMAND_STATS)) is None:
+        stats = hass.data[DATA_COMMAND_STATS] = {}
+    return stats
+
+
+@callback
+def async_record_command(
+    hass: HomeAssistant, command_type: str, handle_time: float
+) -> None:
+    """Record a command being handled."""
+    stats = async_get_command_stats(hass)
+    if (command_stats := stats.get(command_type)) is None:
+        command_stats = stats[command_type] = CommandStats()
+    command_stats.commands += 1
+    command_stats.handle_time += handle_time
+
+
+@callback
+def async_record_message(
+    hass: HomeAssistant, command_type: str, payload_bytes: int, serialize_time: float
+) -> None:
+    """Record a message sent while handling a command."""
+    stats = async_get_command_stats(hass)
+    if (command_stats := stats.get(command_type)) is None:
+        command_stats = stats[command_type] = CommandStats()
+    command_stats.messages += 1
+    command_stats.payload_bytes += payload_bytes
+    command_stats.serialize_time += serialize_time
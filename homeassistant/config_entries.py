@@ -69,6 +69,7 @@ from .helpers.event import (
 )
 from .helpers.frame import ReportBehavior, report_usage
 from .helpers.json import json_bytes, json_bytes_sorted, json_fragment
+from .helpers.startup_trace import async_trace_setup, async_trace_waited_for
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
 from .loader import async_suggest_report_issue
 from .setup import (
@@ -2293,19 +2294,22 @@ class ConfigEntries:
     async def _async_forward_entry_setups_locked(
         self, entry: ConfigEntry, platforms: Iterable[Platform | str]
     ) -> None:
-        await asyncio.gather(
-            *(
-                create_eager_task(
-                    self._async_forward_entry_setup(entry, platform, False),
-                    name=(
-                        f"config entry forward setup {entry.title} "
-                        f"{entry.domain} {entry.entry_id} {platform}"
-                    ),
-                    loop=self.hass.loop,
+        with async_trace_setup(
+            self.hass, entry.domain, SetupPhases.PLATFORM_FORWARD, entry.entry_id
+        ):
+            await asyncio.gather(
+                *(
+                    create_eager_task(
+                        self._async_forward_entry_setup(entry, platform, False),
+                        name=(
+                            f"config entry forward setup {entry.title} "
+                            f"{entry.domain} {entry.entry_id} {platform}"
+                        ),
+                        loop=self.hass.loop,
+                    )
+                    for platform in platforms
                 )
-                for platform in platforms
             )
-        )
 
     async def async_forward_entry_setup(
         self, entry: ConfigEntry, domain: Platform | str
@@ -2356,6 +2360,7 @@ class ConfigEntries:
         """Forward the setup of an entry to a different component."""
         # Setup Component if not set up yet
         if domain not in self.hass.config.components:
+            async_trace_waited_for(self.hass, entry.domain, (domain,))
             with async_pause_setup(self.hass, SetupPhases.WAIT_BASE_PLATFORM_SETUP):
                 result = await async_setup_component(
                     self.hass, domain, self._hass_config
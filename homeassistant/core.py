@@ -12,6 +12,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
@@ -1445,6 +1446,44 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+@dataclass(slots=True)
+class _KeyedListeners(Generic[_DataT]):
+    """Listeners for an event type routed by the value of one event data key."""
+
+    hass: HomeAssistant
+    data_key: str
+    callbacks: dict[Hashable, list[_FilterableJobType[_DataT]]]
+    remove: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_filter(self, event_data: _DataT) -> bool:
+        """Return if any listener is interested in the event."""
+        try:
+            return event_data.get(self.data_key, _SENTINEL) in self.callbacks
+        except TypeError:
+            # The value of the data key is not hashable
+            return False
+
+    @callback
+    def __call__(self, event: Event[_DataT]) -> None:
+        """Dispatch the event to the listeners for its key."""
+        event_data = event.data
+        if not (jobs := self.callbacks.get(event_data.get(self.data_key, _SENTINEL))):
+            return
+        for job, event_filter in jobs.copy():
+            if event_filter is not None:
+                try:
+                    if not event_filter(event_data):
+                        continue
+                except Exception:
+                    _LOGGER.exception("Error in event filter")
+                    continue
+            try:
+                self.hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1459,7 +1498,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1513,9 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[
+            tuple[EventType[Any] | str, str], _KeyedListeners[Any]
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1653,6 +1701,89 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        value: Hashable,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a specific data value.
+
+        The listener is only called for events of event_type where
+        event.data[data_key] equals value. All keyed listeners for the
+        same event_type and data_key share a single bus listener that
+        routes events with a dict lookup, so the cost of firing an event
+        does not grow with the number of keyed listeners.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, is run after the key
+        matched and determines if the listener callable should run.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners can not listen to all events")
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if not isinstance(value, Hashable):
+            raise HomeAssistantError(f"Value {value} for {data_key} is not hashable")
+
+        lookup = (event_type, data_key)
+        if (keyed_listeners := self._keyed_listeners.get(lookup)) is None:
+            keyed_listeners = _KeyedListeners(self._hass, data_key, {})
+            keyed_listeners.remove = self._async_listen_filterable_job(
+                event_type,
+                (
+                    HassJob(
+                        keyed_listeners,
+                        f"keyed listen {event_type} {data_key}",
+                        job_type=HassJobType.Callback,
+                    ),
+                    keyed_listeners.async_filter,
+                ),
+            )
+            self._keyed_listeners[lookup] = keyed_listeners
+
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {data_key}={value}"),
+            event_filter,
+        )
+        keyed_listeners.callbacks.setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, lookup, value, filterable_job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        lookup: tuple[EventType[_DataT] | str, str],
+        value: Hashable,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[lookup]
+            jobs = keyed_listeners.callbacks[value]
+            jobs.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+
+        if not jobs:
+            del keyed_listeners.callbacks[value]
+        if not keyed_listeners.callbacks:
+            del self._keyed_listeners[lookup]
+            if keyed_listeners.remove:
+                keyed_listeners.remove()
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -2282,6 +2413,43 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities in one pass.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All updates share the same context and timestamp, which avoids
+        creating a context and converting the timestamp for each update.
+        The events for the updates are fired back to back so consumers
+        such as the recorder and the websocket api receive them together.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        now = dt_util.utc_from_timestamp(timestamp)
+        set_internal = self.async_set_internal
+        for entity_id, new_state, attributes in states:
+            set_internal(
+                entity_id.lower(),
+                str(new_state),
+                attributes or {},
+                force_update,
+                context,
+                None,
+                timestamp,
+                now,
+            )
+
     @callback
     def async_set_internal(
         self,
@@ -2292,9 +2460,12 @@ class StateMachine:
         context: Context | None,
         state_info: StateInfo | None,
         timestamp: float,
+        now: datetime.datetime | None = None,
     ) -> None:
         """Set the state of an entity, add entity if it does not exist.
 
+        If now is passed, it must be the utc datetime of timestamp.
+
         This method is intended to only be used by core internally
         and should not be considered a stable API. We will make
         breaking changes to this function in the future and it
@@ -2330,7 +2501,8 @@ class StateMachine:
         # timestamp implementation:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+        if now is None:
+            now = dt_util.utc_from_timestamp(timestamp)
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
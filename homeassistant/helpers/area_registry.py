@@ -21,7 +21,7 @@ from .normalized_name_base_registry import (
     NormalizedNameBaseRegistryEntry,
     NormalizedNameBaseRegistryItems,
 )
-from .registry import BaseRegistry, RegistryIndexType
+from .registry import BaseRegistry, RegistryIndexType, snapshot_dispatch_table
 from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
@@ -107,6 +107,9 @@ class AreaEntry(NormalizedNameBaseRegistryEntry):
         )
 
 
+_SNAPSHOT_DISPATCH_TABLE = snapshot_dispatch_table({AreaEntry: {}})
+
+
 class AreaRegistryStore(Store[AreasRegistryStoreData]):
     """Store area registry data."""
 
@@ -406,6 +409,14 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
         """Load the area registry."""
         self._async_setup_cleanup()
 
+        self._store.async_set_snapshot_func(
+            self._data_to_snapshot, _SNAPSHOT_DISPATCH_TABLE
+        )
+        if (snapshot := await self._store.async_load_snapshot()) is not None:
+            self.areas = snapshot
+            self._area_data = self.areas.data
+            return
+
         data = await self._store.async_load()
 
         areas = AreaRegistryItems()
@@ -430,6 +441,11 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
         self.areas = areas
         self._area_data = areas.data
 
+    @callback
+    def _data_to_snapshot(self) -> AreaRegistryItems:
+        """Return the loaded areas to snapshot."""
+        return self.areas
+
     @callback
     def _data_to_save(self) -> AreasRegistryStoreData:
         """Return data of area registry to store in a file."""
@@ -34,7 +34,12 @@ from . import storage, translation
 from .debounce import Debouncer
 from .frame import ReportBehavior, report_usage
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import (
+    BaseRegistry,
+    BaseRegistryItems,
+    RegistryIndexType,
+    snapshot_dispatch_table,
+)
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -448,6 +453,15 @@ def format_mac(mac: str) -> str:
     return mac
 
 
+_SNAPSHOT_DISPATCH_TABLE = snapshot_dispatch_table(
+    {
+        # Not stored, so they are reset when the registry is loaded
+        DeviceEntry: {"is_new": False, "suggested_area": None},
+        DeletedDeviceEntry: {},
+    }
+)
+
+
 class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
@@ -639,6 +653,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
@@ -1133,6 +1148,14 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         """Load the device registry."""
         async_setup_cleanup(self.hass, self)
 
+        self._store.async_set_snapshot_func(
+            self._data_to_snapshot, _SNAPSHOT_DISPATCH_TABLE
+        )
+        if (snapshot := await self._store.async_load_snapshot()) is not None:
+            self.devices, self.deleted_devices = snapshot
+            self._device_data = self.devices.data
+            return
+
         data = await self._store.async_load()
 
         devices = ActiveDeviceRegistryItems()
@@ -1194,6 +1217,13 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         self.deleted_devices = deleted_devices
         self._device_data = devices.data
 
+    @callback
+    def _data_to_snapshot(
+        self,
+    ) -> tuple[ActiveDeviceRegistryItems, DeviceRegistryItems[DeletedDeviceEntry]]:
+        """Return the loaded devices to snapshot."""
+        return self.devices, self.deleted_devices
+
     @callback
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of device registry to store in a file."""
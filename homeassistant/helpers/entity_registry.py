@@ -59,7 +59,12 @@ from .device_registry import (
     EventDeviceRegistryUpdatedData,
 )
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import (
+    BaseRegistry,
+    BaseRegistryItems,
+    RegistryIndexType,
+    snapshot_dispatch_table,
+)
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -438,6 +443,11 @@ class DeletedRegistryEntry:
         )
 
 
+_SNAPSHOT_DISPATCH_TABLE = snapshot_dispatch_table(
+    {RegistryEntry: {}, DeletedRegistryEntry: {}}
+)
+
+
 class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
@@ -724,6 +734,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1273,6 +1284,14 @@ class EntityRegistry(BaseRegistry):
         _async_setup_cleanup(self.hass, self)
         _async_setup_entity_restore(self.hass, self)
 
+        self._store.async_set_snapshot_func(
+            self._data_to_snapshot, _SNAPSHOT_DISPATCH_TABLE
+        )
+        if (snapshot := await self._store.async_load_snapshot()) is not None:
+            self.entities, self.deleted_entities = snapshot
+            self._entities_data = self.entities.data
+            return
+
         data = await self._store.async_load()
         entities = EntityRegistryItems()
         deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
@@ -1372,6 +1391,13 @@ class EntityRegistry(BaseRegistry):
         self.entities = entities
         self._entities_data = entities.data
 
+    @callback
+    def _data_to_snapshot(
+        self,
+    ) -> tuple[EntityRegistryItems, dict[tuple[str, str, str], DeletedRegistryEntry]]:
+        """Return the loaded entities to snapshot."""
+        return self.entities, self.deleted_entities
+
     @callback
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
@@ -75,6 +75,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TEMPLATE_REFRESH_SCHEDULER: HassKey[_TemplateRefreshScheduler] = HassKey(
+    "template_refresh_scheduler"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -971,6 +974,168 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRefreshScheduler:
+    """Coalesce template refreshes and run them in dependency order.
+
+    Trackers whose results write states (template entities) are learned
+    as the producers of those entities. A tracker is refreshed right away
+    when a state change makes it dirty, unless a producer of an entity it
+    depends on is notified of the same change. Then it is refreshed
+    together with the producer, after it, so each template in a chain
+    renders once per upstream change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._dirty: dict[TrackTemplateResultInfo, None] = {}
+        self._producers: dict[str, TrackTemplateResultInfo] = {}
+        self._running: TrackTemplateResultInfo | None = None
+        self._flushing = False
+        self._refreshed: set[TrackTemplateResultInfo] = set()
+        # The state change being dispatched and the trackers it refreshed
+        self._event: Event[EventStateChangedData] | None = None
+        self._event_refreshed: set[TrackTemplateResultInfo] = set()
+        self._deferred: dict[TrackTemplateResultInfo, None] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_written)
+
+    @callback
+    def async_schedule(
+        self, tracker: TrackTemplateResultInfo, event: Event[EventStateChangedData]
+    ) -> None:
+        """Mark a tracker dirty because of a state change and refresh it."""
+        if event is not self._event:
+            self._event = event
+            self._event_refreshed.clear()
+        if tracker in self._refreshed:
+            # Already refreshed in this flush, refresh it on the
+            # next iteration to avoid looping on cycles
+            self._deferred[tracker] = None
+        else:
+            self._dirty[tracker] = None
+        if self._flushing:
+            # Refreshed by the running flush
+            return
+        if self._async_awaits_producer(tracker, event.data["entity_id"]):
+            # Refreshed when the producer is, make sure it happens even
+            # if the producer does not get dirty
+            if self._flush_task is None:
+                self._async_schedule_flush()
+            return
+        self._async_flush()
+
+    @callback
+    def async_remove(self, tracker: TrackTemplateResultInfo) -> None:
+        """Remove a tracker from the scheduler."""
+        self._dirty.pop(tracker, None)
+        self._deferred.pop(tracker, None)
+        self._refreshed.discard(tracker)
+        for entity_id in [
+            entity_id
+            for entity_id, producer in self._producers.items()
+            if producer is tracker
+        ]:
+            del self._producers[entity_id]
+
+    @callback
+    def _async_state_written(self, event: Event[EventStateChangedData]) -> None:
+        """Learn the running tracker as the producer of the changed entity.
+
+        State changes are dispatched to the trackers on a later iteration
+        of the event loop, so the producer is learned when the state is
+        written.
+        """
+        if (running := self._running) is not None:
+            self._producers[event.data["entity_id"]] = running
+
+    @callback
+    def _async_awaits_producer(
+        self, tracker: TrackTemplateResultInfo, entity_id: str
+    ) -> bool:
+        """Return if a producer is still to be notified of the change to entity_id."""
+        dirty = self._dirty
+        refreshed = self._event_refreshed
+        return any(
+            producer is not tracker
+            and producer not in dirty
+            and producer not in refreshed
+            and tracker.async_depends_on(produced_entity_id)
+            and producer.async_depends_on(entity_id)
+            for produced_entity_id, producer in self._producers.items()
+        )
+
+    @callback
+    def _async_next_tracker(self) -> TrackTemplateResultInfo:
+        """Return the next dirty tracker none of the dirty trackers feed."""
+        dirty = self._dirty
+        dirty_producers = [
+            (entity_id, producer)
+            for entity_id, producer in self._producers.items()
+            if producer in dirty
+        ]
+        for tracker in dirty:
+            if not any(
+                producer is not tracker and tracker.async_depends_on(entity_id)
+                for entity_id, producer in dirty_producers
+            ):
+                return tracker
+        # There is a cycle, fall back to the order the trackers got dirty
+        return next(iter(dirty))
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Refresh the dirty trackers on the next iteration of the event loop.
+
+        The flush runs as a tracked task so waiting for Home Assistant
+        to be done also waits for the refreshes.
+        """
+        self._flush_task = self.hass.async_create_task_internal(
+            self._async_run_flush(), "template refresh", eager_start=False
+        )
+
+    async def _async_run_flush(self) -> None:
+        """Run the flush of the dirty trackers."""
+        self._flush_task = None
+        self._async_flush()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Refresh the dirty trackers."""
+        self._flushing = True
+        try:
+            while self._dirty:
+                tracker = self._async_next_tracker()
+                del self._dirty[tracker]
+                self._refreshed.add(tracker)
+                self._event_refreshed.add(tracker)
+                self._running = tracker
+                try:
+                    tracker.async_refresh_pending()
+                except Exception:
+                    _LOGGER.exception("Error while refreshing template %s", tracker)
+                finally:
+                    self._running = None
+        finally:
+            self._flushing = False
+            self._refreshed.clear()
+            if self._deferred:
+                self._dirty.update(self._deferred)
+                self._deferred.clear()
+                self._async_schedule_flush()
+
+
+@callback
+def _async_get_template_refresh_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRefreshScheduler:
+    """Return the template refresh scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_REFRESH_SCHEDULER)) is None:
+        scheduler = _TemplateRefreshScheduler(hass)
+        hass.data[_TEMPLATE_REFRESH_SCHEDULER] = scheduler
+    return scheduler
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -1002,6 +1167,8 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._scheduler = _async_get_template_refresh_scheduler(hass)
+        self._pending_events: dict[Template, Event[EventStateChangedData]] = {}
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1059,7 +1226,9 @@ class TrackTemplateResultInfo:
                     log_fn(logging.ERROR, str(info.exception))
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_schedule_refresh,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1117,6 +1286,8 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._scheduler.async_remove(self)
+        self._pending_events.clear()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1125,6 +1296,50 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_depends_on(self, entity_id: str) -> bool:
+        """Return if a change of entity_id re-renders any of the templates."""
+        return any(info.filter(entity_id) for info in self._info.values())
+
+    @callback
+    def _async_schedule_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a refresh of the templates the event re-renders."""
+        scheduled = False
+        for template, info in self._info.items():
+            if not _event_triggers_rerender(event, info):
+                continue
+            # Keep an event of a specifically referenced entity, those
+            # are excluded from the rate limit
+            pending = self._pending_events.get(template)
+            if pending is None or pending.data["entity_id"] not in info.entities:
+                self._pending_events[template] = event
+            scheduled = True
+        if scheduled:
+            self._scheduler.async_schedule(self, event)
+
+    @callback
+    def async_refresh_pending(self) -> None:
+        """Refresh the templates with pending state changes."""
+        if not (template_events := self._pending_events):
+            return
+        self._pending_events = {}
+        last_event = next(reversed(template_events.values()))
+        event_order = {template: idx for idx, template in enumerate(template_events)}
+        # Refresh the templates in the order the state changes happened,
+        # as separate refreshes for each state change would have done
+        self._refresh(
+            last_event,
+            track_templates=sorted(
+                (
+                    track_template_
+                    for track_template_ in self._track_templates
+                    if track_template_.template in event_order
+                ),
+                key=lambda track_template_: event_order[track_template_.template],
+            ),
+            template_events=template_events,
+        )
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1221,6 +1436,7 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        template_events: Mapping[Template, Event[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
@@ -1233,6 +1449,10 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        template_events optionally maps templates to the state_changed
+        event which caused them to be considered when the state changes
+        were coalesced, the other templates are considered for event.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
@@ -1245,7 +1465,11 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template,
+                now,
+                _event_for_template(event, template_events, super_template),
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1268,6 +1492,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                template_events = None
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1276,7 +1501,11 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_,
+                    now,
+                    _event_for_template(event, template_events, track_template_),
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1978,6 +2207,17 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+def _event_for_template(
+    event: Event[EventStateChangedData] | None,
+    template_events: Mapping[Template, Event[EventStateChangedData]] | None,
+    track_template_: TrackTemplate,
+) -> Event[EventStateChangedData] | None:
+    """Return the event a template is considered for."""
+    if template_events is None:
+        return event
+    return template_events.get(track_template_.template, event)
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
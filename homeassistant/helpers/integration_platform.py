@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from functools import partial
 import logging
@@ -14,6 +14,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import Event, HassJob, HomeAssistant, callback
 from homeassistant.loader import (
     Integration,
+    LazyPlatform,
     async_get_integrations,
     async_get_loaded_integration,
     async_register_preload_platform,
@@ -36,6 +37,7 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    lazy: bool = False
 
 
 @callback
@@ -67,30 +69,34 @@ def _async_integration_platform_component_loaded(
     if not platforms_that_exist:
         return
 
-    # If everything is already loaded, we can avoid creating a task.
-    can_use_cache = True
-    platforms: dict[str, ModuleType] = {}
+    # Lazy platforms and platforms which are already loaded can be
+    # processed without creating a task.
+    platforms: dict[str, ModuleType | LazyPlatform] = {}
+    platforms_to_load: list[str] = []
     for platform_name in platforms_that_exist:
-        if platform := integration.get_platform_cached(platform_name):
+        if integration_platforms_by_name[platform_name].lazy:
+            platforms[platform_name] = LazyPlatform(integration, platform_name)
+        elif platform := integration.get_platform_cached(platform_name):
             platforms[platform_name] = platform
         else:
-            can_use_cache = False
-            break
+            platforms_to_load.append(platform_name)
 
-    if can_use_cache:
+    if platforms:
         _process_integration_platforms(
             hass,
             integration,
             platforms,
             integration_platforms_by_name,
         )
+
+    if not platforms_to_load:
         return
 
     # At least one of the platforms is not loaded, we need to load them
     # so we have to fall back to creating a task.
     hass.async_create_task_internal(
         _async_process_integration_platforms_for_component(
-            hass, integration, platforms_that_exist, integration_platforms_by_name
+            hass, integration, platforms_to_load, integration_platforms_by_name
         ),
         eager_start=True,
     )
@@ -126,7 +132,7 @@ async def _async_process_integration_platforms_for_component(
 def _process_integration_platforms(
     hass: HomeAssistant,
     integration: Integration,
-    platforms: dict[str, ModuleType],
+    platforms: Mapping[str, ModuleType | LazyPlatform],
     integration_platforms_by_name: dict[str, IntegrationPlatform],
 ) -> list[asyncio.Future[Awaitable[None] | None]]:
     """Process integration platforms for a component.
@@ -160,8 +166,15 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    lazy: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    When lazy is set, the platforms are not imported before they are
+    processed. Instead a LazyPlatform is passed, which imports the platform
+    when it is first used. This avoids importing platforms which may never
+    be used, but process_platform must not use the platform right away.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,10 +188,11 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    # Tell the loader that it should try to pre-load the integration
-    # for any future components that are loaded so we can reduce the
-    # amount of import executor usage.
-    async_register_preload_platform(hass, platform_name)
+    if not lazy:
+        # Tell the loader that it should try to pre-load the integration
+        # for any future components that are loaded so we can reduce the
+        # amount of import executor usage.
+        async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -188,7 +202,7 @@ async def async_process_integration_platforms(
         f"process_platform {platform_name}",
     )
     integration_platform = IntegrationPlatform(
-        platform_name, process_job, top_level_components
+        platform_name, process_job, top_level_components, lazy
     )
     integration_platforms.append(integration_platform)
     if not top_level_components:
@@ -209,7 +223,7 @@ async def async_process_integration_platforms(
     #
     future = hass.async_create_task_internal(
         _async_process_integration_platforms(
-            hass, platform_name, top_level_components.copy(), process_job
+            hass, platform_name, top_level_components.copy(), process_job, lazy
         ),
         eager_start=True,
     )
@@ -222,6 +236,7 @@ async def _async_process_integration_platforms(
     platform_name: str,
     top_level_components: set[str],
     process_job: HassJob,
+    lazy: bool,
 ) -> None:
     """Process integration platforms for a component."""
     integrations = await async_get_integrations(hass, top_level_components)
@@ -238,15 +253,20 @@ async def _async_process_integration_platforms(
     for integration in loaded_integrations:
         if not integration.platforms_exists((platform_name,)):
             continue
-        try:
-            platform = await integration.async_get_platform(platform_name)
-        except ImportError:
-            _LOGGER.debug(
-                "Unexpected error importing %s for %s",
-                platform_name,
-                integration.domain,
+        if lazy:
+            platform: ModuleType | LazyPlatform = LazyPlatform(
+                integration, platform_name
             )
-            continue
+        else:
+            try:
+                platform = await integration.async_get_platform(platform_name)
+            except ImportError:
+                _LOGGER.debug(
+                    "Unexpected error importing %s for %s",
+                    platform_name,
+                    integration.domain,
+                )
+                continue
 
         if future := hass.async_run_hass_job(
             process_job, hass, integration.domain, platform
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Callable, Mapping, Sequence, ValuesView
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 if TYPE_CHECKING:
     from .storage import Store
@@ -18,6 +20,64 @@ SAVE_DELAY_LONG = 180
 type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
 
+@cache
+def _snapshot_fields(entry_type: type) -> tuple[str, ...]:
+    """Return the fields of a slotted registry entry type to snapshot."""
+    return tuple(
+        name
+        for cls in entry_type.__mro__
+        for name in getattr(cls, "__slots__", ())
+        if name != "__weakref__"
+    )
+
+
+def _restore_snapshot_entry(entry_type: type, values: dict[str, Any]) -> Any:
+    """Restore a registry entry from a snapshot without converting its values."""
+    entry: Any = object.__new__(entry_type)
+    for name, value in values.items():
+        object.__setattr__(entry, name, value)
+    return entry
+
+
+def _reduce_snapshot_entry(
+    defaults: dict[str, Any], entry: Any
+) -> tuple[Callable[[type, dict[str, Any]], Any], tuple[type, dict[str, Any]]]:
+    """Reduce a registry entry to the values which are stored."""
+    entry_type: type = type(entry)
+    # The cache may hold values which can't be pickled, like json fragments
+    values = {
+        name: {} if name == "_cache" else getattr(entry, name)
+        for name in _snapshot_fields(entry_type)
+    }
+    values.update(defaults)
+    return _restore_snapshot_entry, (entry_type, values)
+
+
+def _reduce_read_only_dict(
+    value: ReadOnlyDict[Any, Any],
+) -> tuple[type[ReadOnlyDict[Any, Any]], tuple[dict[Any, Any]]]:
+    """Reduce a read only dict, which can't be filled by the unpickler."""
+    return ReadOnlyDict, (dict(value),)
+
+
+def snapshot_dispatch_table(
+    entry_types: Mapping[type, dict[str, Any]],
+) -> dict[type, Callable[[Any], Any]]:
+    """Return the reducers to snapshot registry entries of the entry types.
+
+    The entry types are mapped to the values of the fields which are not
+    stored, which the entries get when they are restored like they do when
+    loaded from storage.
+    """
+    return {
+        ReadOnlyDict: _reduce_read_only_dict,
+        **{
+            entry_type: partial(_reduce_snapshot_entry, defaults)
+            for entry_type, defaults in entry_types.items()
+        },
+    }
+
+
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     """Base class for registry items."""
 
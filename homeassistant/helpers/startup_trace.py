@@ -0,0 +1,382 @@
+"""Trace of the setup of the integrations during startup."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Generator, Iterable
+import contextlib
+from dataclasses import dataclass, field
+import sys
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STARTUP_TRACE: HassKey[StartupTrace] = HassKey("startup_trace")
+
+STARTUP_TRACE_FILE = "startup_trace.json"
+
+# The loader can't use the setup phases as the setup module imports it
+IMPORT_PLATFORMS_PHASE = "import_platforms"
+
+
+@dataclass(slots=True, frozen=True)
+class StartupTraceSpan:
+    """A phase of the setup of an integration."""
+
+    domain: str
+    phase: str
+    group: str | None
+    start: float
+    end: float
+
+
+@dataclass(slots=True, frozen=True)
+class StartupTraceImport:
+    """The import of a module of an integration."""
+
+    module: str
+    thread: str
+    start: float
+    end: float
+
+
+@dataclass(slots=True)
+class StartupTraceStage:
+    """A bootstrap stage."""
+
+    name: str
+    domains: set[str]
+    start: float
+    end: float | None = None
+
+
+@dataclass(slots=True)
+class StartupTrace:
+    """Trace of the setup of the integrations during startup.
+
+    The trace holds when each phase of the setup of an integration started
+    and finished, which integrations it waited for and when the bootstrap
+    stages ran. This is enough to find the critical path, which is the
+    chain of setups that determined how long the startup took.
+    """
+
+    start: float = field(default_factory=time.monotonic)
+    end: float | None = None
+    spans: list[StartupTraceSpan] = field(default_factory=list)
+    stages: list[StartupTraceStage] = field(default_factory=list)
+    waited_for: defaultdict[str, set[str]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+    imports: list[StartupTraceImport] = field(default_factory=list)
+
+    @callback
+    def async_add_span(
+        self, domain: str, phase: str, group: str | None, start: float, end: float
+    ) -> None:
+        """Add a phase of the setup of an integration."""
+        self.spans.append(StartupTraceSpan(domain, phase, group, start, end))
+
+    @callback
+    def async_add_waited_for(self, domain: str, dependencies: Iterable[str]) -> None:
+        """Add the integrations the setup of an integration waited for."""
+        self.waited_for[domain].update(dependencies)
+
+    def add_import(self, module: str, start: float, end: float) -> None:
+        """Add the import of a module, this method is thread-safe."""
+        self.imports.append(
+            StartupTraceImport(module, threading.current_thread().name, start, end)
+        )
+
+    def _domain_times(self) -> dict[str, tuple[float, float]]:
+        """Return when the setup of each integration started and finished."""
+        times: dict[str, tuple[float, float]] = {}
+        for span in self.spans:
+            if (current := times.get(span.domain)) is None:
+                times[span.domain] = (span.start, span.end)
+            else:
+                times[span.domain] = (
+                    min(current[0], span.start),
+                    max(current[1], span.end),
+                )
+        return times
+
+    def _domain_stages(self, times: dict[str, tuple[float, float]]) -> dict[str, str]:
+        """Return the stage each integration started its setup in."""
+        stages: dict[str, str] = {}
+        for domain, (start, _) in times.items():
+            for stage in self.stages:
+                if stage.start <= start:
+                    stages[domain] = stage.name
+        return stages
+
+    def critical_path(self) -> list[str]:
+        """Return the integrations on the critical path in the order of setup.
+
+        The path ends with the integration which finished last. Each
+        integration is preceded by the integration it waited for which
+        finished last, either a dependency or, when its stage started after
+        the setup of a dependency finished, the integration which held up
+        the previous stage.
+        """
+        if not (times := self._domain_times()):
+            return []
+        path = [max(times, key=lambda domain: times[domain][1])]
+        while True:
+            start = times[path[-1]][0]
+            candidates = [
+                dependency
+                for dependency in self.waited_for.get(path[-1], ())
+                if dependency in times
+            ]
+            stage_start = max(
+                (stage.start for stage in self.stages if stage.start <= start),
+                default=None,
+            )
+            if stage_start is not None:
+                candidates.extend(
+                    domain for domain, (_, end) in times.items() if end <= stage_start
+                )
+            candidates = [domain for domain in candidates if domain not in path]
+            if not candidates:
+                break
+            path.append(max(candidates, key=lambda domain: times[domain][1]))
+        path.reverse()
+        return path
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a report of the trace with times relative to its start."""
+        times = self._domain_times()
+        stages = self._domain_stages(times)
+        spans: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for span in self.spans:
+            spans[span.domain].append(
+                {
+                    "phase": span.phase,
+                    "group": span.group,
+                    "start": span.start - self.start,
+                    "end": span.end - self.start,
+                }
+            )
+        critical_path: list[dict[str, Any]] = []
+        previous_end = self.start
+        for domain in self.critical_path():
+            start, end = times[domain]
+            critical_path.append(
+                {
+                    "domain": domain,
+                    "stage": stages.get(domain),
+                    "start": start - self.start,
+                    "end": end - self.start,
+                    "duration": end - max(start, previous_end),
+                }
+            )
+            previous_end = end
+        return {
+            "duration": None if self.end is None else self.end - self.start,
+            "stages": [
+                {
+                    "name": stage.name,
+                    "domains": sorted(stage.domains),
+                    "start": stage.start - self.start,
+                    "end": None if stage.end is None else stage.end - self.start,
+                }
+                for stage in self.stages
+            ],
+            "integrations": {
+                domain: {
+                    "stage": stages.get(domain),
+                    "start": start - self.start,
+                    "end": end - self.start,
+                    "waited_for": sorted(self.waited_for.get(domain, ())),
+                    "spans": spans[domain],
+                }
+                for domain, (start, end) in sorted(
+                    times.items(), key=lambda item: item[1]
+                )
+            },
+            "critical_path": critical_path,
+            "imports": [
+                {
+                    "module": module_import.module,
+                    "thread": module_import.thread,
+                    "start": module_import.start - self.start,
+                    "duration": module_import.end - module_import.start,
+                }
+                for module_import in sorted(
+                    self.imports,
+                    key=lambda module_import: module_import.start - module_import.end,
+                )
+            ],
+        }
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format.
+
+        Every integration gets its own track, the bootstrap stages are
+        shown on the first track.
+        """
+        critical_path = set(self.critical_path())
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 0,
+                "args": {"name": "bootstrap"},
+            }
+        ]
+        events.extend(
+            {
+                "name": stage.name,
+                "cat": "stage",
+                "ph": "X",
+                "pid": 1,
+                "tid": 0,
+                "ts": (stage.start - self.start) * 1e6,
+                "dur": ((stage.end or stage.start) - stage.start) * 1e6,
+            }
+            for stage in self.stages
+        )
+        tids: dict[str, int] = {}
+        for span in sorted(self.spans, key=lambda span: span.start):
+            if (tid := tids.get(span.domain)) is None:
+                tid = tids[span.domain] = len(tids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": span.domain},
+                    }
+                )
+            events.append(
+                {
+                    "name": f"{span.domain} {span.phase}",
+                    "cat": "setup",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": (span.start - self.start) * 1e6,
+                    "dur": (span.end - span.start) * 1e6,
+                    "args": {
+                        "group": span.group,
+                        "critical_path": span.domain in critical_path,
+                    },
+                }
+            )
+        # The imports are shown on a track per thread to show if they overlap
+        threads: dict[str, int] = {}
+        for module_import in self.imports:
+            if (tid := threads.get(module_import.thread)) is None:
+                tid = threads[module_import.thread] = len(tids) + len(threads) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": f"import {module_import.thread}"},
+                    }
+                )
+            events.append(
+                {
+                    "name": module_import.module,
+                    "cat": "import",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": (module_import.start - self.start) * 1e6,
+                    "dur": (module_import.end - module_import.start) * 1e6,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+@callback
+def async_start_startup_trace(hass: HomeAssistant) -> None:
+    """Start tracing the setup of the integrations."""
+    hass.data[DATA_STARTUP_TRACE] = StartupTrace()
+
+
+@callback
+def async_finish_startup_trace(hass: HomeAssistant) -> None:
+    """Stop tracing the setup of the integrations."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is not None:
+        trace.end = time.monotonic()
+
+
+@callback
+def async_get_startup_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace, if startup was traced."""
+    return hass.data.get(DATA_STARTUP_TRACE)
+
+
+def _get_active_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace while startup is traced, this is thread-safe."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is None or trace.end is not None:
+        return None
+    return trace
+
+
+@callback
+def async_trace_waited_for(
+    hass: HomeAssistant, domain: str, dependencies: Iterable[str]
+) -> None:
+    """Record the integrations the setup of an integration waited for."""
+    if (trace := _get_active_trace(hass)) is not None:
+        trace.async_add_waited_for(domain, dependencies)
+
+
+@contextlib.contextmanager
+def async_trace_setup(
+    hass: HomeAssistant, domain: str, phase: str, group: str | None = None
+) -> Generator[None]:
+    """Record a phase of the setup of an integration during startup."""
+    if _get_active_trace(hass) is None:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        # The trace may have finished while the phase ran
+        if (trace := _get_active_trace(hass)) is not None:
+            trace.async_add_span(domain, phase, group, start, time.monotonic())
+
+
+@contextlib.contextmanager
+def trace_import(hass: HomeAssistant, module: str) -> Generator[None]:
+    """Record the import of a module during startup.
+
+    This method is thread-safe. Modules which are already imported are not
+    recorded.
+    """
+    if module in sys.modules or _get_active_trace(hass) is None:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        if (trace := _get_active_trace(hass)) is not None:
+            trace.add_import(module, start, time.monotonic())
+
+
+@contextlib.contextmanager
+def async_trace_stage(
+    hass: HomeAssistant, name: str, domains: Iterable[str]
+) -> Generator[None]:
+    """Record a bootstrap stage."""
+    if (trace := _get_active_trace(hass)) is None:
+        yield
+        return
+    stage = StartupTraceStage(name, set(domains), time.monotonic())
+    trace.stages.append(stage)
+    try:
+        yield
+    finally:
+        stage.end = time.monotonic()
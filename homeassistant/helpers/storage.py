@@ -6,12 +6,16 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+import copyreg
+from dataclasses import dataclass
 import inspect
+import io
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+import pickle
+from typing import Any, cast
 
 from propcache import cached_property
 
@@ -19,6 +23,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -32,8 +37,9 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -49,6 +55,17 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The key identifying the items of the lists in a journaled document
+JOURNAL_ITEM_KEY = "id"
+# The journal is compacted into the document once it has grown
+# larger than this share of the document
+JOURNAL_COMPACT_RATIO = 0.5
+
+SNAPSHOT_SUFFIX = ".snapshot"
+# Bump when the format of the snapshots changes
+SNAPSHOT_VERSION = 1
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -227,6 +244,240 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+def _encode_journal_item(item: Any) -> tuple[str | int, bytes] | None:
+    """Return the key and the encoded form of an item of a journaled list."""
+    try:
+        raw = json_helper.json_bytes(item)
+    except TypeError:
+        return None
+    decoded = item if isinstance(item, Mapping) else json_util.json_loads(raw)
+    if not isinstance(decoded, Mapping) or not isinstance(
+        key := decoded.get(JOURNAL_ITEM_KEY), str | int
+    ):
+        return None
+    return key, raw
+
+
+@dataclass(slots=True)
+class _JournalSection:
+    """The items of a list in a journaled document."""
+
+    # Key of the item to the item and the hash of its encoded form
+    items: dict[str | int, tuple[Any, int]]
+    # Identity of the item to the key of the item
+    keys: dict[int, str | int]
+
+
+class _StoreJournal:
+    """Journal of the changes to a stored document.
+
+    The data of a journaled store is a dict of lists of items which
+    are identified by their "id". Once the document has been written
+    in full, a write only appends the items which were added, changed
+    or removed since to the journal, which is replayed when the
+    document is loaded. The journal is compacted into the document
+    by the first write after a load, once it has grown too large and
+    on the final write when Home Assistant stops.
+
+    Items which are the same object as in the last write are not
+    encoded again, so lists of cached json fragments like the entries
+    of the registries are cheap to compare.
+
+    The journal is written from the executor and the writes are
+    serialized by the write lock of the store.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the journal."""
+        self._journal_id: str | None = None
+        self._sections: dict[str, _JournalSection] = {}
+        self._values: dict[str, int] = {}
+        self._document_size = 0
+        self._journal_size = 0
+        self.last_data: dict[str, Any] | None = None
+
+    @property
+    def has_changes(self) -> bool:
+        """Return if changes were appended since the last compaction."""
+        return self._journal_size > 0
+
+    @callback
+    def async_request_compaction(self) -> None:
+        """Compact the journal on the next write."""
+        self._journal_id = None
+
+    def load(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Replay the journal on the loaded document."""
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return data
+        try:
+            header = json_util.json_loads_object(lines[0]) if lines else {}
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            header = {}
+        if not (journal_id := header.get("journal_id")) or journal_id != data.get(
+            "journal_id"
+        ):
+            # The journal was written for an older document, which means
+            # its changes were compacted into the document
+            return data
+
+        document = data["data"]
+        sections: dict[str, dict[str | int, Any]] = {}
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads_object(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # A change which was being appended when Home Assistant stopped
+                _LOGGER.warning("Ignoring an incomplete change in %s", path)
+                break
+            name = cast(str, record["s"])
+            if (items := sections.get(name)) is None:
+                items = sections[name] = {
+                    item[JOURNAL_ITEM_KEY]: item for item in document.get(name, ())
+                }
+            key = cast(str | int, record["k"])
+            if "v" in record:
+                items[key] = record["v"]
+            else:
+                items.pop(key, None)
+        for name, items in sections.items():
+            document[name] = list(items.values())
+        return data
+
+    def write(
+        self,
+        path: str,
+        data: dict[str, Any],
+        save: Callable[[str, dict[str, Any]], None],
+        sync: bool,
+    ) -> None:
+        """Write the changes of the document to the journal.
+
+        The whole document is written by save instead if the journal
+        needs to be compacted or the document can not be journaled.
+        """
+        data.pop("journal_id", None)
+        self.last_data = data
+        if (
+            self._journal_id is None
+            or (state := self._diff(data["data"], True)) is None
+            or self._journal_size + len(state[2])
+            > self._document_size * JOURNAL_COMPACT_RATIO
+        ):
+            self._compact(path, data, save)
+            return
+
+        sections, values, records = state
+        if records:
+            try:
+                with open(f"{path}{JOURNAL_SUFFIX}", "ab") as fdesc:
+                    fdesc.write(records)
+                    if sync:
+                        fdesc.flush()
+                        os.fsync(fdesc.fileno())
+            except OSError as err:
+                # The journal may end with a partial change now
+                self._journal_id = None
+                raise WriteError(err) from err
+            self._journal_size += len(records)
+        self._sections = sections
+        self._values = values
+
+    def _compact(
+        self,
+        path: str,
+        data: dict[str, Any],
+        save: Callable[[str, dict[str, Any]], None],
+    ) -> None:
+        """Write the whole document and start a new journal."""
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        self._journal_id = None
+        if (state := self._diff(data["data"], False)) is None:
+            # Not a dict of lists of items with an id, write it in full
+            save(path, data)
+            with suppress(FileNotFoundError):
+                os.unlink(journal_path)
+            return
+
+        journal_id = random_uuid_hex()
+        data["journal_id"] = journal_id
+        save(path, data)
+        # A journal left over if this is interrupted is ignored when
+        # loading since its id does not match the document
+        header = json_helper.json_bytes({"journal_id": journal_id}) + b"\n"
+        try:
+            with open(journal_path, "wb") as fdesc:
+                fdesc.write(header)
+        except OSError as err:
+            raise WriteError(err) from err
+        self._sections, self._values, _ = state
+        self._document_size = os.path.getsize(path)
+        self._journal_size = 0
+        self._journal_id = journal_id
+
+    def _diff(
+        self, document: Any, with_records: bool
+    ) -> tuple[dict[str, _JournalSection], dict[str, int], bytes] | None:
+        """Return the state of the document and its changes since the last write.
+
+        Returns None if the document can not be journaled or, when the
+        changes are requested, if other values than the lists changed.
+        """
+        if not isinstance(document, Mapping):
+            return None
+        sections: dict[str, _JournalSection] = {}
+        values: dict[str, int] = {}
+        records: list[bytes] = []
+        for name, value in document.items():
+            if not isinstance(value, list):
+                try:
+                    values[name] = hash(json_helper.json_bytes(value))
+                except TypeError:
+                    return None
+                continue
+            prev = self._sections.get(name) if with_records else None
+            if with_records and prev is None:
+                return None
+            section = sections[name] = _JournalSection({}, {})
+            for item in value:
+                if (
+                    prev is not None
+                    and (key := prev.keys.get(id(item))) is not None
+                    and prev.items[key][0] is item
+                ):
+                    section.items[key] = prev.items[key]
+                    section.keys[id(item)] = key
+                    continue
+                if (encoded := _encode_journal_item(item)) is None:
+                    return None
+                key, raw = encoded
+                if key in section.items:
+                    return None
+                entry = section.items[key] = (item, hash(raw))
+                section.keys[id(item)] = key
+                if prev is not None and (
+                    (old := prev.items.get(key)) is None or old[1] != entry[1]
+                ):
+                    records.append(
+                        json_helper.json_bytes(
+                            {"s": name, "k": key, "v": json_helper.json_fragment(raw)}
+                        )
+                    )
+            if prev is not None:
+                records.extend(
+                    json_helper.json_bytes({"s": name, "k": key})
+                    for key in prev.items.keys() - section.items.keys()
+                )
+        if with_records and (
+            values != self._values or sections.keys() != self._sections.keys()
+        ):
+            return None
+        return sections, values, b"".join(record + b"\n" for record in records)
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -242,8 +493,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set and no encoder is passed, changes to the items
+        of the lists in the data are appended to a journal instead of
+        writing the whole data each time.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,6 +516,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = _StoreJournal() if journal and encoder is None else None
+        self._snapshot: (
+            tuple[Callable[[], Any], Mapping[type, Callable[[Any], Any]]] | None
+        ) = None
 
     @cached_property
     def path(self):
@@ -388,6 +649,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if self._data is None and self._journal is not None:
+            data = await self.hass.async_add_executor_job(
+                self._journal.load, self.path, data
+            )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -518,7 +784,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if (journal := self._journal) is not None and journal.has_changes:
+            # Leave a complete document behind when stopping
+            journal.async_request_compaction()
+            if self._data is None:
+                self._data = journal.last_data
         await self._async_handle_write_data()
+        self._async_cleanup_final_write_listener()
+        if self._snapshot is not None and not self._read_only:
+            snapshot_func, dispatch_table = self._snapshot
+            await self._async_write_snapshot(snapshot_func(), dispatch_table)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -542,6 +817,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._snapshot is not None or (
+                self._journal is not None and self._journal.has_changes
+            ):
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -552,7 +832,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal is not None:
+            _LOGGER.debug("Writing changes for %s to %s", self.key, path)
+            self._journal.write(path, data, self._save_data, self._atomic_writes)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        self._save_data(path, data)
+
+    def _save_data(self, path: str, data: dict) -> None:
+        """Save the whole data."""
         json_helper.save_json(
             path,
             data,
@@ -561,6 +850,92 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+    @callback
+    def async_set_snapshot_func(
+        self,
+        snapshot_func: Callable[[], Any],
+        dispatch_table: Mapping[type, Callable[[Any], Any]],
+    ) -> None:
+        """Write a snapshot of the loaded data on the final write.
+
+        The objects returned by snapshot_func are pickled with the reducers
+        in dispatch_table, so loading them is cheaper than building them from
+        the stored data again. async_load_snapshot only returns the snapshot
+        as long as the stored data has not been written since.
+        """
+        self._snapshot = (snapshot_func, dispatch_table)
+        self._async_ensure_final_write_listener()
+
+    async def async_load_snapshot(self) -> Any | None:
+        """Load the snapshot written on the last final write.
+
+        Returns None if there is no snapshot, or if the stored data or
+        Home Assistant changed since it was written.
+        """
+        return await self.hass.async_add_executor_job(self._load_snapshot)
+
+    def _snapshot_header(self) -> dict[str, Any]:
+        """Return the header which identifies the stored data of a snapshot."""
+        files: list[list[int] | None] = []
+        for path in (self.path, f"{self.path}{JOURNAL_SUFFIX}"):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                files.append(None)
+            else:
+                files.append([stat.st_ino, stat.st_mtime_ns, stat.st_size])
+        return {
+            "snapshot_version": SNAPSHOT_VERSION,
+            "ha_version": HA_VERSION,
+            "version": self.version,
+            "minor_version": self.minor_version,
+            "files": files,
+        }
+
+    def _load_snapshot(self) -> Any | None:
+        """Load the snapshot if it matches the stored data."""
+        try:
+            with open(f"{self.path}{SNAPSHOT_SUFFIX}", "rb") as fdesc:
+                content = fdesc.read()
+        except FileNotFoundError:
+            return None
+        header_end = content.find(b"\n")
+        try:
+            if json_util.json_loads(content[:header_end]) != self._snapshot_header():
+                _LOGGER.debug("%s: Snapshot is stale", self.key)
+                return None
+            return pickle.loads(memoryview(content)[header_end + 1 :])
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("%s: Snapshot could not be loaded: %s", self.key, err)
+            return None
+
+    async def _async_write_snapshot(
+        self, data: Any, dispatch_table: Mapping[type, Callable[[Any], Any]]
+    ) -> None:
+        """Write a snapshot of the data."""
+        await self.hass.async_add_executor_job(
+            self._write_snapshot, data, dispatch_table
+        )
+
+    def _write_snapshot(
+        self, data: Any, dispatch_table: Mapping[type, Callable[[Any], Any]]
+    ) -> None:
+        """Write a snapshot of the data."""
+        buffer = io.BytesIO()
+        buffer.write(json_helper.json_bytes(self._snapshot_header()) + b"\n")
+        pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+        pickler.dispatch_table = {**copyreg.dispatch_table, **dispatch_table}
+        try:
+            pickler.dump(data)
+            write_utf8_file(
+                f"{self.path}{SNAPSHOT_SUFFIX}",
+                buffer.getvalue(),
+                self._private,
+                mode="wb",
+            )
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Error writing snapshot for %s: %s", self.key, err)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +948,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            self._journal.async_request_compaction()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
@@ -12,9 +12,13 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+import importlib.util
 import json
 import logging
+import marshal
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -22,6 +26,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -58,6 +63,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -94,6 +100,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -114,6 +121,11 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -166,6 +178,7 @@ EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
+FAST_RENDER_CACHE_SIZE = 512
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -510,6 +523,7 @@ class Template:
         "_compiled",
         "_compiled_code",
         "_exc_info",
+        "_fast_render",
         "_hash_cache",
         "_limited",
         "_log_fn",
@@ -542,6 +556,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_render: _FastRender | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: OptExcInfo | None = None
@@ -640,7 +655,12 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (fast_render := self._fast_render) is not None and (
+                not kwargs or fast_render.names.isdisjoint(kwargs)
+            ):
+                render_result = _render_fast_with_context(self.template, fast_render)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -861,6 +881,10 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        # Limited templates rarely use the state machine, they are not
+        # worth parsing a second time
+        if not limited:
+            self._fast_render = env.get_fast_render(self.template)
 
         return self._compiled
 
@@ -2750,6 +2774,229 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _render_fast_with_context(template_str: str, fast_render: _FastRender) -> str:
+    """Store template being rendered in a ContextVar to aid error handling."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return fast_render.render()
+
+
+class _NotFastRenderable(Exception):
+    """Raised when a template uses more than the fast render subset."""
+
+
+class _FastRender:
+    """A simple template compiled to Python closures.
+
+    The closures call the same globals, filters and sandbox attribute
+    lookups jinja uses, so the result and the collected render info
+    match rendering the template with jinja.
+    """
+
+    __slots__ = ("names", "render")
+
+    def __init__(self, names: frozenset[str], render: Callable[[], str]) -> None:
+        """Initialize the fast render."""
+        self.names = names
+        self.render = render
+
+
+# Globals which may be called and filters which may be applied in
+# templates rendered without jinja
+_FAST_RENDER_FUNCTIONS = frozenset(
+    {"float", "has_value", "is_state", "is_state_attr", "state_attr", "states"}
+)
+_FAST_RENDER_FILTERS = frozenset({"abs", "bool", "float", "int", "round"})
+_FAST_RENDER_BINARY_OPERATORS: dict[type[jinja2.nodes.BinExpr], Callable] = {
+    jinja2.nodes.Add: operator.add,
+    jinja2.nodes.Sub: operator.sub,
+    jinja2.nodes.Mul: operator.mul,
+    jinja2.nodes.Div: operator.truediv,
+    jinja2.nodes.FloorDiv: operator.floordiv,
+    jinja2.nodes.Mod: operator.mod,
+}
+_FAST_RENDER_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
+
+
+def _compile_fast_render(
+    env: TemplateEnvironment, template: jinja2.nodes.Template
+) -> _FastRender:
+    """Compile a template consisting of a single output to a fast render.
+
+    Raises _NotFastRenderable if the template uses anything else than
+    constants, lists, globals, attribute and item lookups, the fast render
+    functions and filters, arithmetic, comparisons and boolean logic.
+    """
+    if len(template.body) != 1 or not isinstance(
+        output := template.body[0], jinja2.nodes.Output
+    ):
+        raise _NotFastRenderable
+    names: set[str] = set()
+    parts: list[Callable[[], Any]] = []
+    for node in output.nodes:
+        if isinstance(node, jinja2.nodes.TemplateData):
+            parts.append(partial(str, node.data))
+        else:
+            parts.append(_compile_fast_expression(env, node, names))
+
+    if len(parts) == 1:
+        part = parts[0]
+
+        def _render() -> str:
+            return str(part())
+
+    else:
+
+        def _render() -> str:
+            return "".join([str(part()) for part in parts])
+
+    return _FastRender(frozenset(names), _render)
+
+
+def _compile_fast_expression(  # noqa: C901
+    env: TemplateEnvironment, node: jinja2.nodes.Node, names: set[str]
+) -> Callable[[], Any]:
+    """Compile an expression of a simple template to a closure."""
+    nodes = jinja2.nodes
+    if isinstance(node, nodes.Const):
+        return partial(_identity, node.value)
+
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        items = [_compile_fast_expression(env, item, names) for item in node.items]
+        if isinstance(node, nodes.Tuple):
+            return lambda: tuple([item() for item in items])
+        return lambda: [item() for item in items]
+
+    if isinstance(node, nodes.Name):
+        if node.ctx != "load" or node.name not in env.globals:
+            raise _NotFastRenderable
+        names.add(node.name)
+        return partial(_identity, env.globals[node.name])
+
+    if isinstance(node, nodes.Getattr):
+        obj = _compile_fast_expression(env, node.node, names)
+        attr = node.attr
+        getattr_ = env.getattr
+        return lambda: getattr_(obj(), attr)
+
+    if isinstance(node, nodes.Getitem):
+        if not isinstance(node.arg, nodes.Const):
+            raise _NotFastRenderable
+        obj = _compile_fast_expression(env, node.node, names)
+        key = node.arg.value
+        getitem = env.getitem
+        return lambda: getitem(obj(), key)
+
+    if isinstance(node, nodes.Call):
+        if (
+            not isinstance(node.node, nodes.Name)
+            or node.node.name not in _FAST_RENDER_FUNCTIONS
+            or node.node.name not in env.globals
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _NotFastRenderable
+        names.add(node.node.name)
+        func = cast(Callable[..., Any], env.globals[node.node.name])
+        if getattr(func, "jinja_pass_arg", None) is not None:
+            # Functions depending on hass are context functions which
+            # do not use the context
+            func = partial(func, None)
+        args = [_compile_fast_expression(env, arg, names) for arg in node.args]
+        return lambda: func(*[arg() for arg in args])
+
+    if isinstance(node, nodes.Filter):
+        if (
+            node.node is None
+            or node.name not in _FAST_RENDER_FILTERS
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _NotFastRenderable
+        filter_ = env.filters[node.name]
+        value = _compile_fast_expression(env, node.node, names)
+        args = [_compile_fast_expression(env, arg, names) for arg in node.args]
+        return lambda: filter_(value(), *[arg() for arg in args])
+
+    if isinstance(node, nodes.And):
+        left = _compile_fast_expression(env, node.left, names)
+        right = _compile_fast_expression(env, node.right, names)
+        return lambda: left() and right()
+
+    if isinstance(node, nodes.Or):
+        left = _compile_fast_expression(env, node.left, names)
+        right = _compile_fast_expression(env, node.right, names)
+        return lambda: left() or right()
+
+    if isinstance(node, nodes.Not):
+        operand = _compile_fast_expression(env, node.node, names)
+        return lambda: not operand()
+
+    if isinstance(node, nodes.Neg):
+        operand = _compile_fast_expression(env, node.node, names)
+        return lambda: -operand()
+
+    if isinstance(node, nodes.BinExpr):
+        if (binary_operator := _FAST_RENDER_BINARY_OPERATORS.get(type(node))) is None:
+            raise _NotFastRenderable
+        left = _compile_fast_expression(env, node.left, names)
+        right = _compile_fast_expression(env, node.right, names)
+        return lambda: binary_operator(left(), right())
+
+    if isinstance(node, nodes.Compare):
+        expr = _compile_fast_expression(env, node.expr, names)
+        operands: list[tuple[Callable[[Any, Any], Any], Callable[[], Any]]] = []
+        for compare_operand in node.ops:
+            if (
+                compare := _FAST_RENDER_COMPARE_OPERATORS.get(compare_operand.op)
+            ) is None:
+                raise _NotFastRenderable
+            operands.append(
+                (compare, _compile_fast_expression(env, compare_operand.expr, names))
+            )
+        if len(operands) == 1:
+            compare, other = operands[0]
+            return lambda: compare(expr(), other())
+
+        def _compare_chain() -> Any:
+            left = expr()
+            result: Any = True
+            for compare, other in operands:
+                right = other()
+                if not (result := compare(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _compare_chain
+
+    if isinstance(node, nodes.CondExpr):
+        if node.expr2 is None:
+            raise _NotFastRenderable
+        test = _compile_fast_expression(env, node.test, names)
+        expr1 = _compile_fast_expression(env, node.expr1, names)
+        expr2 = _compile_fast_expression(env, node.expr2, names)
+        return lambda: expr1() if test() else expr2()
+
+    raise _NotFastRenderable
+
+
+def _identity(value: Any) -> Any:
+    """Return the value."""
+    return value
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2823,6 +3070,90 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+@cache
+def _bytecode_cache_version() -> str:
+    """Return the version the compiled templates depend on."""
+    return f"{HA_VERSION}-{jinja2.__version__}-{importlib.util.MAGIC_NUMBER.hex()}"
+
+
+def _bytecode_cache_key(source: str) -> str:
+    """Return the key of a template source in the bytecode cache."""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+class TemplateBytecodeCache:
+    """Persist the compiled code of templates between restarts.
+
+    The cache is keyed by the hash of the template source. It is dropped
+    when Home Assistant, Jinja or the Python bytecode format changes. The
+    stored code is only unmarshalled when a template is compiled, and
+    templates that were not compiled since the last start are dropped
+    when the cache is saved.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+        )
+        self._encoded: dict[str, str] = {}
+        self._used: dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache."""
+        data = await self._store.async_load()
+        if data and data["version"] == _bytecode_cache_version():
+            self._encoded = data["templates"]
+
+    def get(self, source: str) -> CodeType | None:
+        """Return the compiled code of a template source or None."""
+        key = _bytecode_cache_key(source)
+        if (encoded := self._encoded.get(key)) is None:
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(encoded))
+        except (EOFError, TypeError, ValueError):
+            _LOGGER.debug("Discarding invalid cached bytecode for: %s", source)
+            self._encoded.pop(key, None)
+            return None
+        if key not in self._used:
+            self._used[key] = encoded
+            self._schedule_save()
+        return code  # type: ignore[no-any-return]
+
+    def set(self, source: str, code: CodeType) -> None:
+        """Store the compiled code of a template source."""
+        key = _bytecode_cache_key(source)
+        encoded = base64.b64encode(marshal.dumps(code)).decode()
+        self._encoded[key] = self._used[key] = encoded
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule saving the cache, templates may be compiled in any thread."""
+        if self.hass.loop_thread_id == threading.get_ident():
+            self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+            return
+        self.hass.loop.call_soon_threadsafe(
+            self._store.async_delay_save, self._data_to_save, BYTECODE_CACHE_SAVE_DELAY
+        )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store."""
+        return {"version": _bytecode_cache_version(), "templates": dict(self._used)}
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the persistent template bytecode cache."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2872,6 +3203,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.fast_render_cache: LRU[str, _FastRender | None] = LRU(
+            FAST_RENDER_CACHE_SIZE
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3160,6 +3494,24 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.globals["today_at"] = hassfunction(today_at)
         self.filters["today_at"] = self.globals["today_at"]
 
+    def get_fast_render(self, source: str) -> _FastRender | None:
+        """Return the fast render of a template.
+
+        Returns None if the template is not simple enough to be
+        rendered without jinja.
+        """
+        try:
+            return self.fast_render_cache[source]
+        except KeyError:
+            pass
+        fast_render: _FastRender | None
+        try:
+            fast_render = _compile_fast_render(self, self.parse(source))
+        except (_NotFastRenderable, jinja2.TemplateError):
+            fast_render = None
+        self.fast_render_cache[source] = fast_render
+        return fast_render
+
     def is_safe_callable(self, obj):
         """Test if callback is safe."""
         return isinstance(
@@ -3224,7 +3576,16 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        compiled: CodeType | None
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is None
+        ):
+            compiled = super().compile(source)
+        elif (compiled := bytecode_cache.get(source)) is None:
+            compiled = super().compile(source)
+            bytecode_cache.set(source, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -40,6 +40,11 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_trace import (
+    IMPORT_PLATFORMS_PHASE,
+    async_trace_setup,
+    trace_import,
+)
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -68,7 +73,6 @@ BASE_PRELOAD_PLATFORMS = [
     "backup",
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "hardware",
@@ -77,7 +81,6 @@ BASE_PRELOAD_PLATFORMS = [
     "media_source",
     "recorder",
     "repairs",
-    "system_health",
     "trigger",
 ]
 
@@ -1071,9 +1074,10 @@ class Integration:
         cache = self._cache
         domain = self.domain
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            with trace_import(self.hass, self.pkg_path):
+                cache[domain] = cast(
+                    ComponentProtocol, importlib.import_module(self.pkg_path)
+                )
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1149,28 +1153,34 @@ class Integration:
                 start = time.perf_counter()
 
             try:
-                if load_executor_platforms:
-                    try:
-                        platforms.update(
-                            await self.hass.async_add_import_executor_job(
-                                self._load_platforms, platform_names
+                with async_trace_setup(
+                    self.hass,
+                    domain,
+                    IMPORT_PLATFORMS_PHASE,
+                    ",".join(load_executor_platforms + load_event_loop_platforms),
+                ):
+                    if load_executor_platforms:
+                        try:
+                            platforms.update(
+                                await self.hass.async_add_import_executor_job(
+                                    self._load_platforms, platform_names
+                                )
                             )
-                        )
-                    except ModuleNotFoundError:
-                        raise
-                    except ImportError as ex:
-                        _LOGGER.debug(
-                            "Failed to import %s platforms %s in executor",
-                            domain,
-                            load_executor_platforms,
-                            exc_info=ex,
-                        )
-                        # If importing in the executor deadlocks because there is a circular
-                        # dependency, we fall back to the event loop.
-                        load_event_loop_platforms.extend(load_executor_platforms)
-
-                if load_event_loop_platforms:
-                    platforms.update(self._load_platforms(platform_names))
+                        except ModuleNotFoundError:
+                            raise
+                        except ImportError as ex:
+                            _LOGGER.debug(
+                                "Failed to import %s platforms %s in executor",
+                                domain,
+                                load_executor_platforms,
+                                exc_info=ex,
+                            )
+                            # If importing in the executor deadlocks because there
+                            # is a circular dependency, we fall back to the event loop.
+                            load_event_loop_platforms.extend(load_executor_platforms)
+
+                    if load_event_loop_platforms:
+                        platforms.update(self._load_platforms(platform_names))
 
                 for platform_name, import_future in import_futures:
                     import_future.set_result(platforms[platform_name])
@@ -1301,13 +1311,51 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        module = f"{self.pkg_path}.{platform_name}"
+        with trace_import(self.hass, module):
+            return importlib.import_module(module)
 
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+class LazyPlatform:
+    """A platform of an integration which is imported when first used.
+
+    In the event loop the platform must be imported with async_load before
+    its attributes are used, elsewhere it is imported when an attribute is
+    first accessed.
+    """
+
+    __slots__ = ("integration", "platform_name")
+
+    def __init__(self, integration: Integration, platform_name: str) -> None:
+        """Initialize the lazy platform."""
+        self.integration = integration
+        self.platform_name = platform_name
+
+    @property
+    def loaded(self) -> bool:
+        """Return if the platform is imported."""
+        return self.integration.platforms_are_loaded((self.platform_name,))
+
+    async def async_load(self) -> ModuleType:
+        """Import the platform if needed and return it."""
+        return await self.integration.async_get_platform(self.platform_name)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an attribute of the platform, importing it if needed."""
+        return getattr(self.integration.get_platform(self.platform_name), name)
+
+    def __repr__(self) -> str:
+        """Text representation of class."""
+        return (
+            f"<LazyPlatform {self.integration.domain}.{self.platform_name}:"
+            f" loaded={self.loaded}>"
+        )
+
+
 def _version_blocked(
     integration_version: AwesomeVersion,
     blocked_integration: BlockedIntegration,
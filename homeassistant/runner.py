@@ -52,6 +52,8 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    startup_trace: bool = False
+    warm_imports: bool = False
 
     safe_mode: bool = False
 
@@ -31,6 +31,11 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import (
+    IMPORT_PLATFORMS_PHASE,
+    async_trace_setup,
+    async_trace_waited_for,
+)
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -233,10 +238,14 @@ async def _async_process_dependencies(
             after_dependencies_tasks.keys(),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    async_trace_waited_for(
+        hass, integration.domain, [*dependencies_tasks, *after_dependencies_tasks]
+    )
+    with async_trace_setup(hass, integration.domain, SetupPhases.WAIT_DEPENDENCIES):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -331,7 +340,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_trace_setup(hass, domain, SetupPhases.IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -571,10 +581,11 @@ async def async_process_deps_reqs(
     if failed_deps := await _async_process_dependencies(hass, config, integration):
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_trace_setup(hass, integration.domain, SetupPhases.REQUIREMENTS):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -677,6 +688,16 @@ class SetupPhases(StrEnum):
     """Wait time for the platforms to import."""
     WAIT_IMPORT_PACKAGES = "wait_import_packages"
     """Wait time for the packages to import."""
+    IMPORT = "import"
+    """Import of a component, only recorded in the startup trace."""
+    IMPORT_PLATFORMS = IMPORT_PLATFORMS_PHASE
+    """Import of platforms, only recorded in the startup trace."""
+    REQUIREMENTS = "requirements"
+    """Check and install of requirements, only recorded in the startup trace."""
+    WAIT_DEPENDENCIES = "wait_dependencies"
+    """Wait time for the dependencies, only recorded in the startup trace."""
+    PLATFORM_FORWARD = "platform_forward"
+    """Forward of a config entry to platforms, only recorded in the startup trace."""
 
 
 @singleton.singleton(DATA_SETUP_STARTED)
@@ -768,7 +789,8 @@ def async_start_setup(
     setup_started[current] = started
 
     try:
-        yield
+        with async_trace_setup(hass, integration, phase, group):
+            yield
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
@@ -0,0 +1,83 @@
+"""Helpers to warm the bytecode cache of packages before they are imported."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import compileall
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import PackageNotFoundError, distribution
+import logging
+import multiprocessing
+import os
+import sys
+
+from packaging.requirements import InvalidRequirement, Requirement
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of files compiled by a worker process at once
+CHUNK_SIZE = 100
+
+
+def is_gil_enabled() -> bool:
+    """Return if the GIL is enabled, which is only optional on free-threaded builds."""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def requirement_paths(requirements: Iterable[str]) -> set[str]:
+    """Return the source files of the installed requirements."""
+    paths: set[str] = set()
+    for requirement_str in requirements:
+        try:
+            dist = distribution(Requirement(requirement_str).name)
+        except (InvalidRequirement, PackageNotFoundError):
+            continue
+        paths.update(
+            str(dist.locate_file(file))
+            for file in dist.files or ()
+            if file.suffix == ".py"
+        )
+    return paths
+
+
+def _source_files(paths: Iterable[str]) -> list[str]:
+    """Return the source files of the files and directories."""
+    files: list[str] = []
+    for path in paths:
+        if not os.path.isdir(path):
+            if path.endswith(".py"):
+                files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs[:] = [name for name in dirs if name != "__pycache__"]
+            files.extend(
+                os.path.join(root, name) for name in names if name.endswith(".py")
+            )
+    return files
+
+
+def _compile_files(files: list[str]) -> int:
+    """Compile the files which have no up to date bytecode, runs in a worker.
+
+    Returns the number of files which failed to compile.
+    """
+    return sum(not compileall.compile_file(file, quiet=2) for file in files)
+
+
+def warm_pycache(paths: Iterable[str], max_workers: int | None = None) -> int:
+    """Compile the bytecode of the files and directories in worker processes.
+
+    Files with up to date bytecode are skipped. The bytecode is compiled
+    in parallel in worker processes, so the imports which follow only have
+    to load it. Returns the number of files that were checked.
+    """
+    if not (files := _source_files(paths)):
+        return 0
+    chunks = [files[idx : idx + CHUNK_SIZE] for idx in range(0, len(files), CHUNK_SIZE)]
+    # Forking a process with running threads is not safe
+    with ProcessPoolExecutor(
+        max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        failed = sum(executor.map(_compile_files, chunks))
+    _LOGGER.debug("Checked bytecode of %s files, %s failed", len(files), failed)
+    return len(files)
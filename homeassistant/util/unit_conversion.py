@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -107,6 +107,26 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: (val / from_ratio) * to_ratio
 
+    @classmethod
+    def convert_many(
+        cls,
+        values: Iterable[float | None],
+        from_unit: str | None,
+        to_unit: str | None,
+    ) -> list[float | None]:
+        """Convert many values from one unit of measurement to another.
+
+        None values are kept. The ratio is applied inline instead of
+        calling a converter for each value.
+        """
+        if from_unit == to_unit:
+            return list(values)
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return [
+            None if value is None else (value / from_ratio) * to_ratio
+            for value in values
+        ]
+
     @classmethod
     def _get_from_to_ratio(
         cls, from_unit: str | None, to_unit: str | None
@@ -453,6 +473,19 @@ class SpeedConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    def convert_many(
+        cls,
+        values: Iterable[float | None],
+        from_unit: str | None,
+        to_unit: str | None,
+    ) -> list[float | None]:
+        """Convert many speeds from one unit to another."""
+        if UnitOfSpeed.BEAUFORT not in (from_unit, to_unit):
+            return super().convert_many(values, from_unit, to_unit)
+        convert = cls.converter_factory_allow_none(from_unit, to_unit)
+        return [convert(value) for value in values]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
@@ -532,6 +565,17 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    def convert_many(
+        cls,
+        values: Iterable[float | None],
+        from_unit: str | None,
+        to_unit: str | None,
+    ) -> list[float | None]:
+        """Convert many temperatures from one unit to another."""
+        convert = cls.converter_factory_allow_none(from_unit, to_unit)
+        return [convert(value) for value in values]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
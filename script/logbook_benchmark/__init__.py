@@ -0,0 +1 @@
+"""Benchmark the logbook queries against synthetic recorder databases."""
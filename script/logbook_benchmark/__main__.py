@@ -0,0 +1,131 @@
+"""Benchmark the logbook queries against a synthetic recorder database.
+
+The database is generated into an empty database at --db-url, which
+defaults to a temporary SQLite file. PostgreSQL and MariaDB are
+benchmarked by passing the URL of an empty database on a local server,
+for example one started in a container.
+
+The timings and query plans of every query shape are written as JSON.
+When a baseline written by an earlier run is passed, the run fails if a
+query shape got slower than allowed or its query plan changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import create_engine
+
+from .generate import generate
+from .queries import run_shapes
+
+
+def get_arguments() -> argparse.Namespace:
+    """Get parsed passed in arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the logbook queries")
+    parser.add_argument(
+        "--db-url", help="URL of an empty database, defaults to a temporary SQLite"
+    )
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Number of states and events"
+    )
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument(
+        "--days", type=float, default=10, help="Period the rows are spread over"
+    )
+    parser.add_argument(
+        "--hours", type=float, default=24, help="Period of the logbook requests"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write the results to a file")
+    parser.add_argument(
+        "--baseline", type=Path, help="Results of an earlier run to compare with"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=1.5,
+        help="Allowed slowdown factor compared to the baseline",
+    )
+    arguments = parser.parse_args()
+    if arguments.entities < 10 or arguments.devices < 1:
+        parser.error("At least 10 entities and 1 device are needed")
+    return arguments
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    max_regression: float,
+) -> list[str]:
+    """Return the regressions compared to the baseline."""
+    regressions: list[str] = []
+    for name, result in results.items():
+        if (base := baseline.get(name)) is None:
+            continue
+        if result["min"] > base["min"] * max_regression:
+            regressions.append(f"{name}: {result['min']:.4f}s, was {base['min']:.4f}s")
+        if result["plan_structure"] != base.get("plan_structure"):
+            plan = "\n  ".join(result["plan"])
+            regressions.append(f"{name}: query plan changed to\n  {plan}")
+    return regressions
+
+
+def run(arguments: argparse.Namespace, db_url: str) -> int:
+    """Generate the database and benchmark the queries."""
+    engine = create_engine(db_url)
+    try:
+        start = monotonic()
+        database = generate(
+            engine,
+            arguments.rows,
+            arguments.entities,
+            arguments.devices,
+            arguments.days,
+        )
+        print(f"Generated {arguments.rows} rows in {monotonic() - start:.1f}s")
+        results = run_shapes(engine, database, arguments.hours, arguments.repeat)
+    finally:
+        engine.dispose()
+
+    for name, result in results.items():
+        print(
+            f"{name:<22} {result['rows']:>8} rows "
+            f"min {result['min']:.4f}s median {result['median']:.4f}s"
+        )
+    output = {
+        "dialect": engine.dialect.name,
+        "rows": arguments.rows,
+        "shapes": results,
+    }
+    if arguments.output:
+        arguments.output.write_text(json.dumps(output, indent=2))
+    if not arguments.baseline:
+        return 0
+
+    baseline = json.loads(arguments.baseline.read_text())
+    if regressions := compare(results, baseline["shapes"], arguments.max_regression):
+        print("Regressions compared to the baseline:")
+        print("\n".join(regressions))
+        return 1
+    return 0
+
+
+def main() -> int:
+    """Run the benchmark."""
+    arguments = get_arguments()
+    if arguments.db_url:
+        return run(arguments, arguments.db_url)
+    with TemporaryDirectory() as tmp_dir:
+        return run(arguments, f"sqlite:///{tmp_dir}/logbook_benchmark.db")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
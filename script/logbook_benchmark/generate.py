@@ -0,0 +1,240 @@
+"""Generate a synthetic recorder database."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+import time
+from typing import Any
+
+from sqlalchemy import Engine, insert
+
+from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.components.recorder.db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.script import EVENT_SCRIPT_STARTED
+from homeassistant.const import EVENT_CALL_SERVICE, EVENT_LOGBOOK_ENTRY
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
+
+DEVICE_EVENT = "benchmark_device_event"
+EVENT_TYPES = (
+    EVENT_CALL_SERVICE,
+    EVENT_LOGBOOK_ENTRY,
+    EVENT_AUTOMATION_TRIGGERED,
+    EVENT_SCRIPT_STARTED,
+    DEVICE_EVENT,
+)
+# Sensors have a unit and are continuous, so the logbook filters them
+ENTITY_DOMAINS = ("light", "switch", "binary_sensor", "sensor")
+# Share of the rows which are states, the rest are events
+STATES_SHARE = 0.8
+BATCH_SIZE = 10000
+
+
+@dataclass(slots=True)
+class SyntheticDatabase:
+    """Description of a generated database."""
+
+    start_ts: float
+    end_ts: float
+    entity_ids: list[str]
+    metadata_ids: dict[str, int]
+    device_ids: list[str]
+    event_type_ids: tuple[int, ...]
+    context_id: str
+
+
+def _insert_batched(engine: Engine, table: Any, rows: list[dict[str, Any]]) -> None:
+    """Insert rows in batches."""
+    for idx in range(0, len(rows), BATCH_SIZE):
+        with engine.begin() as conn:
+            conn.execute(insert(table), rows[idx : idx + BATCH_SIZE])
+
+
+def generate(
+    engine: Engine,
+    rows: int,
+    entities: int,
+    devices: int,
+    days: float,
+    seed: int = 0,
+) -> SyntheticDatabase:
+    """Create the schema and fill it with synthetic states and events.
+
+    The rows are spread evenly over the days up to now. Every entity
+    gets a state row per change linked to its previous state, and
+    one in five changes shares the context of a preceding service
+    call like it would when a user turns on a light.
+    """
+    rnd = random.Random(seed)
+    Base.metadata.create_all(engine)
+    end_ts = time.time()
+    start_ts = end_ts - days * 86400
+
+    entity_ids = [
+        f"{ENTITY_DOMAINS[idx % len(ENTITY_DOMAINS)]}.benchmark_{idx}"
+        for idx in range(entities)
+    ]
+    metadata_ids = {entity_id: idx + 1 for idx, entity_id in enumerate(entity_ids)}
+    device_ids = [f"{idx:032x}" for idx in range(devices)]
+    event_type_ids = {event_type: idx + 1 for idx, event_type in enumerate(EVENT_TYPES)}
+
+    attributes: list[dict[str, Any]] = []
+    for idx, entity_id in enumerate(entity_ids):
+        attrs: dict[str, Any] = {"friendly_name": f"Benchmark {idx}"}
+        if entity_id.startswith("sensor."):
+            attrs["unit_of_measurement"] = "W"
+        shared_attrs = json_bytes(attrs)
+        attributes.append(
+            {
+                "attributes_id": idx + 1,
+                "hash": StateAttributes.hash_shared_attrs_bytes(shared_attrs),
+                "shared_attrs": shared_attrs.decode(),
+            }
+        )
+
+    # Event data is shared between the events of an entity or device
+    event_data: list[dict[str, Any]] = []
+    data_ids: dict[tuple[str, str], int] = {}
+    for event_type, targets, make_data in (
+        (
+            EVENT_CALL_SERVICE,
+            entity_ids,
+            lambda target: {
+                "domain": target.split(".")[0],
+                "service": "turn_on",
+                "service_data": {"entity_id": target},
+            },
+        ),
+        (
+            EVENT_LOGBOOK_ENTRY,
+            entity_ids,
+            lambda target: {"name": "Benchmark", "message": "ran", "entity_id": target},
+        ),
+        (
+            EVENT_AUTOMATION_TRIGGERED,
+            entity_ids,
+            lambda target: {
+                "name": "Benchmark",
+                "entity_id": "automation.benchmark",
+                "source": f"state of {target}",
+            },
+        ),
+        (
+            EVENT_SCRIPT_STARTED,
+            entity_ids,
+            lambda target: {"name": "Benchmark", "entity_id": "script.benchmark"},
+        ),
+        (DEVICE_EVENT, device_ids, lambda target: {"device_id": target}),
+    ):
+        for target in targets:
+            shared_data = json_bytes(make_data(target))
+            data_ids[event_type, target] = data_id = len(event_data) + 1
+            event_data.append(
+                {
+                    "data_id": data_id,
+                    "hash": EventData.hash_shared_data_bytes(shared_data),
+                    "shared_data": shared_data.decode(),
+                }
+            )
+
+    _insert_batched(
+        engine,
+        EventTypes,
+        [
+            {"event_type_id": event_type_id, "event_type": event_type}
+            for event_type, event_type_id in event_type_ids.items()
+        ],
+    )
+    _insert_batched(
+        engine,
+        StatesMeta,
+        [
+            {"metadata_id": metadata_id, "entity_id": entity_id}
+            for entity_id, metadata_id in metadata_ids.items()
+        ],
+    )
+    _insert_batched(engine, StateAttributes, attributes)
+    _insert_batched(engine, EventData, event_data)
+
+    # The rows are inserted while they are generated to keep the memory
+    # use flat, states only refer to states inserted before them
+    states: list[dict[str, Any]] = []
+    events: list[dict[str, Any]] = []
+    state_id = event_id = 0
+    last_state: dict[str, tuple[int, str]] = {}
+    step = (end_ts - start_ts) / max(rows, 1)
+    context_id = ""
+    context_id_bin = b""
+    for idx in range(rows):
+        ts = start_ts + idx * step
+        if rnd.random() >= STATES_SHARE:
+            event_type = rnd.choice(EVENT_TYPES)
+            targets = device_ids if event_type == DEVICE_EVENT else entity_ids
+            target = rnd.choice(targets)
+            context_id = ulid_at_time(ts)
+            context_id_bin = ulid_to_bytes(context_id)
+            event_id += 1
+            events.append(
+                {
+                    "event_id": event_id,
+                    "event_type_id": event_type_ids[event_type],
+                    "data_id": data_ids[event_type, target],
+                    "origin_idx": 0,
+                    "time_fired_ts": ts,
+                    "context_id_bin": context_id_bin,
+                }
+            )
+            if len(events) == BATCH_SIZE:
+                _insert_batched(engine, Events, events)
+                events.clear()
+            continue
+
+        entity_idx = rnd.randrange(entities)
+        entity_id = entity_ids[entity_idx]
+        old_state_id, old_state = last_state.get(entity_id, (None, None))
+        if entity_id.startswith("sensor."):
+            state = str(rnd.randrange(1000))
+        else:
+            state = "off" if old_state == "on" else "on"
+        if not context_id_bin or rnd.random() >= 0.2:
+            context_id_bin = ulid_to_bytes(ulid_at_time(ts))
+        state_id += 1
+        states.append(
+            {
+                "state_id": state_id,
+                "metadata_id": metadata_ids[entity_id],
+                "state": state,
+                "attributes_id": entity_idx + 1,
+                "old_state_id": old_state_id,
+                "last_updated_ts": ts,
+                "last_changed_ts": ts,
+                "origin_idx": 0,
+                "context_id_bin": context_id_bin,
+            }
+        )
+        last_state[entity_id] = (state_id, state)
+        if len(states) == BATCH_SIZE:
+            _insert_batched(engine, States, states)
+            states.clear()
+
+    _insert_batched(engine, Events, events)
+    _insert_batched(engine, States, states)
+
+    return SyntheticDatabase(
+        start_ts,
+        end_ts,
+        entity_ids,
+        metadata_ids,
+        device_ids,
+        tuple(event_type_ids.values()),
+        context_id,
+    )
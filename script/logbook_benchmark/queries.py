@@ -0,0 +1,148 @@
+"""Time the logbook query shapes and record their query plans."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from statistics import median
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from homeassistant.components.logbook.queries import statement_for_request
+from homeassistant.components.recorder.util import execute_stmt_lambda_element
+import homeassistant.util.dt as dt_util
+
+from .generate import SyntheticDatabase
+
+# How the query plan is requested for each dialect
+EXPLAIN_PREFIX = {
+    "sqlite": "EXPLAIN QUERY PLAN",
+    "postgresql": "EXPLAIN",
+    "mysql": "EXPLAIN",
+    "mariadb": "EXPLAIN",
+}
+
+
+@dataclass(slots=True)
+class QueryShape:
+    """A logbook request which results in one of the query shapes."""
+
+    name: str
+    entity_ids: list[str] | None = None
+    device_ids: list[str] | None = None
+    context_id: str | None = None
+
+
+def query_shapes(database: SyntheticDatabase) -> list[QueryShape]:
+    """Return the query shapes of the logbook requests."""
+    entity_ids = database.entity_ids
+    device_ids = database.device_ids
+    shapes = [
+        QueryShape("all"),
+        QueryShape("entities_1", entity_ids=entity_ids[:1]),
+        QueryShape("entities_10", entity_ids=entity_ids[:10]),
+        QueryShape("devices_1", device_ids=device_ids[:1]),
+        QueryShape(
+            "entities_and_devices",
+            entity_ids=entity_ids[:10],
+            device_ids=device_ids[:1],
+        ),
+    ]
+    if database.context_id:
+        shapes.append(QueryShape("context", context_id=database.context_id))
+    return shapes
+
+
+def _explain(session: Session, stmt: Any) -> tuple[list[str], list[str]]:
+    """Return the query plan of a statement and its structure."""
+    dialect = session.get_bind().dialect
+    if (prefix := EXPLAIN_PREFIX.get(dialect.name)) is None:
+        return [], []
+    # Render the expanding IN parameters as individual parameters
+    compiled = stmt.compile(
+        dialect=dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params: Any = compiled.params
+    if compiled.positiontup is not None:
+        params = tuple(params[name] for name in compiled.positiontup)
+    result = session.connection().exec_driver_sql(f"{prefix} {compiled}", params)
+    columns = list(result.keys())
+    rows = [dict(zip(columns, row, strict=True)) for row in result]
+    plan = [" | ".join(str(column) for column in row.values()) for row in rows]
+    return plan, _plan_structure(dialect.name, rows)
+
+
+def _plan_structure(dialect_name: str, rows: list[dict[str, Any]]) -> list[str]:
+    """Return the node types and indexes of a query plan.
+
+    Costs and row estimates change with the data, so they are left out
+    to be able to compare the plans of different runs.
+    """
+    if dialect_name == "sqlite":
+        return [str(row["detail"]) for row in rows]
+    if dialect_name == "postgresql":
+        # Only the node lines have costs, their conditions are left out
+        return [
+            line.split("(cost=")[0].strip().removeprefix("->").strip()
+            for row in rows
+            if "(cost=" in (line := str(row["QUERY PLAN"]))
+        ]
+    return [
+        " | ".join(
+            str(row.get(column)) for column in ("select_type", "table", "type", "key")
+        )
+        for row in rows
+    ]
+
+
+def run_shape(
+    engine: Engine,
+    database: SyntheticDatabase,
+    shape: QueryShape,
+    start_time: datetime,
+    end_time: datetime,
+    repeat: int,
+) -> dict[str, Any]:
+    """Run a query shape and return its timings and query plan."""
+    stmt = statement_for_request(
+        start_time,
+        end_time,
+        database.event_type_ids,
+        shape.entity_ids,
+        [database.metadata_ids[entity_id] for entity_id in shape.entity_ids or ()],
+        shape.device_ids,
+        None,
+        shape.context_id,
+    )
+    timings: list[float] = []
+    rows = 0
+    with Session(engine) as session:
+        for _ in range(repeat):
+            start = perf_counter()
+            rows = len(list(execute_stmt_lambda_element(session, stmt, orm_rows=False)))
+            timings.append(perf_counter() - start)
+        plan, plan_structure = _explain(session, stmt)
+    return {
+        "rows": rows,
+        "min": min(timings),
+        "median": median(timings),
+        "plan": plan,
+        "plan_structure": plan_structure,
+    }
+
+
+def run_shapes(
+    engine: Engine, database: SyntheticDatabase, hours: float, repeat: int
+) -> dict[str, dict[str, Any]]:
+    """Run all query shapes over the last hours of the database."""
+    end_time = dt_util.utc_from_timestamp(database.end_ts)
+    start_time = dt_util.utc_from_timestamp(
+        max(database.start_ts, database.end_ts - hours * 3600)
+    )
+    return {
+        shape.name: run_shape(engine, database, shape, start_time, end_time, repeat)
+        for shape in query_shapes(database)
+    }
@@ -41,7 +41,11 @@ from homeassistant.auth import (
     providers as auth_providers,
 )
 from homeassistant.auth.permissions import system_policies
-from homeassistant.components import device_automation, persistent_notification as pn
+from homeassistant.components import (
+    device_automation,
+    persistent_notification as pn,
+    system_health,
+)
 from homeassistant.components.device_automation import (  # noqa: F401
     _async_get_device_automation_capabilities as async_get_device_automation_capabilities,
 )
@@ -1454,6 +1458,11 @@ def mock_storage(data: dict[str, Any] | None = None) -> Generator[dict[str, Any]
             side_effect=mock_remove,
             autospec=True,
         ),
+        patch(
+            "homeassistant.helpers.storage.Store.async_load_snapshot",
+            return_value=None,
+        ),
+        patch("homeassistant.helpers.storage.Store._async_write_snapshot"),
     ):
         yield data
 
@@ -1470,6 +1479,7 @@ async def flush_store(store: storage.Store) -> None:
 
 async def get_system_health_info(hass: HomeAssistant, domain: str) -> dict[str, Any]:
     """Get system health info."""
+    await system_health._async_register_lazy_platforms(hass)
     return await hass.data["system_health"][domain].info_callback(hass)
 
 
@@ -2,14 +2,14 @@
 
 import asyncio
 from datetime import timedelta
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, Mock, patch
 
 from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history as recorder_history
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -403,6 +403,242 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period streaming the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    states = {}
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        states.update(response["event"]["states"])
+        if response["event"].get("done"):
+            break
+
+    assert list(states) == ["sensor.one", "sensor.two"]
+    assert [state["s"] for state in states["sensor.one"]] == ["on", "off"]
+    assert [state["s"] for state in states["sensor.two"]] == ["on", "off"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "done": True}
+
+
+async def test_history_during_period_chunked_error(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a chunked history_during_period ends with an error event on failure."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    def _failing_chunks(*args, **kwargs):
+        yield {"sensor.one": [{"s": "on", "lu": now.timestamp()}]}
+        raise ValueError("Boom")
+
+    client = await hass_ws_client()
+    with patch.object(
+        recorder_history, "iter_significant_states_with_session", _failing_chunks
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"] == {
+            "states": {"sensor.one": [{"s": "on", "lu": now.timestamp()}]}
+        }
+        response = await client.receive_json()
+        assert response["event"] == {
+            "states": {},
+            "done": True,
+            "error": {"code": "unknown_error", "message": "Unknown error"},
+        }
+
+
+async def test_history_chunk_sender_waits_for_drain(hass: HomeAssistant) -> None:
+    """Test chunks are only sent once a congested client caught up."""
+    sent = asyncio.Event()
+    connection = Mock(congested=True)
+    connection.send_message.side_effect = lambda message: sent.set()
+    sender = websocket_api._HistoryChunkSender(hass, connection)
+
+    send = hass.loop.run_in_executor(None, sender.send, b"chunk")
+    await sent.wait()
+    connection.send_message.assert_called_once_with(b"chunk")
+    await asyncio.sleep(0)
+    assert not send.done()
+
+    connection.async_call_when_drained.call_args[0][0]()
+    assert await send is True
+
+    sent.clear()
+    send = hass.loop.run_in_executor(None, sender.send, b"chunk")
+    await sent.wait()
+    await asyncio.sleep(0)
+    sender.async_cancel()
+    assert await send is False
+    assert await hass.loop.run_in_executor(None, sender.send, b"chunk") is False
+    assert connection.send_message.call_count == 2
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsampling numeric entities."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(30):
+        hass.states.async_set("sensor.numeric", str(value))
+        hass.states.async_set("sensor.text", f"text{value}")
+        if value == 15:
+            hass.states.async_set("sensor.numeric", "unavailable")
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.few", "1")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.numeric", "sensor.text", "sensor.few"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+
+    numeric = [state["s"] for state in result["sensor.numeric"]]
+    assert len(numeric) <= 10
+    assert numeric[0] == "0"
+    assert numeric[-1] == "29"
+    assert "unavailable" in numeric
+    timestamps = [state["lu"] for state in result["sensor.numeric"]]
+    assert timestamps == sorted(timestamps)
+    # Non numeric states are never downsampled
+    assert len(result["sensor.text"]) == 30
+    assert [state["s"] for state in result["sensor.few"]] == ["1"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.numeric"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_chunked_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test max_points holds for an entity over all chunks of the stream."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.numeric", "0")
+    await async_wait_recording_done(hass)
+
+    def _chunks(*args, **kwargs):
+        for chunk in range(3):
+            yield {
+                "sensor.numeric": [
+                    {"s": str(value), "lu": now.timestamp() + chunk * 20 + value}
+                    for value in range(20)
+                ]
+            }
+
+    client = await hass_ws_client()
+    with patch.object(
+        recorder_history, "iter_significant_states_with_session", _chunks
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.numeric"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "chunked": True,
+                "max_points": 10,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        states = []
+        while True:
+            response = await client.receive_json()
+            states.extend(response["event"]["states"].get("sensor.numeric", []))
+            if response["event"].get("done"):
+                break
+
+    assert 2 <= len(states) <= 10
+
+
 async def test_history_during_period_bad_start_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -430,6 +430,40 @@ async def test_if_not_fires_if_event_data_not_matches(
     assert len(service_calls) == 0
 
 
+async def test_event_data_routes_by_key(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test triggers with simple event data share one keyed bus listener."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "event",
+                        "event_type": "test_event",
+                        "event_data": {"device_id": device_id, "type": "press"},
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"device_id": device_id},
+                    },
+                }
+                for device_id in ("device_1", "device_2", "device_3")
+            ]
+        },
+    )
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    hass.bus.async_fire("test_event", {"device_id": "device_2", "type": "press"})
+    hass.bus.async_fire("test_event", {"device_id": "device_3", "type": "release"})
+    hass.bus.async_fire("test_event", {"device_id": "device_4", "type": "press"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+    assert service_calls[0].data == {"device_id": "device_2"}
+
+
 async def test_if_not_fires_if_event_context_not_matches(
     hass: HomeAssistant, service_calls: list[ServiceCall], context_with_user: Context
 ) -> None:
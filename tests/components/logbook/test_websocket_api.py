@@ -29,6 +29,7 @@ from homeassistant.const import (
     CONF_INCLUDE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
     STATE_OFF,
     STATE_ON,
 )
@@ -356,6 +357,82 @@ async def test_get_events_entities_filtered_away(
     assert len(results) == 0
 
 
+async def test_get_events_recent_from_projection(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events serves recent periods without querying."""
+    before_setup = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    now = dt_util.utcnow()
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON, {ATTR_FRIENDLY_NAME: "Kitchen"})
+    hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 100})
+    hass.states.async_set("sensor.power", "1", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.power", "2", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "switch")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=logbook.processor.statement_for_request,
+    ) as statement_for_request_mock:
+        await client.send_json(
+            {"id": 1, "type": "logbook/get_events", "start_time": now.isoformat()}
+        )
+        response = await client.receive_json()
+        assert statement_for_request_mock.call_count == 0
+        assert response["success"]
+        assert response["result"] == [
+            {"entity_id": "light.kitchen", "state": "on", "when": ANY},
+            {
+                "domain": "switch",
+                "entity_id": None,
+                "message": "is triggered",
+                "name": "Alarm",
+                "when": ANY,
+            },
+        ]
+        projection_result = response["result"]
+
+        # Periods starting before the projection are queried from the database
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "logbook/get_events",
+                "start_time": before_setup.isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert statement_for_request_mock.call_count == 1
+        assert response["success"]
+        assert response["result"] == projection_result
+
+
+async def test_projection_stopped_on_stop(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the logbook projection no longer serves periods after stopping."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+    projection = hass.data[logbook.DOMAIN].projection
+    assert projection is not None
+    start_ts = dt_util.utcnow().timestamp()
+    assert projection.async_get_rows(start_ts, start_ts + 60) == []
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert projection.async_get_rows(start_ts, start_ts + 60) is None
+
+
 async def test_get_events_future_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -0,0 +1,81 @@
+"""The tests for the recorder state attributes manager."""
+
+from __future__ import annotations
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    AttributesHashIndex,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def test_attributes_hash_index() -> None:
+    """Test the attributes hash index."""
+    index = AttributesHashIndex()
+    assert index.get('{"a":1}') is None
+
+    index.load([('{"a":1}', 1), ('{"b":2}', 2), ('{"c":3}', 3)])
+    assert len(index) == 3
+    assert index.get('{"a":1}') == 1
+    assert index.get('{"b":2}') == 2
+    assert index.get('{"c":3}') == 3
+    assert index.get('{"d":4}') is None
+
+    index.evict({2, 5})
+    assert len(index) == 2
+    assert index.get('{"b":2}') is None
+    assert index.get('{"c":3}') == 3
+
+    index.evict({5})
+    assert len(index) == 2
+
+    index.clear()
+    assert len(index) == 0
+    assert index.get('{"a":1}') is None
+
+
+async def test_warm_load(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the attributes of recent states are warm loaded."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "kWh"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        attributes_ids = {
+            shared_attrs: attributes_id
+            for attributes_id, shared_attrs in session.query(
+                StateAttributes.attributes_id, StateAttributes.shared_attrs
+            )
+        }
+    assert set(attributes_ids) == {
+        '{"unit_of_measurement":"W"}',
+        '{"unit_of_measurement":"kWh"}',
+    }
+
+    manager = instance.state_attributes_manager
+
+    def _reset_and_warm_load() -> None:
+        manager.reset()
+        with session_scope(session=instance.get_session()) as session:
+            manager.warm_load(session)
+
+    await instance.async_add_executor_job(_reset_and_warm_load)
+
+    for shared_attrs, attributes_id in attributes_ids.items():
+        assert manager.get_from_cache(shared_attrs) == attributes_id
+    assert manager.get_from_cache('{"unit_of_measurement":"V"}') is None
+
+    manager.evict_purged(set(attributes_ids.values()))
+    for shared_attrs in attributes_ids:
+        assert manager.get_from_cache(shared_attrs) is None
@@ -18,6 +18,7 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history import modern
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
@@ -637,6 +638,77 @@ async def test_get_significant_states_are_ordered(
     assert list(hist.keys()) == entity_ids
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_iter_significant_states_with_session(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test that merging the streamed chunks gives the same result as a single query."""
+    zero, four, _states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    entity_ids = ["media_player.test", "thermostat.test", "script.can_cancel_this_one"]
+    expected = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        chunks = list(
+            history.iter_significant_states_with_session(
+                hass,
+                session,
+                zero,
+                four,
+                entity_ids,
+                minimal_response=minimal_response,
+                compressed_state_format=True,
+            )
+        )
+    assert len(chunks) == 1
+    assert chunks[0] == expected
+
+    with session_scope(hass=hass, read_only=True) as session:
+        chunks = list(
+            modern.iter_significant_states_with_session(
+                hass,
+                session,
+                zero,
+                four,
+                entity_ids,
+                minimal_response=minimal_response,
+                compressed_state_format=True,
+                chunk_size=1,
+            )
+        )
+    # With a chunk size of 1 each entity gets its own chunk
+    assert len(chunks) == len(expected)
+    merged = {}
+    for chunk in chunks:
+        assert len(chunk) == 1
+        assert not merged.keys() & chunk.keys()
+        merged.update(chunk)
+    assert merged == expected
+
+
+async def test_iter_significant_states_with_session_no_matches(
+    hass: HomeAssistant,
+) -> None:
+    """Test streaming the states of entities that have never been recorded."""
+    now = dt_util.utcnow()
+    with session_scope(hass=hass, read_only=True) as session:
+        assert (
+            list(
+                history.iter_significant_states_with_session(
+                    hass, session, now - timedelta(days=1), now, ["demo.id"]
+                )
+            )
+            == []
+        )
+
+
 async def test_get_significant_states_only(
     hass: HomeAssistant,
 ) -> None:
@@ -395,11 +395,11 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance.states_manager._pending_rows or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -438,11 +438,11 @@ async def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance.states_manager._pending_rows or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -1473,6 +1473,90 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert", [True, False])
+async def test_saving_state_chains(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert: bool
+) -> None:
+    """Test old states and attributes are linked with and without bulk inserts."""
+    instance = get_instance(hass)
+    instance.states_manager.bulk_insert = bulk_insert
+    hass.states.async_set("test.one", "s1", {"shared": True})
+    hass.states.async_set("test.one", "s2", {"shared": True})
+    hass.states.async_set("test.two", "s3", {"shared": True})
+    hass.states.async_set("test.one", "s4", {"new": True})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.two", "s5", {"new": True})
+    hass.states.async_set("test.two", "s6", {"shared": True})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.attributes_id,
+                States.state,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert [states_by_state[f"s{idx}"].entity_id for idx in range(1, 7)] == [
+            "test.one",
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+            "test.two",
+        ]
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s6"].old_state_id == states_by_state["s5"].state_id
+
+        shared_attributes_id = states_by_state["s1"].attributes_id
+        new_attributes_id = states_by_state["s4"].attributes_id
+        assert shared_attributes_id != new_attributes_id
+        for state in ("s2", "s3", "s6"):
+            assert states_by_state[state].attributes_id == shared_attributes_id
+        assert states_by_state["s5"].attributes_id == new_attributes_id
+
+
+@pytest.mark.parametrize(
+    ("backlog", "expected_commit_interval"),
+    [(0, 1), (999, 1), (1000, 2), (3500, 4), (100000, 8)],
+)
+async def test_commit_interval_adapts_to_backlog(
+    hass: HomeAssistant, backlog: int, expected_commit_interval: int
+) -> None:
+    """Test the commit interval grows with the backlog and is capped."""
+    recorder_helper.async_initialize_recorder(hass)
+    instance = _default_recorder(hass)
+    with patch.object(instance, "_queue", Mock(qsize=Mock(return_value=backlog))):
+        assert instance.effective_commit_interval == expected_commit_interval
+
+
+async def test_commit_timer_is_rescheduled_once(hass: HomeAssistant) -> None:
+    """Test scheduling the commit cancels the pending commit timer."""
+    recorder_helper.async_initialize_recorder(hass)
+    instance = _default_recorder(hass)
+    cancel = Mock()
+    with patch(
+        "homeassistant.components.recorder.core.async_call_later",
+        return_value=cancel,
+    ) as mock_call_later:
+        instance._async_schedule_commit()
+        instance._async_schedule_commit()
+        assert cancel.call_count == 1
+
+        instance._async_commit_interval_elapsed(dt_util.utcnow())
+        assert cancel.call_count == 1
+        assert mock_call_later.call_count == 3
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
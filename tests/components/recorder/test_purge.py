@@ -313,6 +313,66 @@ async def test_purge_old_states_encounters_operational_error(
     assert "Error executing purge" in caplog.text
 
 
+async def test_purge_old_states_by_range(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test deleting old states and events by range."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    # Each batch purges up to the next range boundary, the
+    # states and events eleven days ago need one batch
+    finished = purge_old_data(
+        recorder_mock,
+        purge_before,
+        repack=False,
+        events_batch_size=1,
+        states_batch_size=1,
+        range_delete=True,
+    )
+    assert not finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 4
+        assert session.query(StateAttributes).count() == 2
+
+    finished = purge_old_data(
+        recorder_mock, purge_before, repack=False, range_delete=True
+    )
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 2
+        assert session.query(StateAttributes).count() == 1
+        state_map_by_state = {state.state: state for state in states}
+        assert state_map_by_state["dontpurgeme_4"].old_state_id is None
+        assert (
+            state_map_by_state["dontpurgeme_5"].old_state_id
+            == state_map_by_state["dontpurgeme_4"].state_id
+        )
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 2
+
+    assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
+
+    # Purging the last committed state evicts it
+    finished = purge_old_data(
+        recorder_mock,
+        dt_util.utcnow() + timedelta(seconds=1),
+        repack=False,
+        range_delete=True,
+    )
+    assert finished
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+        assert session.query(StateAttributes).count() == 0
+    assert "test.recorder2" not in recorder_mock.states_manager._last_committed_id
+
+
 async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old events."""
     await _add_test_events(hass)
@@ -472,6 +472,80 @@ async def test_statistics_during_period_set_back_compat(
     )
 
 
+async def test_statistics_during_period_cache(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+) -> None:
+    """Test statistics_during_period results are cached until modified."""
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    period2 = period1 + timedelta(hours=1)
+    statistic_id = "test:total_energy_import"
+    other_statistic_id = "test:total_gas_import"
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+    other_metadata = {**metadata, "statistic_id": other_statistic_id}
+    stats = [
+        {"start": period1, "state": 0, "sum": 2},
+        {"start": period2, "state": 1, "sum": 3},
+    ]
+    async_add_external_statistics(hass, metadata, stats)
+    async_add_external_statistics(hass, other_metadata, stats)
+    await async_wait_recording_done(hass)
+
+    def _sums(stat_id: str) -> list[float]:
+        result = statistics_during_period(
+            hass, zero, period="hour", statistic_ids={stat_id}
+        )
+        return [row["sum"] for row in result[stat_id]]
+
+    with patch.object(
+        statistics,
+        "_statistics_during_period_with_session",
+        wraps=statistics._statistics_during_period_with_session,
+    ) as query_mock:
+        assert _sums(statistic_id) == [2, 3]
+        assert _sums(other_statistic_id) == [2, 3]
+        assert query_mock.call_count == 2
+        # The same queries are answered from the cache
+        assert _sums(statistic_id) == [2, 3]
+        assert _sums(other_statistic_id) == [2, 3]
+        assert query_mock.call_count == 2
+
+        # Importing only invalidates the results of the imported statistic
+        async_add_external_statistics(
+            hass, metadata, [{"start": period2, "state": 1, "sum": 4}]
+        )
+        await async_wait_recording_done(hass)
+        assert _sums(statistic_id) == [2, 4]
+        assert _sums(other_statistic_id) == [2, 3]
+        assert query_mock.call_count == 3
+
+        # Results after an adjusted period are invalidated
+        recorder_mock.async_adjust_statistics(statistic_id, period2, 1, "kWh")
+        await async_wait_recording_done(hass)
+        assert _sums(statistic_id) == [2, 5]
+        assert query_mock.call_count == 4
+
+        # Results before an adjusted period are kept
+        end = period1 + timedelta(minutes=30)
+        result = statistics_during_period(hass, zero, end, statistic_ids={statistic_id})
+        assert [row["sum"] for row in result[statistic_id]] == [2]
+        assert query_mock.call_count == 5
+        recorder_mock.async_adjust_statistics(statistic_id, period2, 1, "kWh")
+        await async_wait_recording_done(hass)
+        statistics_during_period(hass, zero, end, statistic_ids={statistic_id})
+        assert query_mock.call_count == 5
+        assert _sums(statistic_id) == [2, 6]
+        assert query_mock.call_count == 6
+
+
 async def test_rename_entity_collision(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -0,0 +1,104 @@
+"""Test the recorder statistics states buffer."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder.statistics_states import StatisticsStatesBuffer
+from homeassistant.core import State
+import homeassistant.util.dt as dt_util
+
+START = datetime(2024, 1, 1, 12, 0, tzinfo=dt_util.UTC)
+END = START + timedelta(minutes=5)
+
+
+def _state(
+    entity_id: str,
+    state: str,
+    last_updated: datetime,
+    last_changed: datetime | None = None,
+    attributes: dict | None = None,
+) -> State:
+    """Return a state of an entity with a state class."""
+    return State(
+        entity_id,
+        state,
+        attributes if attributes is not None else {"state_class": "measurement"},
+        last_changed=last_changed or last_updated,
+        last_updated=last_updated,
+    )
+
+
+def test_buffer_not_covering_period() -> None:
+    """Test the buffer does not return states before it was started."""
+    buffer = StatisticsStatesBuffer()
+    assert buffer.get_states(START, END, ["sensor.test"], []) is None
+
+    buffer.start((START + timedelta(seconds=1)).timestamp(), [], None)
+    assert buffer.get_states(START, END, ["sensor.test"], []) is None
+    assert buffer.get_states(END, END + timedelta(minutes=5), ["sensor.test"], []) == {}
+
+
+def test_buffer_get_states() -> None:
+    """Test getting the states of a period from the buffer."""
+    before = _state("sensor.test", "1", START - timedelta(minutes=1))
+    excluded = _state("sensor.excluded", "1", START - timedelta(minutes=1))
+    no_state_class = _state(
+        "sensor.no_state_class", "1", START - timedelta(minutes=1), attributes={}
+    )
+    buffer = StatisticsStatesBuffer()
+    buffer.start(
+        (START - timedelta(minutes=1)).timestamp(),
+        [before, excluded, no_state_class],
+        lambda entity_id: entity_id != "sensor.excluded",
+    )
+
+    changed = _state("sensor.test", "2", START + timedelta(minutes=1))
+    attribute_change = _state(
+        "sensor.test",
+        "2",
+        START + timedelta(minutes=2),
+        last_changed=START + timedelta(minutes=1),
+    )
+    after = _state("sensor.test", "3", END + timedelta(seconds=5))
+    buffer.add(before, changed)
+    buffer.add(changed, attribute_change)
+    buffer.add(attribute_change, after)
+
+    new_before = _state("sensor.new", "5", START - timedelta(hours=1))
+    new = _state("sensor.new", "6", START + timedelta(minutes=3))
+    buffer.add(new_before, new)
+    buffer.add(None, _state("sensor.other", "1", START, attributes={}))
+
+    assert buffer.get_states(
+        START,
+        END,
+        ["sensor.test", "sensor.excluded", "sensor.no_state_class"],
+        ["sensor.new", "sensor.other"],
+    ) == {
+        "sensor.test": [before, changed, attribute_change],
+        "sensor.new": [new_before, new],
+    }
+    assert buffer.get_states(START, END, [], ["sensor.test"]) == {
+        "sensor.test": [before, changed]
+    }
+
+
+def test_buffer_trim_and_remove() -> None:
+    """Test trimming the buffer and removing entities."""
+    before = _state("sensor.test", "1", START - timedelta(minutes=1))
+    buffer = StatisticsStatesBuffer()
+    buffer.start((START - timedelta(minutes=1)).timestamp(), [before], None)
+    changed = _state("sensor.test", "2", START + timedelta(minutes=1))
+    after = _state("sensor.test", "3", END + timedelta(seconds=5))
+    buffer.add(before, changed)
+    buffer.add(changed, after)
+
+    buffer.trim(END.timestamp())
+    # The period that has been trimmed is no longer covered
+    assert buffer.get_states(START, END, ["sensor.test"], []) is None
+    next_end = END + timedelta(minutes=5)
+    assert buffer.get_states(END, next_end, ["sensor.test"], []) == {
+        "sensor.test": [changed, after]
+    }
+
+    buffer.add(after, None)
+    assert buffer.get_states(END, next_end, ["sensor.test"], []) == {}
@@ -35,6 +35,10 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "queue_backlog": ANY,
+        "commit_interval": ANY,
+        "last_commit_duration": ANY,
+        "last_commit_rows": ANY,
     }
 
 
@@ -64,6 +68,10 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "queue_backlog": ANY,
+        "commit_interval": ANY,
+        "last_commit_duration": ANY,
+        "last_commit_rows": ANY,
     }
 
 
@@ -99,6 +107,10 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "queue_backlog": ANY,
+        "commit_interval": ANY,
+        "last_commit_duration": ANY,
+        "last_commit_rows": ANY,
     }
 
 
@@ -127,4 +139,8 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "queue_backlog": ANY,
+        "commit_interval": ANY,
+        "last_commit_duration": ANY,
+        "last_commit_rows": ANY,
     }
@@ -1,6 +1,8 @@
 """Test auth of websocket API."""
 
+import json
 from unittest.mock import patch
+import zlib
 
 import aiohttp
 from aiohttp import WSMsgType
@@ -14,6 +16,8 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import (
+    BINARY_FRAME_JSON,
+    BINARY_FRAME_JSON_DEFLATE,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
@@ -296,3 +300,53 @@ async def test_auth_sending_unknown_type_disconnects(
         await ws._writer.send_frame(b"1" * 130, 0x30)
         auth_msg = await ws.receive()
         assert auth_msg.type == WSMsgType.close
+
+
+@pytest.mark.parametrize("compress", [0, 15])
+async def test_auth_binary_framing(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+    compress: int,
+) -> None:
+    """Test negotiating binary framing during auth."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.large", "on", {"data": "x" * 2048})
+
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(URL, compress=compress) as ws:
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+
+        await ws.send_json(
+            {
+                "type": TYPE_AUTH,
+                "access_token": hass_access_token,
+                "binary_framing": True,
+            }
+        )
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+        assert auth_msg["binary_framing"] is True
+
+        await ws.send_json({"id": 1, "type": "ping"})
+        msg = await ws.receive()
+        assert msg.type == WSMsgType.BINARY
+        assert msg.data[0] == BINARY_FRAME_JSON
+        assert json.loads(msg.data[1:]) == {"id": 1, "type": "pong"}
+
+        await ws.send_json({"id": 2, "type": "get_states"})
+        msg = await ws.receive()
+        assert msg.type == WSMsgType.BINARY
+        if compress:
+            # The connection is already compressed by permessage-deflate
+            assert msg.data[0] == BINARY_FRAME_JSON
+            payload = msg.data[1:]
+        else:
+            assert msg.data[0] == BINARY_FRAME_JSON_DEFLATE
+            payload = zlib.decompress(msg.data[1:])
+        result = json.loads(payload)
+        assert result["id"] == 2
+        assert result["result"][0]["attributes"]["data"] == "x" * 2048
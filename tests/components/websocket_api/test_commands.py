@@ -11,12 +11,17 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import (
+    async_register_command,
+    const,
+    websocket_command,
+)
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -25,6 +30,10 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.startup_trace import (
+    async_finish_startup_trace,
+    async_start_startup_trace,
+)
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
@@ -743,6 +752,37 @@ async def test_ping(websocket_client: MockHAClientWebSocket) -> None:
     assert msg["type"] == "pong"
 
 
+async def test_command_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the payload statistics of the commands."""
+    hass.states.async_set("light.kitchen", "on")
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 6, "type": "command_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    get_states_stats = msg["result"]["get_states"]
+    assert get_states_stats["commands"] == 1
+    assert get_states_stats["messages"] == 1
+    assert get_states_stats["payload_bytes"] > len("light.kitchen")
+    assert get_states_stats["handle_time"] > 0
+
+
+async def test_command_stats_requires_admin(
+    websocket_client: MockHAClientWebSocket, hass_admin_user: MockUser
+) -> None:
+    """Test the command stats require an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "command_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_call_service_context_with_user(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
@@ -2566,6 +2606,32 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test getting the startup trace."""
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    async_start_startup_trace(hass)
+    async_finish_startup_trace(hass)
+
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["critical_path"] == []
+    assert msg["result"]["duration"] >= 0
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "integration/startup_trace", "format": "chrome"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["traceEvents"][0]["args"] == {"name": "bootstrap"}
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -2868,6 +2934,92 @@ async def test_integration_descriptions(
     assert response["result"]
 
 
+async def test_subscribe_entities_resume_from_cursor(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test resubscribing to entities from a cursor only sends the changes."""
+    hass.states.async_set("light.changed", "on")
+    hass.states.async_set("light.removed", "on")
+    hass.states.async_set("light.unchanged", "on")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "cursor": None}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    assert msg["result"] == {"resumed": False}
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert set(msg["event"]["a"]) == {
+        "light.changed",
+        "light.removed",
+        "light.unchanged",
+    }
+    init_cursor = msg["event"]["v"]
+
+    hass.states.async_set("light.changed", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.changed": {"+": {"lc": ANY, "s": "off", "c": ANY}}},
+        "v": ANY,
+    }
+    change_cursor = msg["event"]["v"]
+    assert change_cursor != init_cursor
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "cursor": init_cursor}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["success"]
+    assert msg["result"] == {"resumed": True}
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+            "light.changed": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+        },
+        "r": ["light.removed"],
+        "v": ANY,
+    }
+    assert msg["event"]["v"] not in (init_cursor, change_cursor)
+
+    # Cursors which can not be resumed get all the entities
+    await websocket_client.send_json(
+        {"id": 10, "type": "subscribe_entities", "cursor": "unknown:1"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert msg["result"] == {"resumed": False}
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert set(msg["event"]["a"]) == {
+        "light.added",
+        "light.changed",
+        "light.unchanged",
+    }
+
+
 async def test_subscribe_entities_chained_state_change(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2917,3 +3069,80 @@ async def test_subscribe_entities_chained_state_change(
 
     await websocket_client.close()
     await hass.async_block_till_done()
+
+
+async def test_subscriptions_backpressure(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the backpressure policies of subscriptions while congested."""
+
+    @callback
+    @websocket_command(
+        {vol.Required("type"): "test/set_congested", vol.Required("congested"): bool}
+    )
+    def set_congested(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"])
+        connection.async_set_congested(msg["congested"])
+
+    async_register_command(hass, set_congested)
+    hass.states.async_set("light.coalesced", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_events",
+            "event_type": "test_event",
+            "backpressure": "drop",
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 6, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert set(msg["event"]["a"]) == {"light.coalesced"}
+
+    # Keep the client congested until it is explicitly set caught up
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_DRAINED", -1):
+        await websocket_client.send_json(
+            {"id": 7, "type": "test/set_congested", "congested": True}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+        hass.bus.async_fire("test_event", {"dropped": True})
+        hass.states.async_set("light.coalesced", "on")
+        hass.states.async_set("light.coalesced", "off", {"brightness": 5})
+        hass.states.async_set("light.removed", "on")
+        hass.states.async_remove("light.removed")
+
+        await websocket_client.send_json(
+            {"id": 8, "type": "test/set_congested", "congested": False}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    # The changes held back are sent with the current states at once
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["event"] == {
+        "a": {
+            "light.coalesced": {
+                "a": {"brightness": 5},
+                "c": ANY,
+                "lc": ANY,
+                "s": "off",
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.bus.async_fire("test_event", {"dropped": False})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"]["data"] == {"dropped": False}
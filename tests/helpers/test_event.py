@@ -3183,6 +3183,57 @@ async def test_async_track_template_result_multiple_templates(
     ]
 
 
+async def test_async_track_template_result_chain_renders_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates depending on other template results render once per change."""
+    template_sum = Template(
+        "{{ states('sensor.source') | int(0) + states('sensor.double') | int(0) }}",
+        hass,
+    )
+    template_double = Template("{{ states('sensor.source') | int(0) * 2 }}", hass)
+
+    sum_runs = []
+
+    @ha.callback
+    def sum_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        sum_runs.append(updates.pop().result)
+
+    @ha.callback
+    def double_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        hass.states.async_set("sensor.double", updates.pop().result)
+
+    # The dependent template is tracked first so it is notified first
+    async_track_template_result(hass, [TrackTemplate(template_sum, None)], sum_listener)
+    async_track_template_result(
+        hass, [TrackTemplate(template_double, None)], double_listener
+    )
+
+    hass.states.async_set("sensor.source", "1")
+    await hass.async_block_till_done()
+    # The dependency is learned from the first change, the dependent
+    # template renders again once the state written by the chain changes
+    await hass.async_block_till_done()
+    assert sum_runs == [1, 3]
+
+    sum_runs.clear()
+    hass.states.async_set("sensor.source", "2")
+    await hass.async_block_till_done()
+    assert sum_runs == [6]
+
+    sum_runs.clear()
+    hass.states.async_set("sensor.source", "3")
+    hass.states.async_set("sensor.other", "on")
+    await hass.async_block_till_done()
+    assert sum_runs == [9]
+
+
 async def test_async_track_template_result_multiple_templates_mixing_domain(
     hass: HomeAssistant,
 ) -> None:
@@ -288,3 +288,55 @@ async def test_process_integration_platforms_no_integrations(
     await hass.async_block_till_done()
 
     assert len(processed) == 0
+
+
+async def test_process_integration_platforms_lazy(hass: HomeAssistant) -> None:
+    """Test lazy platforms are processed before they are imported."""
+    loaded_platform = Mock(value="loaded")
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+    event_platform = Mock(value="event")
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    # Drop the platforms from the cache as if they were never imported
+    module_cache = hass.data[loader.DATA_COMPONENTS]
+    for name in ("loaded", "event"):
+        module_cache.pop(f"{name}.platform_to_check")
+    integrations = hass.data[loader.DATA_INTEGRATIONS]
+
+    processed: list[tuple[str, Any]] = []
+
+    @callback
+    def _process_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    with (
+        patch.object(
+            integrations["loaded"], "_import_platform", return_value=loaded_platform
+        ) as mock_import_loaded,
+        patch.object(
+            integrations["event"], "_import_platform", return_value=event_platform
+        ) as mock_import_event,
+    ):
+        await async_process_integration_platforms(
+            hass, "platform_to_check", _process_platform, lazy=True
+        )
+        await hass.async_block_till_done()
+        hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+        await hass.async_block_till_done()
+
+        assert [domain for domain, _ in processed] == ["loaded", "event"]
+        for _, platform in processed:
+            assert isinstance(platform, loader.LazyPlatform)
+            assert not platform.loaded
+        assert mock_import_loaded.call_count == 0
+        assert mock_import_event.call_count == 0
+
+        assert await processed[0][1].async_load() is loaded_platform
+        assert processed[0][1].loaded
+        assert processed[0][1].value == "loaded"
+        assert mock_import_loaded.call_count == 1
+        assert mock_import_event.call_count == 0
+
+    assert "platform_to_check" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
@@ -1,13 +1,22 @@
 """Tests for the registry."""
 
+import copyreg
+import io
+import pickle
 from typing import Any
 
+import attr
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.core import CoreState, HomeAssistant
-from homeassistant.helpers import storage
-from homeassistant.helpers.registry import SAVE_DELAY, SAVE_DELAY_LONG, BaseRegistry
+from homeassistant.helpers import device_registry as dr, storage
+from homeassistant.helpers.registry import (
+    SAVE_DELAY,
+    SAVE_DELAY_LONG,
+    BaseRegistry,
+    snapshot_dispatch_table,
+)
 
 from tests.common import async_fire_time_changed
 
@@ -69,3 +78,29 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+def test_snapshot_dispatch_table() -> None:
+    """Test registry entries are restored from a snapshot with the defaults."""
+    entry = dr.DeviceEntry(
+        config_entries={"1234"},
+        identifiers={("hue", "abcd")},
+        is_new=True,
+        name="Device",
+        suggested_area="Kitchen",
+    )
+    assert entry.json_repr is not None
+
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {
+        **copyreg.dispatch_table,
+        **snapshot_dispatch_table({dr.DeviceEntry: {"is_new": False}}),
+    }
+    pickler.dump(entry)
+    restored = pickle.loads(buffer.getvalue())
+
+    # The cache is not part of the snapshot
+    assert restored._cache == {}
+    assert restored == attr.evolve(entry, is_new=False)
+    assert restored.json_repr == entry.json_repr
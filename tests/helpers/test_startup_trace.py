@@ -0,0 +1,112 @@
+"""Tests for the startup trace."""
+
+from unittest.mock import ANY
+
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import startup_trace
+from homeassistant.helpers.startup_trace import StartupTrace, StartupTraceStage
+from homeassistant.setup import SetupPhases, async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+async def test_trace_setup(hass: HomeAssistant) -> None:
+    """Test the phases of the setup are traced until the trace finishes."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("dependency"))
+    mock_integration(hass, MockModule("comp", dependencies=["dependency"]))
+    assert startup_trace.async_get_startup_trace(hass) is None
+
+    startup_trace.async_start_startup_trace(hass)
+    with startup_trace.async_trace_stage(hass, "stage 1", {"comp"}):
+        assert await async_setup_component(hass, "comp", {})
+    startup_trace.async_finish_startup_trace(hass)
+
+    trace = startup_trace.async_get_startup_trace(hass)
+    assert trace is not None
+    assert trace.waited_for == {"comp": {"dependency"}}
+    phases = {span.phase for span in trace.spans if span.domain == "comp"}
+    assert phases == {
+        SetupPhases.IMPORT,
+        SetupPhases.REQUIREMENTS,
+        SetupPhases.SETUP,
+        SetupPhases.WAIT_DEPENDENCIES,
+    }
+    assert trace.critical_path() == ["dependency", "comp"]
+
+    report = trace.as_dict()
+    assert report["duration"] > 0
+    assert [stage["name"] for stage in report["stages"]] == ["stage 1"]
+    assert report["integrations"]["comp"]["stage"] == "stage 1"
+    assert report["integrations"]["comp"]["waited_for"] == ["dependency"]
+    assert [node["domain"] for node in report["critical_path"]] == [
+        "dependency",
+        "comp",
+    ]
+
+    # Setups after the trace finished are not traced
+    spans = len(trace.spans)
+    mock_integration(hass, MockModule("late"))
+    assert await async_setup_component(hass, "late", {})
+    assert len(trace.spans) == spans
+
+
+def test_critical_path_through_stages() -> None:
+    """Test the critical path follows the stage which held up the next stage."""
+    trace = StartupTrace(start=0)
+    trace.stages = [
+        StartupTraceStage("stage 1", {"http", "slow"}, 0, 5),
+        StartupTraceStage("stage 2", {"hue"}, 5, 8),
+    ]
+    trace.async_add_span("http", SetupPhases.SETUP, None, 0, 1)
+    trace.async_add_span("slow", SetupPhases.SETUP, None, 0, 5)
+    trace.async_add_span("api", SetupPhases.SETUP, None, 2, 3)
+    trace.async_add_waited_for("api", ["http"])
+    trace.async_add_span("hue", SetupPhases.SETUP, None, 5, 6)
+    trace.async_add_span("hue", SetupPhases.CONFIG_ENTRY_SETUP, "entry_id", 6, 8)
+
+    assert trace.critical_path() == ["slow", "hue"]
+    assert trace.as_dict()["critical_path"] == [
+        {"domain": "slow", "stage": "stage 1", "start": 0, "end": 5, "duration": 5},
+        {"domain": "hue", "stage": "stage 2", "start": 5, "end": 8, "duration": 3},
+    ]
+
+    events = trace.as_chrome_trace()["traceEvents"]
+    hue_events = [
+        event
+        for event in events
+        if event["ph"] == "X" and event["name"].startswith("hue ")
+    ]
+    assert [(event["ts"], event["dur"]) for event in hue_events] == [
+        (5e6, 1e6),
+        (6e6, 2e6),
+    ]
+    assert all(event["args"]["critical_path"] for event in hue_events)
+
+
+async def test_trace_import(hass: HomeAssistant) -> None:
+    """Test imports are traced per thread while startup is traced."""
+
+    def _import(module: str) -> None:
+        with startup_trace.trace_import(hass, module):
+            pass
+
+    startup_trace.async_start_startup_trace(hass)
+    _import("not_imported_module")
+    _import("homeassistant.core")
+    await hass.async_add_executor_job(_import, "executor_module")
+    startup_trace.async_finish_startup_trace(hass)
+    _import("late_module")
+
+    trace = startup_trace.async_get_startup_trace(hass)
+    assert trace is not None
+    assert {
+        module_import.module: module_import.thread for module_import in trace.imports
+    } == {
+        "not_imported_module": "MainThread",
+        "executor_module": ANY,
+    }
+    assert trace.imports[1].thread != "MainThread"
+    assert len(trace.as_dict()["imports"]) == 2
+    events = trace.as_chrome_trace()["traceEvents"]
+    assert len({event["tid"] for event in events if event.get("cat") == "import"}) == 2
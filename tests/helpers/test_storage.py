@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -1180,3 +1181,94 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changes to the items of a journaled store are appended."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_config")
+    items = [{"id": str(idx), "name": f"Item {idx}" * 10} for idx in range(20)]
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as fdesc:
+                return fdesc.read()
+
+        async def _read_journal() -> list[bytes]:
+            return (await hass.async_add_executor_job(_read, journal_path)).splitlines()
+
+        async def _load() -> Any:
+            return await storage.Store(
+                hass, MOCK_VERSION, MOCK_KEY, journal=True
+            ).async_load()
+
+        # The first write writes the whole data
+        await store.async_save({"items": items})
+        document = await hass.async_add_executor_job(_read, store.path)
+        assert len(await _read_journal()) == 1
+
+        # Later writes only append the changed and removed items
+        changed_items = [{"id": "0", "name": "Changed"}, *items[2:]]
+        await store.async_save({"items": changed_items})
+        assert await hass.async_add_executor_job(_read, store.path) == document
+        journal = await _read_journal()
+        assert len(journal) == 3
+        assert await _load() == {"items": changed_items}
+
+        # An incomplete change at the end of the journal is ignored
+        await hass.async_add_executor_job(
+            Path(journal_path).write_bytes, b"\n".join([*journal, b'{"s":"items"'])
+        )
+        assert await _load() == {"items": changed_items}
+
+        # Other changes than to the items write the whole data
+        await store.async_save({"items": changed_items, "other": 1})
+        assert await hass.async_add_executor_job(_read, store.path) != document
+        assert len(await _read_journal()) == 1
+        assert await _load() == {"items": changed_items, "other": 1}
+
+        # The journal is compacted on the final write
+        await store.async_save({"items": items, "other": 1})
+        document = await hass.async_add_executor_job(_read, store.path)
+        assert len(await _read_journal()) == 3
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert await hass.async_add_executor_job(_read, store.path) != document
+        assert len(await _read_journal()) == 1
+        assert await _load() == {"items": items, "other": 1}
+        await hass.async_stop(force=True)
+
+
+async def test_snapshot(tmpdir: py.path.local) -> None:
+    """Test a snapshot is written on the final write and loaded until stale."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_config")
+    snapshot = {"items": [1, 2, 3]}
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load_snapshot() is None
+
+        await store.async_save(MOCK_DATA)
+        store.async_set_snapshot_func(lambda: snapshot, {})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert await hass.async_add_executor_job(
+            os.path.exists, f"{store.path}{storage.SNAPSHOT_SUFFIX}"
+        )
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load_snapshot() == snapshot
+
+        # A snapshot of another version of the data is not loaded
+        other_store = storage.Store(hass, MOCK_VERSION + 1, MOCK_KEY)
+        assert await other_store.async_load_snapshot() is None
+
+        # The snapshot is stale once the data is saved again
+        await store.async_save(MOCK_DATA2)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load_snapshot() is None
+        await hass.async_stop(force=True)
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -320,6 +321,125 @@ async def test_import(hass: HomeAssistant) -> None:
         ).async_render()
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test compiled templates are persisted and reused after a restart."""
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 2 }}", hass).async_render() == 3
+
+    freezer.tick(timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["templates"]) == 1
+
+    # Simulate a restart with a fresh environment
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch("jinja2.environment.Environment.compile") as mock_compile:
+        assert template.Template("{{ 1 + 2 }}", hass).async_render() == 3
+    mock_compile.assert_not_called()
+
+
+async def test_bytecode_cache_version_changed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the bytecode cache is dropped when the version changes."""
+    await template.async_load_bytecode_cache(hass)
+    template.Template("{{ 1 + 2 }}", hass).async_render()
+    await hass.async_block_till_done()
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY] = {
+        "version": template.BYTECODE_CACHE_STORAGE_VERSION,
+        "key": template.BYTECODE_CACHE_STORAGE_KEY,
+        "data": {
+            "version": "old",
+            "templates": bytecode_cache._data_to_save()["templates"],
+        },
+    }
+
+    await template.async_load_bytecode_cache(hass)
+    assert hass.data[template._BYTECODE_CACHE].get("{{ 1 + 2 }}") is None
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.temperature') | float * 2 }}",
+        "{{ states('sensor.temperature') | float(0) / 3 - 1 }}",
+        "{{ states.sensor.temperature.state | int + 1 }}",
+        "{{ is_state('light.kitchen', 'on') and is_state('light.hall', 'on') }}",
+        "{{ is_state('light.kitchen', 'on') or not has_value('light.hall') }}",
+        "{{ state_attr('sensor.temperature', 'unit') }}",
+        "{{ is_state_attr('sensor.temperature', 'unit', 'C') }}",
+        "{{ states.sensor.temperature.attributes['unit'] }}",
+        "{{ 1 < states('sensor.temperature') | float < 30 }}",
+        "{{ states('light.kitchen') in ['on', 'off'] }}",
+        "{{ 'hot' if states('sensor.temperature') | float > 20 else 'cold' }}",
+        "Temperature: {{ states('sensor.temperature') | round(1) }} C",
+        "{{ states.sensor.missing.state }}",
+    ],
+)
+async def test_fast_render(hass: HomeAssistant, template_str: str) -> None:
+    """Test simple templates render the same without jinja."""
+    hass.states.async_set("sensor.temperature", "21.56", {"unit": "C"})
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hall", "off")
+
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info()
+    assert tmp._fast_render is not None
+
+    expected_tmp = template.Template(template_str, hass)
+    expected_tmp.ensure_valid()
+    expected_tmp._ensure_compiled()
+    expected_tmp._fast_render = None
+    expected_info = expected_tmp.async_render_to_info()
+
+    assert info.result() == expected_info.result()
+    assert info.entities == expected_info.entities
+    assert info.domains == expected_info.domains
+    assert info.all_states == expected_info.all_states
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{% if is_state('light.kitchen', 'on') %}on{% endif %}",
+        "{{ states('sensor.temperature') | float | log }}",
+        "{{ expand('group.all') }}",
+        "{{ 2 ** 8 }}",
+        "{{ value }}",
+        "{{ states('sensor.temperature') ~ ' C' }}",
+    ],
+)
+async def test_fast_render_not_used(hass: HomeAssistant, template_str: str) -> None:
+    """Test templates outside the simple subset are rendered by jinja."""
+    hass.states.async_set("sensor.temperature", "21.5")
+    tmp = template.Template(template_str, hass)
+    tmp.async_render()
+    assert tmp._fast_render is None
+
+
+async def test_fast_render_shadowed_by_variables(hass: HomeAssistant) -> None:
+    """Test variables shadowing globals are respected."""
+    hass.states.async_set("light.kitchen", "on")
+    tmp = template.Template("{{ is_state('light.kitchen', 'on') }}", hass)
+    assert tmp.async_render() is True
+    assert tmp._fast_render is not None
+
+    assert tmp.async_render({"is_state": lambda entity_id, state: False}) is False
+
+
+async def test_fast_render_error(hass: HomeAssistant) -> None:
+    """Test errors are raised as template errors."""
+    tmp = template.Template("{{ states('sensor.missing') | float * 2 }}", hass)
+    with pytest.raises(TemplateError):
+        tmp.async_render()
+    assert tmp._fast_render is not None
+
+
 async def test_import_change(hass: HomeAssistant) -> None:
     """Test that a change in HassLoader results in updated imports."""
     await template.async_load_custom_templates(hass)
@@ -1165,6 +1165,103 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events by the value of an event data key."""
+    calls_a = []
+    calls_b = []
+
+    @ha.callback
+    def listener_a(event):
+        """Mock listener."""
+        calls_a.append(event)
+
+    @ha.callback
+    def listener_b(event):
+        """Mock listener."""
+        calls_b.append(event)
+
+    unsub_a = hass.bus.async_listen_keyed("test", "device_id", "a", listener_a)
+    unsub_b = hass.bus.async_listen_keyed("test", "device_id", "b", listener_b)
+    # Both keyed listeners share one bus listener
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"device_id": "a"})
+    hass.bus.async_fire("test", {"device_id": "c"})
+    hass.bus.async_fire("test", {"other": "a"})
+    hass.bus.async_fire("test", {"device_id": ["a"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls_a) == 1
+    assert calls_a[0].data == {"device_id": "a"}
+    assert len(calls_b) == 0
+
+    hass.bus.async_fire("test", {"device_id": "b"})
+    await hass.async_block_till_done()
+    assert len(calls_a) == 1
+    assert len(calls_b) == 1
+
+    unsub_a()
+    hass.bus.async_fire("test", {"device_id": "a"})
+    await hass.async_block_till_done()
+    assert len(calls_a) == 1
+    assert hass.bus.async_listeners()["test"] == 1
+
+    unsub_b()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_with_filter(hass: HomeAssistant) -> None:
+    """Test keyed listeners run the event filter after the key matched."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data["type"] == "press"
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "device_id", "a", listener, event_filter=mock_filter
+    )
+
+    hass.bus.async_fire("test", {"device_id": "a", "type": "release"})
+    hass.bus.async_fire("test", {"device_id": "b", "type": "press"})
+    hass.bus.async_fire("test", {"device_id": "a", "type": "press"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"device_id": "a", "type": "press"}
+
+    unsub()
+
+
+async def test_eventbus_keyed_listener_invalid(hass: HomeAssistant) -> None:
+    """Test keyed listeners reject invalid arguments."""
+
+    def listener(event):
+        """Mock listener."""
+
+    def not_a_callback(event_data):
+        """Mock filter."""
+        return True
+
+    with pytest.raises(HomeAssistantError, match="listen to all events"):
+        hass.bus.async_listen_keyed(MATCH_ALL, "device_id", "a", listener)
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed(
+            "test", "device_id", "a", listener, event_filter=not_a_callback
+        )
+
+    with pytest.raises(HomeAssistantError, match="is not hashable"):
+        hass.bus.async_listen_keyed("test", "device_id", ["a"], listener)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1657,68 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one pass."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "off")
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    state_reported_events = []
+    context = ha.Context()
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        state_reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, listener, event_filter=ha.callback(lambda _: True)
+    )
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 50}),
+            ("light.kitchen", "off", None),
+            ("sensor.new", 5, {"unit_of_measurement": "W"}),
+        ],
+        context=context,
+        timestamp=1700000000.0,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in state_changed_events] == [
+        "light.bowl",
+        "sensor.new",
+    ]
+    assert [event.data["entity_id"] for event in state_reported_events] == [
+        "light.kitchen"
+    ]
+
+    bowl = hass.states.get("light.bowl")
+    assert bowl.attributes == {"brightness": 50}
+    assert bowl.context is context
+    new = hass.states.get("sensor.new")
+    assert new.state == "5"
+    assert new.context is context
+    assert new.last_updated == bowl.last_updated
+    assert new.last_updated_timestamp == 1700000000.0
+    assert hass.states.get("light.kitchen").last_reported == new.last_updated
+
+
+async def test_statemachine_set_many_shares_context(hass: HomeAssistant) -> None:
+    """Test a context is created and shared when none is passed."""
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.kitchen", "off", None)],
+    )
+    bowl = hass.states.get("light.bowl")
+    kitchen = hass.states.get("light.kitchen")
+    assert bowl.context is kitchen.context
+    assert bowl.last_updated == kitchen.last_updated
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set_many([("light.bowl", "on", None)], force_update=True)
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
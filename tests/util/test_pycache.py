@@ -0,0 +1,36 @@
+"""Test Home Assistant pycache utility functions."""
+
+import importlib.util
+from pathlib import Path
+
+from homeassistant.util import pycache
+
+
+def test_warm_pycache(tmp_path: Path) -> None:
+    """Test the bytecode is compiled for the files which compile."""
+    package = tmp_path / "package"
+    package.mkdir()
+    good = package / "good.py"
+    good.write_text("VALUE = 1\n")
+    bad = package / "bad.py"
+    bad.write_text("def broken(:\n")
+    single = tmp_path / "single.py"
+    single.write_text("VALUE = 2\n")
+    (tmp_path / "data.txt").write_text("not python")
+
+    assert pycache.warm_pycache([str(package), str(single)], max_workers=1) == 3
+    assert Path(importlib.util.cache_from_source(str(good))).exists()
+    assert Path(importlib.util.cache_from_source(str(single))).exists()
+    assert not Path(importlib.util.cache_from_source(str(bad))).exists()
+
+
+def test_warm_pycache_no_files(tmp_path: Path) -> None:
+    """Test no worker processes are needed without source files."""
+    assert pycache.warm_pycache([str(tmp_path), str(tmp_path / "data.txt")]) == 0
+
+
+def test_requirement_paths() -> None:
+    """Test the source files of installed requirements are returned."""
+    paths = pycache.requirement_paths(["packaging>=20", "not-installed==1.0", "!"])
+    assert any(path.endswith("packaging/__init__.py") for path in paths)
+    assert all(path.endswith(".py") for path in paths)
@@ -975,6 +975,42 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "from_unit", "expected", "to_unit"),
+    [
+        (converter, value, from_unit, expected, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, expected, to_unit in item
+    ],
+)
+def test_convert_many(
+    converter: type[BaseUnitConverter],
+    value: float,
+    from_unit: str,
+    expected: float,
+    to_unit: str,
+) -> None:
+    """Test converting many values matches converting them one by one."""
+    converted = converter.convert_many([value, None, value], from_unit, to_unit)
+    assert converted == [pytest.approx(expected), None, pytest.approx(expected)]
+    assert converted[0] == converter.converter_factory(from_unit, to_unit)(value)
+
+
+@pytest.mark.parametrize(
+    ("converter", "valid_unit"),
+    [
+        (converter, valid_unit)
+        for converter, valid_units in _ALL_CONVERTERS.items()
+        for valid_unit in valid_units
+    ],
+)
+def test_convert_many_same_unit(
+    converter: type[BaseUnitConverter], valid_unit: str
+) -> None:
+    """Test converting many values to the same unit."""
+    assert converter.convert_many([1.5, None], valid_unit, valid_unit) == [1.5, None]
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [